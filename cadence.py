@@ -0,0 +1,171 @@
+"""
+Module de la cadence de la boucle d'affichage
+Sépare le rythme de la physique de celui de l'affichage: le temps réel écoulé
+est accumulé puis converti en ticks simulés de durée fixe (plusieurs par image
+si besoin), et les images sont affichées à leur propre fréquence, en sautant
+des images quand l'affichage prend du retard
+"""
+
+import math
+import time
+
+
+# Fréquence d'affichage par défaut (images par seconde)
+FPS_DEFAUT = 20
+
+# Nombre maximal de ticks simulés par image: au-delà, le temps en trop est
+# abandonné (la simulation ralentit au lieu de s'emballer)
+MAX_SOUS_PAS = 10
+
+# Nombre maximal d'images sautées d'affilée quand l'affichage est en retard
+MAX_IMAGES_SAUTEES = 4
+
+
+class CadenceBoucle:
+    """Accumulateur de temps réel pour une physique à pas fixe"""
+    
+    def __init__(self, pas, fps=FPS_DEFAUT, max_sous_pas=MAX_SOUS_PAS,
+                 max_images_sautees=MAX_IMAGES_SAUTEES, vitesse=1.0,
+                 horloge_reelle=time.perf_counter):
+        """
+        Initialise la cadence
+        
+        Args:
+            pas (float): Durée d'un tick en secondes simulées (HorlogeSimulation.pas)
+            fps (float): Images affichées par seconde
+            max_sous_pas (int): Nombre maximal de ticks calculés par appel
+            max_images_sautees (int): Images sautées d'affilée au plus
+            vitesse (float): Secondes simulées par seconde réelle
+            horloge_reelle (callable): Source du temps réel en secondes
+        """
+        if pas <= 0 or fps <= 0:
+            raise ValueError("Le pas et la fréquence d'affichage doivent être positifs")
+        self.pas = pas
+        self.intervalle_image = 1.0 / fps
+        self.max_sous_pas = max_sous_pas
+        self.max_images_sautees = max_images_sautees
+        self.vitesse = vitesse
+        self.horloge_reelle = horloge_reelle
+        
+        self.accumulateur = 0.0
+        self.dernier_appel = None
+        self.prochaine_image = 0.0
+        self.en_retard = False
+        self.duree_dernier_rendu = 0.0
+        self.images_a_sauter = 0
+        self.sautees_d_affilee = 0
+        
+        # Statistiques
+        self.images_affichees = 0
+        self.images_sautees = 0
+        self.temps_abandonne = 0.0
+    
+    def sous_pas(self, maintenant=None):
+        """
+        Ajoute le temps réel écoulé et retourne le nombre de ticks à simuler
+        
+        Args:
+            maintenant (float, optional): Temps réel (horloge_reelle() par défaut)
+        
+        Returns:
+            int: Nombre de ticks à exécuter avant la prochaine image
+        """
+        if maintenant is None:
+            maintenant = self.horloge_reelle()
+        if self.dernier_appel is None:
+            self.dernier_appel = maintenant
+            self.prochaine_image = maintenant
+            return 0
+        
+        self.accumulateur += (maintenant - self.dernier_appel) * self.vitesse
+        self.dernier_appel = maintenant
+        
+        nombre = int(round(self.accumulateur / self.pas, 9))
+        self.accumulateur -= nombre * self.pas
+        
+        # Trop de retard: calculer au plus max_sous_pas ticks et abandonner le reste
+        self.en_retard = nombre > self.max_sous_pas
+        if self.en_retard:
+            self.temps_abandonne += (nombre - self.max_sous_pas) * self.pas
+            nombre = self.max_sous_pas
+        return nombre
+    
+    def doit_afficher(self, maintenant=None):
+        """
+        Indique si une image doit être affichée maintenant
+        
+        Args:
+            maintenant (float, optional): Temps réel (horloge_reelle() par défaut)
+        
+        Returns:
+            bool: False avant l'heure de la prochaine image, ou si l'image est
+                sautée parce que la physique ou le rendu précédent sont en retard
+        """
+        if maintenant is None:
+            maintenant = self.horloge_reelle()
+        if maintenant < self.prochaine_image:
+            return False
+        
+        physique_en_retard = self.en_retard and self.sautees_d_affilee < self.max_images_sautees
+        if self.images_a_sauter > 0 or physique_en_retard:
+            if self.images_a_sauter > 0:
+                self.images_a_sauter -= 1
+            self.sautees_d_affilee += 1
+            self.images_sautees += 1
+            self.prochaine_image = maintenant + self.intervalle_image
+            return False
+        return True
+    
+    def image_affichee(self, duree, maintenant=None):
+        """
+        Enregistre une image affichée et planifie la suivante
+        
+        Args:
+            duree (float): Durée réelle du rendu en secondes
+            maintenant (float, optional): Temps réel (horloge_reelle() par défaut)
+        """
+        if maintenant is None:
+            maintenant = self.horloge_reelle()
+        self.duree_dernier_rendu = duree
+        self.sautees_d_affilee = 0
+        # Rendu hors budget: sauter les images dont il a consommé le temps
+        depassement = math.ceil(round(duree / self.intervalle_image, 9)) - 1
+        self.images_a_sauter = min(self.max_images_sautees, max(0, depassement))
+        self.images_affichees += 1
+        # Rester calé sur la grille des images sans accumuler de retard
+        self.prochaine_image = max(self.prochaine_image + self.intervalle_image, maintenant)
+    
+    def get_intervalle_ms(self):
+        """
+        Délai entre deux appels de la boucle
+        
+        Returns:
+            int: Intervalle en millisecondes (une image)
+        """
+        return max(1, int(round(self.intervalle_image * 1000)))
+    
+    def reinitialiser(self):
+        """Oublie le temps accumulé (après une pause de la boucle)"""
+        self.accumulateur = 0.0
+        self.dernier_appel = None
+        self.en_retard = False
+        self.images_a_sauter = 0
+        self.sautees_d_affilee = 0
+    
+    def get_statistiques(self):
+        """
+        Retourne les compteurs de la boucle
+        
+        Returns:
+            dict: Images affichées et sautées, temps simulé abandonné
+        """
+        return {
+            'images_affichees': self.images_affichees,
+            'images_sautees': self.images_sautees,
+            'temps_abandonne': self.temps_abandonne,
+        }
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return (f"CadenceBoucle(pas={self.pas}, fps={1.0 / self.intervalle_image:.0f}, "
+                f"affichées={self.images_affichees}, sautées={self.images_sautees})")
@@ -4,26 +4,156 @@ Journalisation de tous les événements de la simulation
 """
 
 import sqlite3
+import time
 from datetime import datetime
 
 
+# Format de la colonne texte "timestamp"
+FORMAT_TIMESTAMP = "%Y-%m-%d %H:%M:%S"
+
+# Nombre de lignes converties par transaction lors d'une migration
+TAILLE_BLOC_MIGRATION = 5000
+
+# Colonnes d'un événement, dans l'ordre des tuples retournés
+COLONNES_EVENEMENT = ('id, timestamp, type_action, action, etat_feu, scenario, '
+                      'id_voiture, position_x, position_y, vitesse, ts, tick')
+
+
+def _texte_vers_ts(timestamp):
+    """
+    Convertit un timestamp texte (heure locale) en microsecondes epoch
+    
+    Args:
+        timestamp (str): Timestamp au format FORMAT_TIMESTAMP
+        
+    Returns:
+        int: Microsecondes depuis l'epoch, ou None si le texte est invalide
+    """
+    try:
+        return int(datetime.strptime(timestamp, FORMAT_TIMESTAMP).timestamp() * 1_000_000)
+    except (TypeError, ValueError):
+        return None
+
+
+def _vers_ts(valeur, fin=False):
+    """
+    Normalise une borne temporelle en microsecondes epoch
+    
+    Args:
+        valeur (int|float|str|datetime): Microsecondes (int), secondes epoch
+            (float), timestamp texte ou datetime
+        fin (bool): True pour une borne de fin (la seconde texte est incluse)
+        
+    Returns:
+        int: Microsecondes depuis l'epoch
+    """
+    if isinstance(valeur, datetime):
+        return int(valeur.timestamp() * 1_000_000)
+    if isinstance(valeur, str):
+        ts = _texte_vers_ts(valeur)
+        if ts is None:
+            raise ValueError(f"Timestamp invalide: {valeur}")
+        # Le texte n'a qu'une précision à la seconde
+        return ts + 999_999 if fin else ts
+    if isinstance(valeur, float):
+        return int(valeur * 1_000_000)
+    return int(valeur)
+
+
 class Database:
     """Gestion de la base de données SQLite pour la journalisation"""
     
-    def __init__(self, db_name="traffic_simulation.db"):
+    def __init__(self, db_name="traffic_simulation.db", taille_lot=200, intervalle_flush=1.0,
+                 compact=False, initialiser=True):
         """
         Initialise la connexion à la base de données
         
         Args:
             db_name (str): Nom du fichier de base de données
+            taille_lot (int): Nombre d'événements en attente déclenchant un flush
+            intervalle_flush (float): Délai maximal (secondes) avant un flush
+            compact (bool): True pour stocker les textes répétés (type, action,
+                état du feu, scénario) sous forme d'identifiants entiers
+            initialiser (bool): False pour seulement se connecter à une base déjà
+                initialisée (pas de migrations ni de messages)
         """
         self.db_name = db_name
-        self.init_database()
+        self.taille_lot = taille_lot
+        self.intervalle_flush = intervalle_flush
+        self.compact = compact
+        
+        # Table (ou vue) lue par les requêtes et colonne du type d'action
+        self.source = 'evenements_compacts_vue' if compact else 'evenements'
+        self.colonne_type = 'type_id' if compact else 'type_action'
+        
+        # Cache valeur -> id du dictionnaire (mode compact)
+        self.dictionnaire = {}
+        
+        # Événements en attente d'écriture (un seul commit par lot)
+        self.tampon = []
+        self.dernier_flush = time.monotonic()
+        
+        # Connexion persistante (ouverte une seule fois)
+        self.conn = self._ouvrir_connexion()
+        if initialiser:
+            self.init_database()
+        else:
+            self._charger_dictionnaire()
     
-    def init_database(self):
-        """Initialise la base de données avec la table des événements"""
+    def _ouvrir_connexion(self):
+        """
+        Ouvre la connexion SQLite en mode WAL
+        
+        Returns:
+            sqlite3.Connection: Connexion configurée
+        """
         conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        # WAL: les écritures ne bloquent pas les lectures et le fsync
+        # n'a lieu qu'aux checkpoints
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    def init_database(self):
+        """Initialise la base de données et applique les migrations de schéma"""
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        
+        migrations = [
+            (1, self._migration_v1),
+            (2, self._migration_v2),
+            (3, self._migration_v3),
+            (4, self._migration_v4),
+            (5, self._migration_v5),
+        ]
+        
+        for numero, migration in migrations:
+            if version < numero:
+                migration()
+                # La version n'est enregistrée qu'une fois la migration terminée
+                self.conn.execute(f'PRAGMA user_version = {numero}')
+                self.conn.commit()
+                print(f"🔧 Schéma v{numero} appliqué")
+        
+        self._charger_dictionnaire()
+        
+        # Lignes écrites dans l'autre mode: jamais converties à l'ouverture (un
+        # autre processus peut encore y écrire), seulement signalées
+        autre = 'evenements' if self.compact else 'evenements_compacts'
+        if self.conn.execute(f'SELECT 1 FROM {autre} LIMIT 1').fetchone() is not None:
+            print(f"⚠️ Événements au format {'texte' if self.compact else 'compact'} "
+                  f"non lus en mode {'compact' if self.compact else 'texte'} "
+                  "(voir Database.convert_format)")
+        
+        print(f"✅ Base de données '{self.db_name}' initialisée")
+    
+    def _charger_dictionnaire(self):
+        """Charge le cache du dictionnaire (mode compact)"""
+        if self.compact:
+            self.dictionnaire = dict(self.conn.execute('SELECT valeur, id FROM dictionnaire'))
+    
+    def _migration_v1(self):
+        """Schéma v1: table des événements avec horodatage texte"""
+        cursor = self.conn.cursor()
         
         # Création de la table selon le schéma du projet
         cursor.execute('''
@@ -41,12 +171,196 @@ class Database:
             )
         ''')
         
-        conn.commit()
-        conn.close()
-        print(f"✅ Base de données '{self.db_name}' initialisée")
+        self.conn.commit()
+    
+    def _migration_v2(self, taille_bloc=TAILLE_BLOC_MIGRATION):
+        """
+        Schéma v2: horodatage entier en microsecondes, tick de simulation et index
+        
+        Les lignes existantes sont converties par blocs (une transaction par bloc),
+        une migration interrompue reprend donc là où elle s'était arrêtée.
+        
+        Args:
+            taille_bloc (int): Nombre de lignes converties par transaction
+        """
+        colonnes = {ligne[1] for ligne in self.conn.execute('PRAGMA table_info(evenements)')}
+        with self.conn:
+            if 'ts' not in colonnes:
+                self.conn.execute('ALTER TABLE evenements ADD COLUMN ts INTEGER')
+            if 'tick' not in colonnes:
+                self.conn.execute('ALTER TABLE evenements ADD COLUMN tick INTEGER')
+        
+        # Conversion des timestamps texte (heure locale) en microsecondes epoch
+        dernier_id = 0
+        while True:
+            lignes = self.conn.execute(
+                'SELECT id, timestamp FROM evenements '
+                'WHERE id > ? AND ts IS NULL ORDER BY id LIMIT ?',
+                (dernier_id, taille_bloc)
+            ).fetchall()
+            if not lignes:
+                break
+            
+            with self.conn:
+                self.conn.executemany(
+                    'UPDATE evenements SET ts = ? WHERE id = ?',
+                    [(_texte_vers_ts(timestamp), id_event) for id_event, timestamp in lignes]
+                )
+            dernier_id = lignes[-1][0]
+        
+        with self.conn:
+            # Les index v1 sont remplacés par les index composites sur ts
+            self.conn.execute('DROP INDEX IF EXISTS idx_evenements_type')
+            self.conn.execute('DROP INDEX IF EXISTS idx_evenements_timestamp')
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evenements_ts ON evenements (ts)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evenements_type_ts '
+                'ON evenements (type_action, ts)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evenements_voiture_ts '
+                'ON evenements (id_voiture, ts)'
+            )
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_evenements_scenario_ts '
+                'ON evenements (scenario, ts)'
+            )
+    
+    def _migration_v3(self):
+        """Schéma v3: stockage compact (textes répétés remplacés par des ids)"""
+        with self.conn:
+            # Vocabulaire partagé: types, actions, états du feu, scénarios
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS dictionnaire (
+                    id INTEGER PRIMARY KEY,
+                    valeur TEXT NOT NULL UNIQUE
+                )
+            ''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS evenements_compacts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts INTEGER NOT NULL,
+                    tick INTEGER,
+                    type_id INTEGER NOT NULL REFERENCES dictionnaire (id),
+                    action_id INTEGER NOT NULL REFERENCES dictionnaire (id),
+                    etat_feu_id INTEGER REFERENCES dictionnaire (id),
+                    scenario_id INTEGER REFERENCES dictionnaire (id),
+                    id_voiture INTEGER,
+                    position_x REAL,
+                    position_y REAL,
+                    vitesse REAL
+                )
+            ''')
+            for nom, colonnes in (('ts', 'ts'),
+                                  ('type_ts', 'type_id, ts'),
+                                  ('voiture_ts', 'id_voiture, ts'),
+                                  ('scenario_ts', 'scenario_id, ts')):
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_evenements_compacts_{nom} '
+                    f'ON evenements_compacts ({colonnes})'
+                )
+            
+            # Vue reconstituant les tuples du schéma texte (mêmes colonnes)
+            self.conn.execute('''
+                CREATE VIEW IF NOT EXISTS evenements_compacts_vue AS
+                SELECT c.id AS id,
+                       strftime('%Y-%m-%d %H:%M:%S', c.ts / 1000000,
+                                'unixepoch', 'localtime') AS timestamp,
+                       t.valeur AS type_action,
+                       a.valeur AS action,
+                       e.valeur AS etat_feu,
+                       s.valeur AS scenario,
+                       c.id_voiture AS id_voiture,
+                       c.position_x AS position_x,
+                       c.position_y AS position_y,
+                       c.vitesse AS vitesse,
+                       c.ts AS ts,
+                       c.tick AS tick,
+                       c.type_id AS type_id,
+                       c.scenario_id AS scenario_id
+                FROM evenements_compacts c
+                JOIN dictionnaire t ON t.id = c.type_id
+                JOIN dictionnaire a ON a.id = c.action_id
+                LEFT JOIN dictionnaire e ON e.id = c.etat_feu_id
+                LEFT JOIN dictionnaire s ON s.id = c.scenario_id
+            ''')
+    
+    def _migration_v4(self):
+        """Schéma v4: filigranes des consommateurs du flux de changements"""
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS consommateurs (
+                    nom TEXT PRIMARY KEY,
+                    dernier_id INTEGER NOT NULL DEFAULT 0,
+                    mis_a_jour INTEGER
+                )
+            ''')
+    
+    def _migration_v5(self):
+        """
+        Schéma v5: plus aucun ts NULL dans la table texte
+        
+        Les timestamps v1 illisibles avaient migré avec ts NULL, ce qui arrêtait la
+        pagination par (ts, id). Ils prennent le ts de l'événement précédent (0 s'il
+        n'y en a pas), l'ordre chronologique suit donc toujours l'ordre des ids.
+        """
+        with self.conn:
+            self.conn.execute('''
+                UPDATE evenements SET ts = COALESCE((
+                    SELECT precedent.ts FROM evenements AS precedent
+                    WHERE precedent.id < evenements.id AND precedent.ts IS NOT NULL
+                    ORDER BY precedent.id DESC LIMIT 1
+                ), 0)
+                WHERE ts IS NULL
+            ''')
+    
+    def _interner(self, valeur):
+        """
+        Retourne l'id d'un texte du dictionnaire, en l'ajoutant si besoin
+        
+        Args:
+            valeur (str): Texte à encoder
+            
+        Returns:
+            int: Identifiant du texte (None si valeur est None)
+        """
+        if valeur is None:
+            return None
+        id_valeur = self.dictionnaire.get(valeur)
+        if id_valeur is None:
+            # OR IGNORE: une autre connexion a pu ajouter la valeur entre-temps
+            self.conn.execute('INSERT OR IGNORE INTO dictionnaire (valeur) VALUES (?)', (valeur,))
+            id_valeur = self.conn.execute(
+                'SELECT id FROM dictionnaire WHERE valeur = ?', (valeur,)
+            ).fetchone()[0]
+            self.dictionnaire[valeur] = id_valeur
+        return id_valeur
+    
+    def _id_existant(self, valeur):
+        """
+        Retourne l'id d'un texte sans l'ajouter au dictionnaire
+        
+        Args:
+            valeur (str): Texte recherché
+            
+        Returns:
+            int: Identifiant du texte, ou -1 s'il n'a jamais été enregistré
+        """
+        id_valeur = self.dictionnaire.get(valeur)
+        if id_valeur is None:
+            ligne = self.conn.execute(
+                'SELECT id FROM dictionnaire WHERE valeur = ?', (valeur,)
+            ).fetchone()
+            if ligne is None:
+                return -1
+            id_valeur = self.dictionnaire[valeur] = ligne[0]
+        return id_valeur
     
     def log_event(self, type_action, action, etat_feu=None, scenario=None, 
-                  id_voiture=None, position_x=None, position_y=None, vitesse=None):
+                  id_voiture=None, position_x=None, position_y=None, vitesse=None,
+                  ts=None, tick=None):
         """
         Enregistre un événement dans la base de données
         
@@ -59,23 +373,69 @@ class Database:
             position_x (float, optional): Position X de la voiture
             position_y (float, optional): Position Y de la voiture
             vitesse (float, optional): Vitesse de la voiture
+            ts (int, optional): Horodatage déjà capturé en microsecondes epoch
+            tick (int, optional): Numéro du tick de simulation
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        # Horodatage pris au moment de l'événement, pas du flush
+        if ts is None:
+            ts = time.time_ns() // 1000
+        timestamp = datetime.fromtimestamp(ts / 1_000_000).strftime(FORMAT_TIMESTAMP)
         
-        # Timestamp au format demandé
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.tampon.append((timestamp, type_action, action, etat_feu, scenario,
+                            id_voiture, position_x, position_y, vitesse, ts, tick))
         
-        cursor.execute('''
-            INSERT INTO evenements 
-            (timestamp, type_action, action, etat_feu, scenario, id_voiture, 
-             position_x, position_y, vitesse)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (timestamp, type_action, action, etat_feu, scenario, 
-              id_voiture, position_x, position_y, vitesse))
+        # Écriture groupée: par taille de lot ou par intervalle de temps
+        if (len(self.tampon) >= self.taille_lot
+                or time.monotonic() - self.dernier_flush >= self.intervalle_flush):
+            self.flush()
+    
+    def flush(self):
+        """
+        Écrit tous les événements en attente dans une seule transaction
         
-        conn.commit()
-        conn.close()
+        Returns:
+            int: Nombre d'événements écrits
+        """
+        self.dernier_flush = time.monotonic()
+        if not self.tampon or self.conn is None:
+            return 0
+        
+        lot = self.tampon
+        self.tampon = []
+        
+        with self.conn:
+            if self.compact:
+                # Encodage dans la même transaction que l'insertion
+                lignes = [
+                    (ts, tick, self._interner(type_action), self._interner(action),
+                     self._interner(etat_feu), self._interner(scenario),
+                     id_voiture, position_x, position_y, vitesse)
+                    for (_, type_action, action, etat_feu, scenario, id_voiture,
+                         position_x, position_y, vitesse, ts, tick) in lot
+                ]
+                self.conn.executemany('''
+                    INSERT INTO evenements_compacts
+                    (ts, tick, type_id, action_id, etat_feu_id, scenario_id,
+                     id_voiture, position_x, position_y, vitesse)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', lignes)
+            else:
+                self.conn.executemany('''
+                    INSERT INTO evenements 
+                    (timestamp, type_action, action, etat_feu, scenario, id_voiture, 
+                     position_x, position_y, vitesse, ts, tick)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', lot)
+        
+        return len(lot)
+    
+    def close(self):
+        """Écrit les événements en attente puis ferme la connexion"""
+        if self.conn is None:
+            return
+        self.flush()
+        self.conn.close()
+        self.conn = None
     
     def get_all_events(self):
         """
@@ -84,13 +444,14 @@ class Database:
         Returns:
             list: Liste de tuples contenant tous les événements
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        self.flush()
+        cursor = self.conn.cursor()
         
-        cursor.execute('SELECT * FROM evenements ORDER BY timestamp DESC')
+        cursor.execute(
+            f'SELECT {COLONNES_EVENEMENT} FROM {self.source} ORDER BY ts DESC, id DESC'
+        )
         events = cursor.fetchall()
         
-        conn.close()
         return events
     
     def get_events_by_type(self, type_action):
@@ -103,27 +464,386 @@ class Database:
         Returns:
             list: Liste des événements du type spécifié
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        self.flush()
+        cursor = self.conn.cursor()
         
+        clause, params = self._filtre_periode(type_action=type_action)
         cursor.execute(
-            'SELECT * FROM evenements WHERE type_action = ? ORDER BY timestamp DESC',
-            (type_action,)
+            f'SELECT {COLONNES_EVENEMENT} FROM {self.source} {clause} '
+            'ORDER BY ts DESC, id DESC',
+            params
         )
         events = cursor.fetchall()
         
-        conn.close()
         return events
     
+    def _filtre_periode(self, debut=None, fin=None, type_action=None,
+                        id_voiture=None, scenario=None):
+        """
+        Construit la clause WHERE commune aux requêtes filtrées
+        
+        Args:
+            debut (int|str|datetime, optional): Borne de début incluse
+                (microsecondes epoch, timestamp texte ou datetime)
+            fin (int|str|datetime, optional): Borne de fin incluse
+            type_action (str, optional): Type d'action à filtrer
+            id_voiture (int, optional): Identifiant de voiture à filtrer
+            scenario (str, optional): Scénario à filtrer
+            
+        Returns:
+            tuple: (clause_where, paramètres)
+        """
+        conditions = []
+        params = []
+        if self.compact:
+            # Filtrer sur les ids pour profiter des index de la table compacte
+            filtres = (
+                ('type_id', None if type_action is None else self._id_existant(type_action)),
+                ('id_voiture', id_voiture),
+                ('scenario_id', None if scenario is None else self._id_existant(scenario)),
+            )
+        else:
+            filtres = (('type_action', type_action),
+                       ('id_voiture', id_voiture),
+                       ('scenario', scenario))
+        for colonne, valeur in filtres:
+            if valeur is not None:
+                conditions.append(f'{colonne} = ?')
+                params.append(valeur)
+        if debut is not None:
+            conditions.append('ts >= ?')
+            params.append(_vers_ts(debut))
+        if fin is not None:
+            conditions.append('ts <= ?')
+            params.append(_vers_ts(fin, fin=True))
+        
+        clause = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        return clause, params
+    
+    def count_by_type(self, debut=None, fin=None):
+        """
+        Compte les événements par type directement dans SQLite
+        
+        Args:
+            debut (int|str|datetime, optional): Borne de début incluse
+            fin (int|str|datetime, optional): Borne de fin incluse
+            
+        Returns:
+            dict: {type_action: nombre d'événements}
+        """
+        self.flush()
+        clause, params = self._filtre_periode(debut, fin)
+        
+        cursor = self.conn.execute(
+            f'SELECT type_action, COUNT(*) FROM {self.source} {clause} '
+            f'GROUP BY {self.colonne_type}',
+            params
+        )
+        return dict(cursor.fetchall())
+    
+    def get_recent_events(self, limite=10, offset=0, type_action=None):
+        """
+        Récupère une page des événements les plus récents
+        
+        Args:
+            limite (int): Nombre maximal d'événements
+            offset (int): Nombre d'événements récents à sauter
+            type_action (str, optional): Type d'action à filtrer
+            
+        Returns:
+            list: Liste de tuples, du plus récent au plus ancien
+        """
+        self.flush()
+        clause, params = self._filtre_periode(type_action=type_action)
+        
+        cursor = self.conn.execute(
+            f'SELECT {COLONNES_EVENEMENT} FROM {self.source} {clause} '
+            'ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?',
+            params + [limite, offset]
+        )
+        return cursor.fetchall()
+    
+    def get_events_between(self, debut=None, fin=None, type_action=None, limite=None,
+                           id_voiture=None, scenario=None):
+        """
+        Récupère les événements d'une période donnée
+        
+        Args:
+            debut (int|str|datetime, optional): Borne de début incluse
+            fin (int|str|datetime, optional): Borne de fin incluse
+            type_action (str, optional): Type d'action à filtrer
+            limite (int, optional): Nombre maximal d'événements
+            id_voiture (int, optional): Identifiant de voiture à filtrer
+            scenario (str, optional): Scénario à filtrer
+            
+        Returns:
+            list: Liste de tuples triés par ordre chronologique
+        """
+        self.flush()
+        clause, params = self._filtre_periode(debut, fin, type_action, id_voiture, scenario)
+        
+        requete = f'SELECT {COLONNES_EVENEMENT} FROM {self.source} {clause} ORDER BY ts, id'
+        if limite is not None:
+            requete += ' LIMIT ?'
+            params.append(limite)
+        
+        return self.conn.execute(requete, params).fetchall()
+    
+    def iter_event_chunks(self, taille_bloc=1000, debut=None, fin=None, type_action=None,
+                          id_voiture=None, scenario=None, apres_id=0):
+        """
+        Parcourt les événements par blocs, sans tout charger en mémoire
+        
+        Pagination par clé sur (ts, id), dans l'ordre des index composites
+        (type, ts), (voiture, ts), (scénario, ts) et (ts): chaque bloc reprend
+        l'index là où le précédent s'est arrêté, sans tri ni relecture, quels que
+        soient les filtres et le nombre de lignes déjà lues.
+        
+        Args:
+            taille_bloc (int): Nombre de lignes par bloc (fetchmany)
+            debut (int|str|datetime, optional): Borne de début incluse
+            fin (int|str|datetime, optional): Borne de fin incluse
+            type_action (str, optional): Type d'action à filtrer
+            id_voiture (int, optional): Identifiant de voiture à filtrer
+            scenario (str, optional): Scénario à filtrer
+            apres_id (int): Ne lire que les événements d'id strictement supérieur
+            
+        Yields:
+            list: Blocs de tuples, par ordre chronologique (ts, id)
+        """
+        self.flush()
+        clause, params = self._filtre_periode(debut, fin, type_action, id_voiture, scenario)
+        if apres_id:
+            clause = f'{clause} AND id > ?' if clause else 'WHERE id > ?'
+            params.append(apres_id)
+        
+        selection = f'SELECT {COLONNES_EVENEMENT} FROM {self.source} {clause}'
+        premiere = f'{selection} ORDER BY ts, id LIMIT ?'
+        suivante = (f"{selection} {'AND' if clause else 'WHERE'} (ts, id) > (?, ?) "
+                    'ORDER BY ts, id LIMIT ?')
+        
+        cursor = self.conn.execute(premiere, params + [taille_bloc])
+        while True:
+            bloc = cursor.fetchmany(taille_bloc)
+            if not bloc:
+                return
+            yield bloc
+            if len(bloc) < taille_bloc:
+                return
+            # Clé du dernier tuple lu: colonnes ts et id de COLONNES_EVENEMENT
+            id_dernier, ts_dernier = bloc[-1][0], bloc[-1][10]
+            cursor = self.conn.execute(suivante, params + [ts_dernier, id_dernier, taille_bloc])
+    
+    def iter_events(self, taille_bloc=1000, **filtres):
+        """
+        Itère sur les événements un par un (voir iter_event_chunks)
+        
+        Args:
+            taille_bloc (int): Nombre de lignes lues par requête
+            **filtres: debut, fin, type_action, id_voiture, scenario, apres_id
+            
+        Yields:
+            tuple: Événements par ordre chronologique (ts, id)
+        """
+        for bloc in self.iter_event_chunks(taille_bloc, **filtres):
+            yield from bloc
+    
+    # ========== FLUX DE CHANGEMENTS ==========
+    
+    def register_consumer(self, nom, depuis_debut=True):
+        """
+        Enregistre un consommateur du flux de changements (sans effet s'il existe)
+        
+        Args:
+            nom (str): Nom unique du consommateur
+            depuis_debut (bool): True pour recevoir tout l'historique, False pour
+                ne recevoir que les événements à venir
+            
+        Returns:
+            int: Filigrane (dernier id consommé) du consommateur
+        """
+        self.flush()
+        dernier_id = 0
+        if not depuis_debut:
+            dernier_id = self.conn.execute(
+                f'SELECT COALESCE(MAX(id), 0) FROM {self.source}'
+            ).fetchone()[0]
+        
+        with self.conn:
+            self.conn.execute(
+                'INSERT OR IGNORE INTO consommateurs (nom, dernier_id, mis_a_jour) '
+                'VALUES (?, ?, ?)',
+                (nom, dernier_id, time.time_ns() // 1000)
+            )
+        return self.get_watermark(nom)
+    
+    def unregister_consumer(self, nom):
+        """
+        Supprime un consommateur et son filigrane
+        
+        Args:
+            nom (str): Nom du consommateur
+        """
+        with self.conn:
+            self.conn.execute('DELETE FROM consommateurs WHERE nom = ?', (nom,))
+    
+    def get_watermark(self, nom):
+        """
+        Retourne le dernier id consommé
+        
+        Args:
+            nom (str): Nom du consommateur
+            
+        Returns:
+            int: Filigrane du consommateur
+        """
+        ligne = self.conn.execute(
+            'SELECT dernier_id FROM consommateurs WHERE nom = ?', (nom,)
+        ).fetchone()
+        if ligne is None:
+            raise KeyError(f"Consommateur inconnu: {nom}")
+        return ligne[0]
+    
+    def commit_consumer(self, nom, dernier_id):
+        """
+        Avance le filigrane d'un consommateur (il ne recule jamais)
+        
+        Args:
+            nom (str): Nom du consommateur
+            dernier_id (int): Dernier id traité
+        """
+        with self.conn:
+            self.conn.execute(
+                'UPDATE consommateurs SET dernier_id = MAX(dernier_id, ?), mis_a_jour = ? '
+                'WHERE nom = ?',
+                (dernier_id, time.time_ns() // 1000, nom)
+            )
+    
+    def poll(self, nom, taille_bloc=1000, acquitter=True):
+        """
+        Retourne les nouveaux événements depuis le filigrane du consommateur
+        
+        Le coût ne dépend que du nombre de nouvelles lignes (recherche sur la
+        clé primaire à partir du filigrane).
+        
+        Args:
+            nom (str): Nom du consommateur (voir register_consumer)
+            taille_bloc (int): Nombre maximal d'événements retournés
+            acquitter (bool): True pour avancer le filigrane immédiatement; False
+                pour acquitter soi-même avec commit_consumer après traitement
+            
+        Returns:
+            list: Tuples des nouveaux événements par id croissant (vide si aucun)
+        """
+        self.flush()
+        dernier_id = self.get_watermark(nom)
+        bloc = self.conn.execute(
+            f'SELECT {COLONNES_EVENEMENT} FROM {self.source} WHERE id > ? '
+            'ORDER BY id LIMIT ?',
+            (dernier_id, taille_bloc)
+        ).fetchall()
+        
+        if bloc and acquitter:
+            self.commit_consumer(nom, bloc[-1][0])
+        return bloc
+    
+    def get_events_by_vehicle(self, id_voiture):
+        """
+        Récupère l'historique d'une voiture (recherche par index)
+        
+        Args:
+            id_voiture (int): Identifiant de la voiture
+            
+        Returns:
+            list: Liste des événements de la voiture, ordre chronologique
+        """
+        return self.get_events_between(id_voiture=id_voiture)
+    
+    def convert_format(self, taille_bloc=TAILLE_BLOC_MIGRATION):
+        """
+        Déplace dans la table active les événements écrits dans l'autre format
+        
+        Opération explicite, à lancer quand aucun autre processus n'écrit dans la
+        base. Les ids sont conservés (filigranes des consommateurs toujours
+        valables): si un même id existe dans les deux tables, rien n'est déplacé.
+        
+        Args:
+            taille_bloc (int): Nombre de lignes déplacées par transaction
+            
+        Returns:
+            int: Nombre d'événements déplacés
+        
+        Raises:
+            ValueError: Si des ids des deux tables se recouvrent
+        """
+        self.flush()
+        if self.compact:
+            table_source, lecture, cible = 'evenements', 'evenements', 'evenements_compacts'
+        else:
+            table_source, lecture, cible = ('evenements_compacts', 'evenements_compacts_vue',
+                                            'evenements')
+        
+        conflit = self.conn.execute(
+            f'SELECT s.id FROM {table_source} s JOIN {cible} c ON c.id = s.id LIMIT 1'
+        ).fetchone()
+        if conflit is not None:
+            raise ValueError(f"Conversion impossible: l'id {conflit[0]} existe dans les deux formats")
+        
+        total = 0
+        while True:
+            lignes = self.conn.execute(
+                f'SELECT {COLONNES_EVENEMENT} FROM {lecture} ORDER BY id LIMIT ?',
+                (taille_bloc,)
+            ).fetchall()
+            if not lignes:
+                break
+            
+            with self.conn:
+                if self.compact:
+                    self.conn.executemany('''
+                        INSERT INTO evenements_compacts
+                        (id, ts, tick, type_id, action_id, etat_feu_id, scenario_id,
+                         id_voiture, position_x, position_y, vitesse)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', [
+                        (id_event, ts if ts is not None else _texte_vers_ts(timestamp) or 0, tick,
+                         self._interner(type_action), self._interner(action),
+                         self._interner(etat_feu), self._interner(scenario),
+                         id_voiture, position_x, position_y, vitesse)
+                        for (id_event, timestamp, type_action, action, etat_feu, scenario,
+                             id_voiture, position_x, position_y, vitesse, ts, tick) in lignes
+                    ])
+                else:
+                    self.conn.executemany('''
+                        INSERT INTO evenements
+                        (id, timestamp, type_action, action, etat_feu, scenario, id_voiture,
+                         position_x, position_y, vitesse, ts, tick)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', lignes)
+                self.conn.execute(f'DELETE FROM {table_source} WHERE id <= ?',
+                                  (lignes[-1][0],))
+            total += len(lignes)
+        
+        # Les prochains ids de la table active suivent tous ceux déjà attribués
+        # dans l'autre (y compris les lignes supprimées depuis)
+        with self.conn:
+            self.conn.execute(
+                'UPDATE sqlite_sequence SET seq = MAX(seq, COALESCE('
+                '(SELECT seq FROM sqlite_sequence WHERE name = ?), 0)) WHERE name = ?',
+                (table_source, cible)
+            )
+        return total
+    
     def clear_database(self):
         """Supprime tous les événements de la base de données"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        # Les événements en attente sont abandonnés avec le reste
+        self.tampon.clear()
         
-        cursor.execute('DELETE FROM evenements')
+        # Les deux tables: une base peut avoir servi dans les deux modes
+        with self.conn:
+            self.conn.execute('DELETE FROM evenements')
+            self.conn.execute('DELETE FROM evenements_compacts')
         
-        conn.commit()
-        conn.close()
         print("🗑️ Base de données vidée")
 
 
@@ -144,4 +864,5 @@ if __name__ == "__main__":
     for event in events:
         print(event)
     
-    print(f"\n✅ Test terminé - {len(events)} événements enregistrés")
\ No newline at end of file
+    print(f"\n✅ Test terminé - {len(events)} événements enregistrés")
+    db.close()
\ No newline at end of file
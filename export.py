@@ -0,0 +1,126 @@
+"""
+Module d'export du journal des événements
+Écrit la table en CSV ou JSON Lines (éventuellement gzip) avec une mémoire bornée
+"""
+
+import argparse
+import csv
+import gzip
+import json
+
+from database import Database, COLONNES_EVENEMENT
+
+
+# Noms des colonnes exportées (ordre des tuples de Database)
+COLONNES = [colonne.strip() for colonne in COLONNES_EVENEMENT.split(',')]
+
+FORMATS = ("csv", "jsonl")
+
+
+def detecter_format(chemin):
+    """
+    Déduit le format et la compression de l'extension du fichier
+    
+    Args:
+        chemin (str): Chemin du fichier de sortie (ex: export.csv.gz)
+        
+    Returns:
+        tuple: (format, compresse)
+    """
+    compresse = chemin.endswith(".gz")
+    base = chemin[:-3] if compresse else chemin
+    format_sortie = "jsonl" if base.endswith((".jsonl", ".json")) else "csv"
+    return format_sortie, compresse
+
+
+def exporter_evenements(database, chemin, format_sortie=None, compresse=None,
+                        taille_bloc=5000, **filtres):
+    """
+    Exporte les événements bloc par bloc vers un fichier
+    
+    Args:
+        database (Database): Base de données source
+        chemin (str): Fichier de sortie
+        format_sortie (str, optional): "csv" ou "jsonl" (déduit de l'extension sinon)
+        compresse (bool, optional): Compression gzip (déduite de l'extension sinon)
+        taille_bloc (int): Nombre de lignes lues par requête
+        **filtres: debut, fin, type_action, id_voiture, scenario (voir Database)
+        
+    Returns:
+        int: Nombre d'événements exportés
+    """
+    format_detecte, compresse_detecte = detecter_format(chemin)
+    format_sortie = format_sortie or format_detecte
+    compresse = compresse_detecte if compresse is None else compresse
+    if format_sortie not in FORMATS:
+        raise ValueError(f"Format d'export inconnu: {format_sortie}")
+    
+    ouvrir = gzip.open if compresse else open
+    total = 0
+    
+    with ouvrir(chemin, "wt", encoding="utf-8", newline="") as fichier:
+        if format_sortie == "csv":
+            ecrivain = csv.writer(fichier)
+            ecrivain.writerow(COLONNES)
+            for bloc in database.iter_event_chunks(taille_bloc, **filtres):
+                ecrivain.writerows(bloc)
+                total += len(bloc)
+        else:
+            for bloc in database.iter_event_chunks(taille_bloc, **filtres):
+                fichier.write("".join(
+                    json.dumps(dict(zip(COLONNES, ligne)), ensure_ascii=False) + "\n"
+                    for ligne in bloc
+                ))
+                total += len(bloc)
+    
+    return total
+
+
+def main(arguments=None):
+    """
+    Point d'entrée en ligne de commande
+    
+    Args:
+        arguments (list, optional): Arguments (sys.argv par défaut)
+    """
+    parser = argparse.ArgumentParser(description="Export du journal des événements")
+    parser.add_argument("sortie", help="Fichier de sortie (.csv, .jsonl, .gz pour gzip)")
+    parser.add_argument("--db", default="traffic_simulation.db", help="Base de données source")
+    parser.add_argument("--format", choices=FORMATS, help="Format (déduit de l'extension sinon)")
+    parser.add_argument("--gzip", action="store_true", help="Forcer la compression gzip")
+    parser.add_argument("--compact", action="store_true", help="Base en mode compact")
+    parser.add_argument("--convertir", action="store_true",
+                        help="Convertir d'abord les événements de l'autre format "
+                             "(base sans autre écrivain)")
+    parser.add_argument("--type", dest="type_action", help="Type d'action à exporter")
+    parser.add_argument("--scenario", help="Scénario à exporter")
+    parser.add_argument("--debut", help='Début "AAAA-MM-JJ HH:MM:SS"')
+    parser.add_argument("--fin", help='Fin "AAAA-MM-JJ HH:MM:SS"')
+    parser.add_argument("--taille-bloc", type=int, default=5000, help="Lignes lues par requête")
+    args = parser.parse_args(arguments)
+    
+    database = Database(args.db, compact=args.compact)
+    try:
+        if args.convertir:
+            convertis = database.convert_format()
+            print(f"🔧 {convertis} événements convertis au format "
+                  f"{'compact' if args.compact else 'texte'}")
+        total = exporter_evenements(
+            database,
+            args.sortie,
+            format_sortie=args.format,
+            compresse=True if args.gzip else None,
+            taille_bloc=args.taille_bloc,
+            type_action=args.type_action,
+            scenario=args.scenario,
+            debut=args.debut,
+            fin=args.fin
+        )
+    finally:
+        database.close()
+    
+    print(f"✅ {total} événements exportés vers {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Module de l'horloge de simulation
+Le temps simulé avance par pas fixes, indépendamment de l'heure réelle:
+une exécution headless tourne aussi vite que le processeur le permet
+et donne les mêmes résultats d'une exécution à l'autre
+"""
+
+import math
+
+
+# Durée d'un tick en secondes simulées (les vitesses des scénarios sont
+# exprimées en pixels par tick de cette durée)
+PAS_DEFAUT = 0.05
+
+
+class HorlogeSimulation:
+    """Horloge à pas fixe"""
+    
+    def __init__(self, pas=PAS_DEFAUT):
+        """
+        Initialise l'horloge
+        
+        Args:
+            pas (float): Durée d'un tick en secondes simulées
+        """
+        if pas <= 0:
+            raise ValueError("Le pas de l'horloge doit être positif")
+        self.pas = pas
+        # Rapport au pas de référence: les vitesses par tick en sont multipliées
+        self.facteur = pas / PAS_DEFAUT
+        self.tick = 0
+        self.temps = 0.0
+    
+    def avancer(self):
+        """
+        Avance d'un tick
+        
+        Returns:
+            float: Nouveau temps simulé en secondes
+        """
+        self.tick += 1
+        # Calculé depuis le numéro de tick: pas d'erreur d'arrondi cumulée
+        self.temps = self.tick * self.pas
+        return self.temps
+    
+    def avancer_de(self, nombre):
+        """
+        Avance de plusieurs ticks d'un coup (mode événements discrets)
+        
+        Args:
+            nombre (int): Nombre de ticks
+        
+        Returns:
+            float: Nouveau temps simulé en secondes
+        """
+        self.tick += nombre
+        self.temps = self.tick * self.pas
+        return self.temps
+    
+    def maintenant(self):
+        """
+        Retourne le temps simulé
+        
+        Returns:
+            float: Secondes simulées depuis le départ
+        """
+        return self.temps
+    
+    def ticks_pour(self, duree):
+        """
+        Nombre de ticks nécessaires pour simuler une durée
+        
+        Args:
+            duree (float): Durée en secondes simulées
+        
+        Returns:
+            int: Nombre de ticks
+        """
+        return math.ceil(round(duree / self.pas, 9))
+    
+    def get_intervalle_ms(self):
+        """
+        Durée réelle d'un tick quand la simulation est affichée
+        
+        Returns:
+            int: Intervalle en millisecondes
+        """
+        return int(round(self.pas * 1000))
+    
+    def reinitialiser(self):
+        """Remet l'horloge à zéro"""
+        self.tick = 0
+        self.temps = 0.0
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return f"HorlogeSimulation(pas={self.pas}, tick={self.tick}, temps={self.temps:.2f}s)"
@@ -3,8 +3,81 @@ Module de journalisation des événements
 Wrapper autour de la base de données pour faciliter le logging
 """
 
+import time
 from datetime import datetime
 from database import Database
+from sinks import (Evenement, SinkConsole, SinkMemoire, SinkSQLite, NIVEAU_DEBUG,
+                   NIVEAU_INFO, NIVEAU_AVERTISSEMENT, NIVEAU_ERREUR)
+
+
+class PolitiqueJournalisation:
+    """Filtrage des événements avant écriture (activation, échantillonnage, débit)"""
+    
+    def __init__(self, config=None, horloge=time.monotonic):
+        """
+        Initialise la politique à partir d'un dictionnaire de configuration
+        
+        Args:
+            config (dict, optional): Configuration (voir Scenario.get_config_journalisation):
+                - 'types_desactives': types d'action jamais écrits
+                - 'echantillonnage': {type_action: N} pour garder 1 événement sur N
+                - 'limites_debit': {type_action: (evenements_par_seconde, rafale)}
+                - 'resume_voitures': True pour remplacer les événements par voiture
+                  par des comptages périodiques par direction
+                - 'intervalle_resume': période des résumés (secondes)
+            horloge (callable): Source du temps en secondes (temps simulé
+                de la simulation, ou temps réel par défaut)
+        """
+        config = config or {}
+        self.config = config
+        self.horloge = horloge
+        self.types_desactives = set(config.get('types_desactives', ()))
+        self.echantillonnage = dict(config.get('echantillonnage', {}))
+        self.resume_voitures = config.get('resume_voitures', False)
+        self.intervalle_resume = config.get('intervalle_resume', 10.0)
+        
+        # Compteurs d'échantillonnage par type
+        self.compteurs_echantillon = {}
+        
+        # Seaux à jetons: {type_action: [jetons, debit, rafale, derniere_maj]}
+        maintenant = horloge()
+        self.seaux = {
+            type_action: [float(rafale), float(debit), float(rafale), maintenant]
+            for type_action, (debit, rafale) in config.get('limites_debit', {}).items()
+        }
+    
+    def autoriser(self, type_action):
+        """
+        Indique si un événement de ce type doit être écrit
+        
+        Args:
+            type_action (str): Type d'action de l'événement
+            
+        Returns:
+            bool: True si l'événement passe tous les filtres
+        """
+        if type_action in self.types_desactives:
+            return False
+        
+        n = self.echantillonnage.get(type_action)
+        if n and n > 1:
+            rang = self.compteurs_echantillon.get(type_action, 0)
+            self.compteurs_echantillon[type_action] = rang + 1
+            if rang % n:
+                return False
+        
+        seau = self.seaux.get(type_action)
+        if seau is not None:
+            jetons, debit, rafale, derniere_maj = seau
+            maintenant = self.horloge()
+            jetons = min(rafale, jetons + max(0.0, maintenant - derniere_maj) * debit)
+            seau[3] = maintenant
+            if jetons < 1.0:
+                seau[0] = jetons
+                return False
+            seau[0] = jetons - 1.0
+        
+        return True
 
 
 class Logger:
@@ -16,16 +89,259 @@ class Logger:
     TYPE_FEU_MANUEL = "FEU_MANUEL"
     TYPE_VOITURE = "VOITURE"
     TYPE_SCENARIO = "SCENARIO"
+    TYPE_RESUME = "RESUME"
+    
+    # Politiques de débordement de la file (mode asynchrone)
+    POLITIQUE_BLOQUER = SinkSQLite.POLITIQUE_BLOQUER
+    POLITIQUE_SUPPRIMER_ANCIEN = SinkSQLite.POLITIQUE_SUPPRIMER_ANCIEN
+    POLITIQUE_SUPPRIMER_VOITURE = SinkSQLite.POLITIQUE_SUPPRIMER_VOITURE
     
-    def __init__(self, database=None):
+    def __init__(self, database=None, asynchrone=False, taille_file=10000,
+                 politique_debordement=POLITIQUE_BLOQUER, console=True, sinks=None,
+                 capacite_recents=1000, tampon_console=True):
         """
         Initialise le logger
         
         Args:
             database (Database, optional): Instance de la base de données
+            asynchrone (bool): True pour écrire les événements depuis un thread dédié
+            taille_file (int): Capacité de la file d'attente (mode asynchrone)
+            politique_debordement (str): Comportement quand la file est pleine
+                (voir SinkSQLite)
+            console (bool): False pour ne rien afficher (exécutions headless)
+            sinks (list, optional): Sinks à utiliser à la place des sinks par
+                défaut (SQLite + console)
+            capacite_recents (int): Nombre d'événements récents gardés en
+                mémoire (0 pour désactiver)
+            tampon_console (bool): False pour afficher chaque message aussitôt
+                (scripts qui mêlent print() et messages du logger)
         """
         self.database = database if database else Database()
-        print("✅ Logger initialisé")
+        
+        if sinks is None:
+            sinks = [SinkSQLite(self.database, asynchrone, taille_file, politique_debordement)]
+            if console:
+                sinks.append(SinkConsole() if tampon_console else SinkConsole(taille_tampon=1))
+        self.sinks = list(sinks)
+        
+        # Derniers événements en mémoire (lus sans passer par SQLite)
+        self.recents = None
+        if capacite_recents > 0:
+            self.recents = SinkMemoire(capacite_recents)
+            self.sinks.append(self.recents)
+        
+        # Tick de simulation courant, recopié dans chaque événement
+        self.tick = None
+        
+        # Temps des débits et des résumés (remplacé par le temps simulé, voir definir_horloge)
+        self.horloge = time.monotonic
+        
+        # Politique de journalisation (détail complet par défaut)
+        self.politique = PolitiqueJournalisation()
+        
+        # Comptages par direction du mode résumé
+        self.resume = {}
+        self.debut_resume = self.horloge()
+        
+        # Événements écartés par la politique de journalisation
+        self.compteurs = {'filtres': 0}
+        
+        self.info(f"✅ Logger initialisé ({'asynchrone' if asynchrone else 'synchrone'})")
+    
+    # ========== SINKS ==========
+    
+    def ajouter_sink(self, sink):
+        """
+        Ajoute une destination de journalisation
+        
+        Args:
+            sink (Sink): Sink à ajouter
+        """
+        self.sinks.append(sink)
+    
+    def retirer_sink(self, sink):
+        """
+        Retire une destination après avoir écrit son tampon
+        
+        Args:
+            sink (Sink): Sink à retirer
+        """
+        if sink in self.sinks:
+            sink.close()
+            self.sinks.remove(sink)
+    
+    def _diffuser(self, evenement):
+        """
+        Transmet un événement à chaque sink qui l'accepte
+        
+        Args:
+            evenement (Evenement): Événement à diffuser
+        """
+        for sink in self.sinks:
+            if sink.accepte(evenement):
+                sink.emettre(evenement)
+    
+    # ========== ÉCRITURE DES ÉVÉNEMENTS ==========
+    
+    def _enregistrer(self, type_action, action, message=None, niveau=NIVEAU_INFO, **champs):
+        """
+        Journalise un événement auprès des sinks
+        
+        Args:
+            type_action (str): Type d'action
+            action (str): Description de l'action
+            message (str, optional): Texte affiché par la console
+            niveau (int): Niveau de l'événement
+            **champs: Colonnes optionnelles de l'événement
+        """
+        if not self.politique.autoriser(type_action):
+            self.compteurs['filtres'] += 1
+            return
+        
+        if self.tick is not None:
+            champs.setdefault('tick', self.tick)
+        
+        self._diffuser(Evenement(niveau, type_action, action, champs, message, persistant=True))
+    
+    def message(self, texte, niveau=NIVEAU_INFO):
+        """
+        Affiche un message (console, fichiers) sans l'écrire dans le journal SQLite
+        
+        Args:
+            texte (str): Message
+            niveau (int): Niveau du message
+        """
+        self._diffuser(Evenement(niveau, message=texte))
+    
+    def est_actif(self, niveau):
+        """
+        Indique si un message de ce niveau serait reçu par au moins un sink
+        
+        Permet de ne pas formater un message de détail que personne n'affiche.
+        
+        Args:
+            niveau (int): Niveau du message (NIVEAU_DEBUG ... NIVEAU_ERREUR)
+        
+        Returns:
+            bool: True si un sink accepte le message
+        """
+        sonde = Evenement(niveau, message="")
+        return any(sink.accepte(sonde) for sink in self.sinks)
+    
+    def debug(self, texte):
+        """Message de détail (par voiture, par tick)"""
+        self.message(texte, NIVEAU_DEBUG)
+    
+    def info(self, texte):
+        """Message d'information"""
+        self.message(texte, NIVEAU_INFO)
+    
+    def avertissement(self, texte):
+        """Message d'avertissement"""
+        self.message(texte, NIVEAU_AVERTISSEMENT)
+    
+    def erreur(self, texte):
+        """Message d'erreur"""
+        self.message(texte, NIVEAU_ERREUR)
+    
+    def flush(self):
+        """Force l'écriture de tous les événements en attente dans chaque sink"""
+        for sink in self.sinks:
+            sink.flush()
+    
+    def entretien(self):
+        """Écrit les tampons dont le délai est écoulé (à appeler périodiquement, ex. à chaque image)"""
+        for sink in self.sinks:
+            sink.entretien()
+    
+    def _flush_console(self):
+        """Écrit les messages en attente avant un affichage direct par print()"""
+        for sink in self.sinks:
+            if isinstance(sink, SinkConsole):
+                sink.flush()
+    
+    def close(self):
+        """Écrit les événements restants et ferme tous les sinks"""
+        self._emettre_resume()
+        for sink in self.sinks:
+            sink.close()
+    
+    def get_compteurs(self):
+        """
+        Retourne les compteurs d'événements
+        
+        Returns:
+            dict: Événements mis en file, écrits, supprimés (sinks SQLite) et filtrés
+        """
+        compteurs = {'en_file': 0, 'ecrits': 0, 'supprimes': 0}
+        for sink in self.sinks:
+            for cle, valeur in getattr(sink, 'compteurs', {}).items():
+                compteurs[cle] = compteurs.get(cle, 0) + valeur
+        compteurs.update(self.compteurs)
+        return compteurs
+    
+    # ========== POLITIQUE DE JOURNALISATION ==========
+    
+    def definir_politique(self, config=None):
+        """
+        Remplace la politique de journalisation
+        
+        Args:
+            config (dict, optional): Configuration de PolitiqueJournalisation
+                (None ou {} pour le détail complet)
+        """
+        # Les comptages de l'ancienne politique ne doivent pas être perdus
+        self._emettre_resume()
+        self.politique = PolitiqueJournalisation(config, self.horloge)
+    
+    def definir_horloge(self, horloge):
+        """
+        Change la source du temps des débits et des résumés
+        
+        Args:
+            horloge (callable): Retourne le temps en secondes
+                (ex. HorlogeSimulation.maintenant)
+        """
+        self._emettre_resume()
+        self.horloge = horloge
+        self.debut_resume = horloge()
+        self.politique = PolitiqueJournalisation(self.politique.config, horloge)
+    
+    def _compter_resume(self, categorie, direction):
+        """
+        Compte un événement voiture en mode résumé au lieu de l'écrire
+        
+        Args:
+            categorie (str): 'creations', 'arrets', 'demarrages' ou 'suppressions'
+            direction (str, optional): Direction de la voiture
+            
+        Returns:
+            bool: True si l'événement a été absorbé par le résumé
+        """
+        if not self.politique.resume_voitures:
+            return False
+        
+        comptes = self.resume.setdefault(direction or 'inconnue', {
+            'creations': 0, 'arrets': 0, 'demarrages': 0, 'suppressions': 0
+        })
+        comptes[categorie] += 1
+        
+        if self.horloge() - self.debut_resume >= self.politique.intervalle_resume:
+            self._emettre_resume()
+        return True
+    
+    def _emettre_resume(self):
+        """Écrit un événement RESUME par direction pour la période écoulée"""
+        self.debut_resume = self.horloge()
+        if not self.resume:
+            return
+        
+        resume, self.resume = self.resume, {}
+        for direction, comptes in resume.items():
+            action = (f"Résumé {direction}: {comptes['creations']} créations, "
+                      f"{comptes['arrets']} arrêts, {comptes['demarrages']} démarrages, "
+                      f"{comptes['suppressions']} suppressions")
+            self._enregistrer(self.TYPE_RESUME, action)
     
     # ========== ÉVÉNEMENTS SYSTÈME ==========
     
@@ -36,44 +352,44 @@ class Logger:
         Args:
             scenario (str, optional): Nom du scénario actif
         """
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
             "Démarrage de la simulation",
-            scenario=scenario
+            scenario=scenario,
+            message="📝 [LOG] Démarrage de la simulation"
         )
-        print("📝 [LOG] Démarrage de la simulation")
     
     def log_pause(self):
         """Journalise la mise en pause"""
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
-            "Pause de la simulation"
+            "Pause de la simulation",
+            message="📝 [LOG] Pause"
         )
-        print("📝 [LOG] Pause")
     
     def log_reprise(self):
         """Journalise la reprise"""
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
-            "Reprise de la simulation"
+            "Reprise de la simulation",
+            message="📝 [LOG] Reprise"
         )
-        print("📝 [LOG] Reprise")
     
     def log_arret(self):
         """Journalise l'arrêt"""
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
-            "Arrêt de la simulation"
+            "Arrêt de la simulation",
+            message="📝 [LOG] Arrêt"
         )
-        print("📝 [LOG] Arrêt")
     
     def log_reinitialisation(self):
         """Journalise la réinitialisation"""
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
-            "Réinitialisation de la simulation"
+            "Réinitialisation de la simulation",
+            message="📝 [LOG] Réinitialisation"
         )
-        print("📝 [LOG] Réinitialisation")
     
     def log_initialisation(self, scenario=None):
         """
@@ -82,12 +398,12 @@ class Logger:
         Args:
             scenario (str, optional): Nom du scénario initial
         """
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SYSTEME,
             "Initialisation de la simulation",
-            scenario=scenario
+            scenario=scenario,
+            message="📝 [LOG] Initialisation"
         )
-        print("📝 [LOG] Initialisation")
     
     # ========== ÉVÉNEMENTS DU FEU ==========
     
@@ -101,13 +417,13 @@ class Logger:
             scenario (str, optional): Scénario actif
         """
         action = f"Changement automatique {ancien_etat} -> {nouvel_etat}"
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_FEU_AUTO,
             action,
             etat_feu=nouvel_etat,
-            scenario=scenario
+            scenario=scenario,
+            message=f"📝 [LOG] Feu auto: {ancien_etat} -> {nouvel_etat}"
         )
-        print(f"📝 [LOG] Feu auto: {ancien_etat} -> {nouvel_etat}")
     
     def log_changement_feu_manuel(self, ancien_etat, nouvel_etat, scenario=None):
         """
@@ -119,26 +435,26 @@ class Logger:
             scenario (str, optional): Scénario actif
         """
         action = f"Changement manuel {ancien_etat} -> {nouvel_etat}"
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_FEU_MANUEL,
             action,
             etat_feu=nouvel_etat,
-            scenario=scenario
+            scenario=scenario,
+            message=f"📝 [LOG] Feu manuel: {ancien_etat} -> {nouvel_etat}"
         )
-        print(f"📝 [LOG] Feu manuel: {ancien_etat} -> {nouvel_etat}")
     
     def log_activation_clignotant(self):
         """Journalise l'activation du mode clignotant"""
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_FEU_AUTO,
             "Activation du mode clignotant (mode nuit)",
-            etat_feu="ORANGE"
+            etat_feu="ORANGE",
+            message="📝 [LOG] Mode clignotant activé"
         )
-        print("📝 [LOG] Mode clignotant activé")
     
     # ========== ÉVÉNEMENTS DES VOITURES ==========
     
-    def log_creation_voiture(self, id_voiture, x, y, vitesse, scenario=None):
+    def log_creation_voiture(self, id_voiture, x, y, vitesse, scenario=None, direction=None):
         """
         Journalise la création d'une voiture
         
@@ -148,19 +464,22 @@ class Logger:
             y (float): Position Y
             vitesse (float): Vitesse initiale
             scenario (str, optional): Scénario actif
+            direction (str, optional): Direction (utilisée par le mode résumé)
         """
-        self.database.log_event(
+        if self._compter_resume('creations', direction):
+            return
+        self._enregistrer(
             self.TYPE_VOITURE,
             "Création nouvelle voiture",
             scenario=scenario,
             id_voiture=id_voiture,
             position_x=x,
             position_y=y,
-            vitesse=vitesse
+            vitesse=vitesse,
+            message=f"📝 [LOG] Voiture #{id_voiture} créée"
         )
-        print(f"📝 [LOG] Voiture #{id_voiture} créée")
     
-    def log_arret_voiture(self, id_voiture, x, y, etat_feu="ROUGE"):
+    def log_arret_voiture(self, id_voiture, x, y, etat_feu="ROUGE", direction=None):
         """
         Journalise l'arrêt d'une voiture
         
@@ -169,8 +488,11 @@ class Logger:
             x (float): Position X
             y (float): Position Y
             etat_feu (str): État du feu
+            direction (str, optional): Direction (utilisée par le mode résumé)
         """
-        self.database.log_event(
+        if self._compter_resume('arrets', direction):
+            return
+        self._enregistrer(
             self.TYPE_VOITURE,
             "Arrêt au feu rouge",
             etat_feu=etat_feu,
@@ -180,7 +502,7 @@ class Logger:
             vitesse=0.0
         )
     
-    def log_demarrage_voiture(self, id_voiture, x, y, vitesse, etat_feu="VERT"):
+    def log_demarrage_voiture(self, id_voiture, x, y, vitesse, etat_feu="VERT", direction=None):
         """
         Journalise le démarrage d'une voiture
         
@@ -190,8 +512,11 @@ class Logger:
             y (float): Position Y
             vitesse (float): Vitesse actuelle
             etat_feu (str): État du feu
+            direction (str, optional): Direction (utilisée par le mode résumé)
         """
-        self.database.log_event(
+        if self._compter_resume('demarrages', direction):
+            return
+        self._enregistrer(
             self.TYPE_VOITURE,
             "Redémarrage au feu vert",
             etat_feu=etat_feu,
@@ -201,19 +526,22 @@ class Logger:
             vitesse=vitesse
         )
     
-    def log_suppression_voiture(self, id_voiture):
+    def log_suppression_voiture(self, id_voiture, direction=None):
         """
         Journalise la suppression d'une voiture
         
         Args:
             id_voiture (int): ID de la voiture
+            direction (str, optional): Direction (utilisée par le mode résumé)
         """
-        self.database.log_event(
+        if self._compter_resume('suppressions', direction):
+            return
+        self._enregistrer(
             self.TYPE_VOITURE,
             "Suppression voiture (hors écran)",
-            id_voiture=id_voiture
+            id_voiture=id_voiture,
+            message=f"📝 [LOG] Voiture #{id_voiture} supprimée"
         )
-        print(f"📝 [LOG] Voiture #{id_voiture} supprimée")
     
     # ========== ÉVÉNEMENTS DES SCÉNARIOS ==========
     
@@ -226,12 +554,12 @@ class Logger:
             nouveau_scenario (str): Nom du nouveau scénario
         """
         action = f"Changement de scénario: {ancien_scenario} -> {nouveau_scenario}"
-        self.database.log_event(
+        self._enregistrer(
             self.TYPE_SCENARIO,
             action,
-            scenario=nouveau_scenario
+            scenario=nouveau_scenario,
+            message=f"📝 [LOG] Scénario: {ancien_scenario} -> {nouveau_scenario}"
         )
-        print(f"📝 [LOG] Scénario: {ancien_scenario} -> {nouveau_scenario}")
     
     # ========== MÉTHODES UTILITAIRES ==========
     
@@ -244,28 +572,28 @@ class Logger:
             action (str): Description de l'action
             **kwargs: Paramètres additionnels (etat_feu, scenario, etc.)
         """
-        self.database.log_event(type_action, action, **kwargs)
-        print(f"📝 [LOG] {type_action}: {action}")
+        self._enregistrer(type_action, action, message=f"📝 [LOG] {type_action}: {action}", **kwargs)
     
-    def get_statistiques(self):
+    def get_statistiques(self, debut=None, fin=None):
         """
         Retourne des statistiques sur les événements
         
+        Args:
+            debut (str, optional): Timestamp minimal inclus
+            fin (str, optional): Timestamp maximal inclus
+        
         Returns:
             dict: Statistiques des événements
         """
-        tous_events = self.database.get_all_events()
+        self.flush()
+        # Comptage fait par SQLite (GROUP BY), sans charger les lignes
+        par_type = self.database.count_by_type(debut, fin)
         
         stats = {
-            'total': len(tous_events),
-            'par_type': {}
+            'total': sum(par_type.values()),
+            'par_type': par_type
         }
         
-        # Compter par type
-        for event in tous_events:
-            type_action = event[2]  # Colonne type_action
-            stats['par_type'][type_action] = stats['par_type'].get(type_action, 0) + 1
-        
         return stats
     
     def afficher_statistiques(self):
@@ -281,6 +609,22 @@ class Logger:
             print(f"  • {type_action}: {count} événements")
         print("="*60 + "\n")
     
+    def get_derniers_events_memoire(self, nombre=10, type_action=None, id_voiture=None):
+        """
+        Retourne les derniers événements gardés en mémoire (aucun accès disque)
+        
+        Args:
+            nombre (int): Nombre maximal d'événements
+            type_action (str, optional): Type d'action à filtrer
+            id_voiture (int, optional): Voiture à filtrer
+            
+        Returns:
+            list: Événements (Evenement) du plus récent au plus ancien
+        """
+        if self.recents is None:
+            return []
+        return self.recents.tampon.derniers(nombre, type_action, id_voiture)
+    
     def afficher_derniers_events(self, nombre=10):
         """
         Affiche les derniers événements
@@ -288,8 +632,15 @@ class Logger:
         Args:
             nombre (int): Nombre d'événements à afficher
         """
-        events = self.database.get_all_events()[:nombre]
+        if self.recents is not None and len(self.recents.tampon) >= nombre:
+            # Les événements récents sont en mémoire: pas de requête SQLite
+            events = [(None, e.get_timestamp(), e.type_action, e.action)
+                      for e in self.get_derniers_events_memoire(nombre)]
+        else:
+            self.flush()
+            events = self.database.get_recent_events(nombre)
         
+        self._flush_console()
         print("\n" + "="*60)
         print(f"📝 DERNIERS {nombre} ÉVÉNEMENTS")
         print("="*60)
@@ -304,8 +655,11 @@ class Logger:
     
     def vider_logs(self):
         """Vide tous les logs de la base de données"""
+        self.flush()
         self.database.clear_database()
-        print("🗑️  Tous les logs ont été supprimés")
+        if self.recents is not None:
+            self.recents.tampon.vider()
+        self.info("🗑️  Tous les logs ont été supprimés")
 
 
 # Test du module
@@ -314,7 +668,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     # Créer un logger
-    logger = Logger(Database("test_logger.db"))
+    logger = Logger(Database("test_logger.db"), tampon_console=False)
     
     print("\n1️⃣ Test des logs système:")
     logger.log_initialisation(scenario="Circulation Normale")
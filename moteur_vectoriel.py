@@ -0,0 +1,456 @@
+"""
+Module du moteur vectoriel de véhicules
+Stocke l'état de toutes les voitures dans des tableaux NumPy (structure de tableaux)
+et calcule un tick complet (lignes d'arrêt, écarts, vitesses, positions) en une passe,
+voiture pour voiture identique à MoteurSimulation.gerer_voitures (simulation.py)
+
+NumPy est optionnel: si le module n'est pas installé, NUMPY_DISPONIBLE vaut False
+et la simulation garde la mise à jour voiture par voiture.
+"""
+
+# Ordre des directions dans les tableaux: codes entiers de Vehicle
+from vehicles import DIRECTIONS, CODES_DIRECTION
+
+try:
+    import numpy as np
+    NUMPY_DISPONIBLE = True
+except ImportError:
+    np = None
+    NUMPY_DISPONIBLE = False
+
+
+# Codes des états de feu
+FEU_ROUGE = 0
+FEU_ORANGE = 1
+FEU_VERT = 2
+CODES_FEU = {'ROUGE': FEU_ROUGE, 'ORANGE': FEU_ORANGE, 'VERT': FEU_VERT}
+
+
+class MoteurVectoriel:
+    """Moteur des véhicules en tableaux NumPy (équivalent de MoteurSimulation.gerer_voitures)"""
+    
+    def __init__(self, capacite=64, ligne_arret=100, zone_arret=40,
+                 distance_securite=45, limite_ecran=400):
+        """
+        Initialise le moteur
+        
+        Args:
+            capacite (int): Nombre de voitures prévu (les tableaux s'agrandissent)
+            ligne_arret (float): Distance de la ligne d'arrêt au centre du carrefour
+            zone_arret (float): Profondeur de la zone d'arrêt avant la ligne
+            distance_securite (float): Écart minimal avec la voiture de devant
+            limite_ecran (int): Limite au-delà de laquelle une voiture sort
+        
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("NumPy est requis pour le moteur vectoriel")
+        
+        self.ligne_arret = ligne_arret
+        self.zone_arret = zone_arret
+        self.distance_securite = distance_securite
+        self.limite_ecran = limite_ecran
+        
+        # Vecteur unitaire de déplacement par code de direction
+        self.axe_x = np.array([1.0, -1.0, 0.0, 0.0])
+        self.axe_y = np.array([0.0, 0.0, 1.0, -1.0])
+        
+        self.nombre = 0
+        self.vehicules = []   # Vues Vehicle, même indice que les tableaux
+        self.en_attente = []  # Voitures créées mais pas encore chargées
+        self.prochain_rang = 0  # Ordre de création (ordre de traitement de gerer_voitures)
+        self._allouer(capacite)
+    
+    def _allouer(self, capacite):
+        """
+        (Ré)alloue les tableaux en conservant les voitures chargées
+        
+        Args:
+            capacite (int): Nouvelle capacité
+        """
+        anciens = getattr(self, 'x', None)
+        tableaux = {
+            'x': np.float64, 'y': np.float64,
+            'vitesse': np.float64, 'vitesse_max': np.float64,
+            'acceleration': np.float64, 'deceleration': np.float64,
+            'distance_securite_voiture': np.float64,
+            'direction': np.int8, 'rang': np.int64,
+            'detection': np.bool_, 'arretee': np.bool_
+        }
+        for nom, type_numpy in tableaux.items():
+            nouveau = np.zeros(capacite, dtype=type_numpy)
+            if anciens is not None:
+                nouveau[:self.nombre] = getattr(self, nom)[:self.nombre]
+            setattr(self, nom, nouveau)
+        self.capacite = capacite
+    
+    # ========== GESTION DES VOITURES ==========
+    
+    def ajouter(self, voiture):
+        """
+        Enregistre une voiture; elle est chargée dans les tableaux au prochain tick
+        pour tenir compte des réglages faits juste après sa création
+        
+        Args:
+            voiture (Vehicle): Voiture à ajouter
+        """
+        voiture.indice_moteur = None
+        self.en_attente.append(voiture)
+    
+    def _charger_en_attente(self):
+        """Copie les voitures en attente dans les tableaux"""
+        for voiture in self.en_attente:
+            if not voiture.actif:
+                continue
+            if self.nombre == self.capacite:
+                self._allouer(self.capacite * 2)
+            
+            i = self.nombre
+            self.x[i] = voiture.x
+            self.y[i] = voiture.y
+            self.vitesse[i] = voiture.vitesse
+            self.vitesse_max[i] = voiture.vitesse_max
+            self.acceleration[i] = voiture.acceleration
+            self.deceleration[i] = voiture.deceleration
+            self.distance_securite_voiture[i] = voiture.distance_securite
+            self.direction[i] = CODES_DIRECTION[voiture.direction]
+            self.detection[i] = voiture.detection_active
+            self.arretee[i] = voiture.arretee
+            self.rang[i] = self.prochain_rang
+            self.prochain_rang += 1
+            
+            voiture.indice_moteur = i
+            self.vehicules.append(voiture)
+            self.nombre += 1
+        self.en_attente.clear()
+    
+    def retirer(self, voiture):
+        """
+        Retire une voiture en déplaçant la dernière à sa place (O(1))
+        
+        Args:
+            voiture (Vehicle): Voiture à retirer
+        """
+        if voiture in self.en_attente:
+            self.en_attente.remove(voiture)
+            return
+        
+        i = getattr(voiture, 'indice_moteur', None)
+        if i is None:
+            return
+        
+        dernier = self.nombre - 1
+        if i != dernier:
+            for tableau in (self.x, self.y, self.vitesse, self.vitesse_max,
+                            self.acceleration, self.deceleration,
+                            self.distance_securite_voiture, self.direction,
+                            self.detection, self.arretee, self.rang):
+                tableau[i] = tableau[dernier]
+            self.vehicules[i] = self.vehicules[dernier]
+            self.vehicules[i].indice_moteur = i
+        
+        self.vehicules.pop()
+        self.nombre -= 1
+        voiture.indice_moteur = None
+    
+    def synchroniser_position(self, voiture):
+        """
+        Recopie dans les tableaux une position modifiée hors du moteur
+        
+        Args:
+            voiture (Vehicle): Voiture déplacée
+        """
+        i = voiture.indice_moteur
+        if i is not None:
+            self.x[i] = voiture.x
+            self.y[i] = voiture.y
+    
+    def definir_detection(self, active):
+        """
+        Active ou désactive la détection de dangers pour toutes les voitures
+        
+        Args:
+            active (bool): Nouvel état de la détection
+        """
+        self.detection[:self.nombre] = active
+    
+    def vider(self):
+        """Retire toutes les voitures"""
+        for voiture in self.vehicules:
+            voiture.indice_moteur = None
+        self.vehicules.clear()
+        self.en_attente.clear()
+        self.nombre = 0
+    
+    # ========== TICK VECTORISÉ ==========
+    
+    def _ecarts_leaders(self, progression, laterale, direction):
+        """
+        Calcule l'écart de chaque voiture avec celle qui la précède dans sa voie
+        
+        Args:
+            progression (ndarray): Position le long du sens de circulation
+            laterale (ndarray): Coordonnée latérale arrondie (identifie la voie)
+            direction (ndarray): Codes de direction
+        
+        Returns:
+            tuple: (écarts, indices des voitures de devant); inf et -1 pour les
+                têtes de voie
+        """
+        ordre = np.lexsort((progression, laterale, direction))
+        p = progression[ordre]
+        meme_voie = ((direction[ordre][1:] == direction[ordre][:-1])
+                     & (laterale[ordre][1:] == laterale[ordre][:-1]))
+        
+        ecarts = np.full(len(progression), np.inf)
+        devant = np.full(len(progression), -1, dtype=np.intp)
+        suivies = ordre[:-1][meme_voie]
+        ecarts[suivies] = p[1:][meme_voie] - p[:-1][meme_voie]
+        devant[suivies] = ordre[1:][meme_voie]
+        # Deux voitures au même point ne sont pas "devant" l'une de l'autre
+        confondues = ecarts <= 0
+        ecarts[confondues] = np.inf
+        devant[confondues] = -1
+        return ecarts, devant
+    
+    def _freiner(self, masque, vitesse, arretee):
+        """
+        Applique un freinage aux voitures du masque
+        
+        Args:
+            masque (ndarray): Voitures qui freinent
+            vitesse (ndarray): Vitesses (modifiées sur place)
+            arretee (ndarray): Voitures à l'arrêt (modifiées sur place)
+        
+        Returns:
+            ndarray: Indices des voitures qui viennent de s'arrêter
+        """
+        n = self.nombre
+        freinent = masque & (vitesse > 0)
+        vitesse[freinent] = np.maximum(0.0, vitesse[freinent] - self.deceleration[:n][freinent])
+        
+        arretees = freinent & (vitesse == 0) & ~arretee
+        arretee[arretees] = True
+        return np.flatnonzero(arretees)
+    
+    def _decider(self, ecarts, avant_feu, feu):
+        """
+        Calcule vitesses et arrêts du tick sans modifier les tableaux
+        
+        Args:
+            ecarts (ndarray): Écart avec la voiture de devant (inf si aucune)
+            avant_feu (ndarray): Voitures dans la zone d'arrêt avant la ligne
+            feu (ndarray): Code du feu vu par chaque voiture
+        
+        Returns:
+            tuple: (vitesses, arrêtées, démarrages, arrêts, bloquées)
+        """
+        n = self.nombre
+        vitesse = self.vitesse[:n].copy()
+        arretee = self.arretee[:n].copy()
+        vitesse_max = self.vitesse_max[:n]
+        
+        rouge = feu == FEU_ROUGE
+        orange_en_mouvement = (feu == FEU_ORANGE) & (vitesse > 0)
+        vert = feu == FEU_VERT
+        collision = self.detection[:n] & (ecarts < self.distance_securite_voiture[:n])
+        
+        # Même arbre de décision que MoteurSimulation.gerer_voitures (simulation.py)
+        freiner = np.where(avant_feu, rouge | collision | orange_en_mouvement, collision)
+        accelerer = np.where(avant_feu, vert & ~collision, ~collision)
+        
+        # Accélération (journaliser les démarrages depuis l'arrêt)
+        accelerent = accelerer & (vitesse < vitesse_max)
+        demarrages = np.flatnonzero(accelerent & (vitesse == 0))
+        arretee[demarrages] = False
+        vitesse[accelerent] = np.minimum(vitesse_max[accelerent],
+                                         vitesse[accelerent] + self.acceleration[:n][accelerent])
+        
+        arrets = list(self._freiner(freiner, vitesse, arretee))
+        
+        # Trop près de la voiture de devant: freiner et ne pas avancer
+        bloquees = ecarts < self.distance_securite
+        arrets.extend(self._freiner(bloquees, vitesse, arretee))
+        
+        return vitesse, arretee, demarrages, arrets, bloquees
+    
+    def _positions_suivantes(self, vitesse, bloquees):
+        """
+        Calcule les positions après déplacement
+        
+        Args:
+            vitesse (ndarray): Vitesses du tick
+            bloquees (ndarray): Voitures trop près de celle de devant (immobiles)
+        
+        Returns:
+            tuple: (x, y, voitures qui avancent)
+        """
+        n = self.nombre
+        direction = self.direction[:n]
+        avancent = ~bloquees & (vitesse > 0)
+        pas = np.where(avancent, vitesse, 0.0)
+        return (self.x[:n] + pas * self.axe_x[direction],
+                self.y[:n] + pas * self.axe_y[direction], avancent)
+    
+    def etape(self, etats_feu):
+        """
+        Calcule un tick pour toutes les voitures
+        
+        MoteurSimulation.gerer_voitures traite les voitures une à une dans l'ordre de création:
+        une voiture créée après celle qui la précède la voit déjà déplacée (ou
+        retirée si elle vient de sortir), les autres la voient à sa position de
+        début de tick. Pour donner le même résultat, les écarts de ces voitures
+        sont recalculés avec les nouvelles positions tant qu'une décision change
+        (au plus la longueur de la plus longue file, en pratique une ou deux fois).
+        
+        Args:
+            etats_feu (sequence): État du feu par code de direction ('VERT', ...)
+        
+        Returns:
+            list: Voitures sorties de l'écran (à supprimer par l'appelant)
+        """
+        self._charger_en_attente()
+        n = self.nombre
+        if n == 0:
+            return []
+        
+        x = self.x[:n]
+        y = self.y[:n]
+        direction = self.direction[:n]
+        ax = self.axe_x[direction]
+        ay = self.axe_y[direction]
+        
+        progression = x * ax + y * ay
+        laterale = np.where(ax != 0, y, x).round()
+        ecarts, devant = self._ecarts_leaders(progression, laterale, direction)
+        
+        # Lignes d'arrêt: la progression est identique pour les quatre directions
+        avant_feu = ((progression < self.ligne_arret)
+                     & (progression > self.ligne_arret - self.zone_arret))
+        codes = np.array([CODES_FEU[etat] for etat in etats_feu], dtype=np.int8)
+        feu = codes[direction]
+        
+        decision = self._decider(ecarts, avant_feu, feu)
+        x_suivants, y_suivants, avancent = self._positions_suivantes(decision[0], decision[4])
+        
+        # Voitures créées après celle de devant et assez proches d'elle pour
+        # qu'un écart plus grand change leur décision
+        rang = self.rang[:n]
+        suiveuses = np.flatnonzero(ecarts < np.maximum(self.distance_securite_voiture[:n],
+                                                       self.distance_securite))
+        suiveuses = suiveuses[rang[devant[suiveuses]] < rang[suiveuses]]
+        if len(suiveuses):
+            meneuses = devant[suiveuses]
+            seuil_collision = self.distance_securite_voiture[:n][suiveuses]
+            for _ in range(n):
+                xm = x_suivants[meneuses]
+                ym = y_suivants[meneuses]
+                sortie = (((np.abs(xm) > self.limite_ecran) | (np.abs(ym) > self.limite_ecran))
+                          & ~decision[4][meneuses])
+                nouveaux = np.where(sortie, np.inf,
+                                    xm * ax[meneuses] + ym * ay[meneuses] - progression[suiveuses])
+                anciens = ecarts[suiveuses]
+                # Les écarts ne font que grandir: seul le passage d'un seuil compte
+                if not (((anciens < seuil_collision) & (nouveaux >= seuil_collision))
+                        | ((anciens < self.distance_securite)
+                           & (nouveaux >= self.distance_securite))).any():
+                    break
+                ecarts = ecarts.copy()
+                ecarts[suiveuses] = nouveaux
+                decision = self._decider(ecarts, avant_feu, feu)
+                x_suivants, y_suivants, avancent = self._positions_suivantes(decision[0], decision[4])
+        
+        vitesse, arretee, demarrages, arrets, bloquees = decision
+        # Seules les voitures qui ont bougé ou changé de vitesse (démarrages et
+        # arrêts compris) ont une vue Vehicle périmée
+        modifiees = np.flatnonzero(avancent | (vitesse != self.vitesse[:n]))
+        self.vitesse[:n] = vitesse
+        self.arretee[:n] = arretee
+        
+        # Journal avant le déplacement (positions du début du tick, comme Vehicle)
+        self._journaliser(demarrages, arrets)
+        
+        self.x[:n] = x_suivants
+        self.y[:n] = y_suivants
+        sorties = ~bloquees & ((np.abs(x_suivants) > self.limite_ecran)
+                               | (np.abs(y_suivants) > self.limite_ecran))
+        
+        self._synchroniser_vues(modifiees)
+        return [self.vehicules[i] for i in np.flatnonzero(sorties)]
+    
+    def _journaliser(self, demarrages, arrets):
+        """
+        Journalise les démarrages et les arrêts calculés pendant le tick
+        
+        Args:
+            demarrages (ndarray): Indices des voitures qui démarrent
+            arrets (list): Indices des voitures qui viennent de s'arrêter
+        """
+        for i in demarrages:
+            voiture = self.vehicules[i]
+            voiture.logger.log_demarrage_voiture(
+                voiture.id, float(self.x[i]), float(self.y[i]), 0,
+                direction=voiture.direction
+            )
+        for i in arrets:
+            voiture = self.vehicules[i]
+            voiture.logger.log_arret_voiture(
+                voiture.id, float(self.x[i]), float(self.y[i]),
+                direction=voiture.direction
+            )
+    
+    def _synchroniser_vues(self, modifiees):
+        """
+        Recopie l'état des tableaux dans les objets Vehicle (rendu, journal)
+        
+        Args:
+            modifiees (ndarray): Indices des voitures qui ont bougé ou changé de vitesse
+        """
+        for i, x, y, vitesse, arretee in zip(modifiees.tolist(),
+                                             self.x[modifiees].tolist(),
+                                             self.y[modifiees].tolist(),
+                                             self.vitesse[modifiees].tolist(),
+                                             self.arretee[modifiees].tolist()):
+            voiture = self.vehicules[i]
+            voiture.x = x
+            voiture.y = y
+            voiture.vitesse = vitesse
+            voiture.arretee = arretee
+
+
+if __name__ == "__main__":
+    # Test du moteur sans affichage
+    class _Journal:
+        def log_demarrage_voiture(self, *args, **kwargs):
+            print(f"   démarrage {args}")
+        
+        def log_arret_voiture(self, *args, **kwargs):
+            print(f"   arrêt {args}")
+    
+    class _Voiture:
+        def __init__(self, id_voiture, x, y, direction):
+            self.id = id_voiture
+            self.x, self.y, self.direction = x, y, direction
+            self.vitesse, self.vitesse_max = 0, 2.0
+            self.acceleration, self.deceleration = 0.2, 0.5
+            self.distance_securite = 50
+            self.detection_active, self.arretee, self.actif = True, False, True
+            self.logger = _Journal()
+    
+    if not NUMPY_DISPONIBLE:
+        print("⚠️ NumPy non installé: moteur vectoriel indisponible")
+    else:
+        moteur = MoteurVectoriel(capacite=2)
+        voitures = [_Voiture(1, -200, 25, 'est'), _Voiture(2, -230, 25, 'est'),
+                    _Voiture(3, 25, -200, 'nord')]
+        for v in voitures:
+            moteur.ajouter(v)
+        
+        etats = ('VERT', 'VERT', 'ROUGE', 'ROUGE')  # est, ouest, nord, sud
+        for _ in range(200):
+            for v in moteur.etape(etats):
+                moteur.retirer(v)
+        
+        for v in voitures:
+            print(f"Voiture #{v.id} ({v.direction}) à ({v.x:.1f}, {v.y:.1f}) vitesse {v.vitesse:.1f}")
@@ -0,0 +1,103 @@
+"""
+Module du niveau de détail de l'affichage des voitures
+Au-delà d'un nombre de voitures, ou quand les images dépassent leur budget
+de temps, les voitures sont dessinées en formes simples (points) au lieu
+d'images; le détail revient quand la charge redescend
+"""
+
+
+# Nombre de voitures affichées au-delà duquel les voitures deviennent des points
+SEUIL_VOITURES_DEFAUT = 40
+
+# Durée maximale d'une image en secondes (20 images par seconde)
+BUDGET_IMAGE_DEFAUT = 0.05
+
+# Nombre d'images hors budget d'affilée avant de simplifier
+IMAGES_LENTES_MAX = 3
+
+# Le détail revient sous cette fraction du nombre de voitures de la bascule
+FRACTION_RETOUR = 0.8
+
+# Après une bascule due à la durée des images, le détail revient après ce nombre
+# d'images rapides d'affilée (sous FRACTION_BUDGET_RETOUR du budget)
+IMAGES_RAPIDES_MIN = 30
+FRACTION_BUDGET_RETOUR = 0.5
+
+
+class NiveauDetail:
+    """Choix entre affichage détaillé et simplifié, avec hystérésis"""
+    
+    def __init__(self, seuil_voitures=SEUIL_VOITURES_DEFAUT, budget_image=BUDGET_IMAGE_DEFAUT,
+                 images_lentes_max=IMAGES_LENTES_MAX, images_rapides_min=IMAGES_RAPIDES_MIN):
+        """
+        Initialise le niveau de détail (détaillé au départ)
+        
+        Args:
+            seuil_voitures (int): Nombre de voitures au-delà duquel simplifier
+                (None = jamais sur ce critère)
+            budget_image (float): Durée d'image au-delà de laquelle une image est lente
+                (None = ignorer la durée)
+            images_lentes_max (int): Images lentes d'affilée avant de simplifier
+            images_rapides_min (int): Images rapides d'affilée avant de revenir au
+                détail quand la bascule venait de la durée des images
+        """
+        self.seuil_voitures = seuil_voitures
+        self.budget_image = budget_image
+        self.images_lentes_max = images_lentes_max
+        self.images_rapides_min = images_rapides_min
+        
+        self.simplifie = False
+        self.images_lentes = 0
+        self.images_rapides = 0
+        self.bascule_par_duree = False
+        self.voitures_bascule = 0
+        self.nombre_bascules = 0
+    
+    def evaluer(self, nombre_voitures, duree_image=None):
+        """
+        Met à jour le niveau de détail après une image
+        
+        Args:
+            nombre_voitures (int): Voitures affichées
+            duree_image (float, optional): Durée de la dernière image en secondes
+        
+        Returns:
+            bool: True si les voitures doivent être dessinées en formes simples
+        """
+        if duree_image is not None and self.budget_image is not None:
+            self.images_lentes = self.images_lentes + 1 if duree_image > self.budget_image else 0
+            rapide = duree_image <= self.budget_image * FRACTION_BUDGET_RETOUR
+            self.images_rapides = self.images_rapides + 1 if rapide else 0
+        
+        if not self.simplifie:
+            trop_de_voitures = (self.seuil_voitures is not None
+                                and nombre_voitures > self.seuil_voitures)
+            if trop_de_voitures or self.images_lentes >= self.images_lentes_max:
+                self.simplifie = True
+                self.bascule_par_duree = not trop_de_voitures
+                self.images_rapides = 0
+                self.voitures_bascule = nombre_voitures
+                self.nombre_bascules += 1
+        else:
+            # Revenir au détail seulement quand la charge a nettement baissé
+            limite = self.voitures_bascule
+            if self.seuil_voitures is not None:
+                limite = min(limite, self.seuil_voitures)
+            charge_baissee = nombre_voitures <= limite * FRACTION_RETOUR
+            # Bascule due à la durée: le nombre peut rester stable, la durée suffit
+            images_redevenues_rapides = (
+                self.bascule_par_duree
+                and self.images_rapides >= self.images_rapides_min
+                and (self.seuil_voitures is None or nombre_voitures <= self.seuil_voitures)
+            )
+            if charge_baissee or images_redevenues_rapides:
+                self.simplifie = False
+                self.images_lentes = 0
+                self.nombre_bascules += 1
+        
+        return self.simplifie
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        niveau = "simplifié" if self.simplifie else "détaillé"
+        return f"NiveauDetail({niveau}, seuil={self.seuil_voitures}, budget={self.budget_image})"
@@ -0,0 +1,118 @@
+"""
+Module du plan de feux compilé
+Un scénario est compilé une seule fois en un plan immuable: tableaux des
+états, des durées et des instants de début de chaque phase du cycle
+"""
+
+from bisect import bisect_right
+
+
+# Durée de la phase de sécurité tout rouge (secondes)
+DUREE_ROUGE_SECURITE = 1.5
+
+# Cycle automatique: (phase, état Nord/Sud, état Est/Ouest, clé de durée, message)
+# La clé désigne une entrée de Scenario.get_durees_feu(), ou une durée fixe
+CYCLE_AUTOMATIQUE = (
+    # Phase 1 : Nord/Sud a la priorité
+    ("VERT_NS", "VERT", "ROUGE", 'vert', "🟢 Nord/Sud VERT | Est/Ouest ROUGE"),
+    ("ORANGE_NS", "ORANGE", "ROUGE", 'orange', "🟠 Nord/Sud ORANGE | Est/Ouest ROUGE"),
+    ("ROUGE_TOUS", "ROUGE", "ROUGE", DUREE_ROUGE_SECURITE, "🔴 SÉCURITÉ: Tous les feux ROUGES 🔴"),
+    
+    # Phase 2: Est/Ouest a la priorité
+    ("VERT_EO", "ROUGE", "VERT", 'vert', "🔴 Nord/Sud ROUGE | Est/Ouest VERT 🟢"),
+    ("ORANGE_EO", "ROUGE", "ORANGE", 'orange', "🔴 Nord/Sud ROUGE | Est/Ouest ORANGE 🟠"),
+    ("ROUGE_TOUS", "ROUGE", "ROUGE", DUREE_ROUGE_SECURITE, "🔴 SÉCURITÉ: Tous les feux ROUGES 🔴"),
+)
+
+
+class PlanFeux:
+    """Plan de feux immuable (un tuple par attribut, indexé par numéro de phase)"""
+    
+    __slots__ = ('phases', 'etats_nord_sud', 'etats_est_ouest', 'durees',
+                 'messages', 'debuts', 'duree_cycle')
+    
+    def __init__(self, phases, etats_nord_sud, etats_est_ouest, durees, messages):
+        """
+        Initialise le plan
+        
+        Args:
+            phases (iterable): Noms des phases
+            etats_nord_sud (iterable): État Nord/Sud de chaque phase
+            etats_est_ouest (iterable): État Est/Ouest de chaque phase
+            durees (iterable): Durée de chaque phase en secondes
+            messages (iterable): Message affiché à l'entrée de chaque phase
+        """
+        setter = object.__setattr__
+        setter(self, 'phases', tuple(phases))
+        setter(self, 'etats_nord_sud', tuple(etats_nord_sud))
+        setter(self, 'etats_est_ouest', tuple(etats_est_ouest))
+        setter(self, 'durees', tuple(float(d) for d in durees))
+        setter(self, 'messages', tuple(messages))
+        
+        if not self.phases:
+            raise ValueError("Un plan de feux doit contenir au moins une phase")
+        
+        # Instant de début de chaque phase dans le cycle
+        debuts = []
+        temps = 0.0
+        for duree in self.durees:
+            debuts.append(temps)
+            temps += duree
+        setter(self, 'debuts', tuple(debuts))
+        setter(self, 'duree_cycle', temps)
+    
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("PlanFeux est immuable")
+    
+    def __len__(self):
+        return len(self.phases)
+    
+    def suivante(self, index):
+        """
+        Retourne le numéro de la phase qui suit
+        
+        Args:
+            index (int): Numéro de la phase courante
+        
+        Returns:
+            int: Numéro de la phase suivante (le cycle boucle)
+        """
+        return (index + 1) % len(self.phases)
+    
+    def phase_a(self, temps):
+        """
+        Retrouve la phase active à un instant donné depuis le début du cycle
+        
+        Args:
+            temps (float): Secondes écoulées depuis le début du cycle
+        
+        Returns:
+            tuple: (numéro de phase, secondes avant le prochain changement)
+        """
+        temps = temps % self.duree_cycle if self.duree_cycle > 0 else 0.0
+        index = bisect_right(self.debuts, temps) - 1
+        return index, self.debuts[index] + self.durees[index] - temps
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return f"PlanFeux({len(self.phases)} phases, cycle={self.duree_cycle:.1f}s)"
+
+
+def compiler_plan_feux(durees, cycle=CYCLE_AUTOMATIQUE):
+    """
+    Compile les durées d'un scénario en plan de feux
+    
+    Args:
+        durees (dict): Durées du scénario ({'vert': ..., 'orange': ..., 'rouge': ...})
+        cycle (tuple): Description du cycle (voir CYCLE_AUTOMATIQUE)
+    
+    Returns:
+        PlanFeux: Plan immuable
+    """
+    return PlanFeux(
+        phases=[phase for phase, _, _, _, _ in cycle],
+        etats_nord_sud=[ns for _, ns, _, _, _ in cycle],
+        etats_est_ouest=[eo for _, _, eo, _, _ in cycle],
+        durees=[durees[cle] if isinstance(cle, str) else cle for _, _, _, cle, _ in cycle],
+        messages=[message for _, _, _, _, message in cycle]
+    )
@@ -0,0 +1,114 @@
+"""
+Module du pool de tortues
+Les tortues des voitures sorties sont cachées et réutilisées au lieu d'être
+recréées: l'écran Turtle garde une liste de toutes les tortues jamais créées,
+qui ne grossit donc plus au fil d'une longue session
+"""
+
+import turtle
+
+
+# Nombre maximal de tortues de voitures créées (visibles + en réserve)
+TAILLE_MAX_DEFAUT = 64
+
+
+class PoolTortues:
+    """Réserve de tortues cachées, rangées par forme"""
+    
+    def __init__(self, taille_max=TAILLE_MAX_DEFAUT):
+        """
+        Initialise le pool
+        
+        Args:
+            taille_max (int): Nombre maximal de tortues créées; au-delà,
+                prendre() réutilise une tortue libre d'une autre forme ou renvoie None
+        """
+        if taille_max <= 0:
+            raise ValueError("Le pool doit pouvoir contenir au moins une tortue")
+        self.taille_max = taille_max
+        self.libres = {}   # {forme: [tortues cachées]}
+        self.nombre_creees = 0
+        self.nombre_libres = 0
+    
+    def __len__(self):
+        return self.nombre_creees
+    
+    def _creer(self):
+        """
+        Crée une tortue cachée, sans tracé ni historique d'annulation
+        
+        Returns:
+            turtle.Turtle: Nouvelle tortue
+        """
+        tortue = turtle.Turtle(visible=False)
+        tortue.penup()
+        tortue.setundobuffer(None)
+        self.nombre_creees += 1
+        return tortue
+    
+    def prendre(self, forme):
+        """
+        Fournit une tortue cachée ayant la forme demandée
+        
+        Args:
+            forme (str): Nom de la forme enregistrée ("square", chemin d'image, ...)
+        
+        Returns:
+            turtle.Turtle: Tortue cachée (à positionner puis afficher),
+                ou None si le plafond est atteint et qu'aucune tortue n'est libre
+        """
+        libres = self.libres.get(forme)
+        if libres:
+            self.nombre_libres -= 1
+            return libres.pop()
+        
+        if self.nombre_creees < self.taille_max:
+            tortue = self._creer()
+        else:
+            # Plafond atteint: reprendre une tortue libre d'une autre forme
+            autres = next((liste for liste in self.libres.values() if liste), None)
+            if autres is None:
+                return None
+            self.nombre_libres -= 1
+            tortue = autres.pop()
+        
+        tortue.shape(forme)
+        return tortue
+    
+    def peut_fournir(self):
+        """
+        Indique si prendre() renverra une tortue
+        
+        Returns:
+            bool: True si une tortue est libre ou peut encore être créée
+        """
+        return self.nombre_libres > 0 or self.nombre_creees < self.taille_max
+    
+    def rendre(self, tortue, forme):
+        """
+        Cache une tortue et la remet dans la réserve
+        
+        Args:
+            tortue (turtle.Turtle): Tortue obtenue par prendre()
+            forme (str): Forme de la tortue
+        """
+        tortue.hideturtle()
+        self.libres.setdefault(forme, []).append(tortue)
+        self.nombre_libres += 1
+    
+    def get_statistiques(self):
+        """
+        Retourne l'occupation du pool
+        
+        Returns:
+            dict: Tortues créées, utilisées et libres
+        """
+        return {
+            'creees': self.nombre_creees,
+            'utilisees': self.nombre_creees - self.nombre_libres,
+            'libres': self.nombre_libres,
+        }
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return f"PoolTortues({self.nombre_creees}/{self.taille_max} créées, {self.nombre_libres} libres)"
@@ -0,0 +1,171 @@
+"""
+Module du registre des images de véhicules
+Le dossier d'images est parcouru une seule fois au démarrage: les images
+valides sont enregistrées auprès de l'écran Turtle en une passe, puis les
+créations de voitures ne font plus que des recherches dans des dictionnaires
+(aucun accès disque)
+"""
+
+import os
+import turtle
+
+
+# Dossier des images de véhicules
+DOSSIER_IMAGES = 'images'
+
+# Turtle n'accepte que des images GIF comme formes
+EXTENSIONS_IMAGES = ('.gif',)
+SIGNATURES_GIF = (b'GIF87a', b'GIF89a')
+
+
+class RegistreImages:
+    """Formes Turtle des véhicules, résolues une fois pour toutes"""
+    
+    def __init__(self, dossier=DOSSIER_IMAGES, logger=None):
+        """
+        Initialise le registre (vide tant que charger() n'est pas appelé)
+        
+        Args:
+            dossier (str): Dossier contenant les images
+            logger (Logger, optional): Logger pour les messages de chargement
+        """
+        self.dossier = dossier
+        self.logger = logger
+        self.charge = False
+        
+        # {nom de fichier ou chemin: nom de la forme enregistrée}
+        self.formes = {}
+        # {direction: nom de la forme}
+        self.directions = {}
+        # Images demandées mais introuvables (signalées une seule fois)
+        self.inconnues = set()
+    
+    def _message(self, niveau, texte):
+        """Transmet un message au logger s'il y en a un"""
+        if self.logger is not None:
+            getattr(self.logger, niveau)(texte)
+    
+    # ========== CHARGEMENT (DÉMARRAGE) ==========
+    
+    def _est_image_valide(self, chemin):
+        """
+        Vérifie qu'un fichier est bien une image GIF
+        
+        Args:
+            chemin (str): Chemin du fichier
+        
+        Returns:
+            bool: True si la signature GIF est présente
+        """
+        try:
+            with open(chemin, 'rb') as fichier:
+                return fichier.read(6) in SIGNATURES_GIF
+        except OSError:
+            return False
+    
+    def charger(self, screen=None):
+        """
+        Parcourt le dossier d'images et enregistre les formes valides
+        
+        Args:
+            screen (turtle.Screen, optional): Écran Turtle (écran par défaut si absent)
+        
+        Returns:
+            int: Nombre de formes enregistrées
+        """
+        if self.charge:
+            return len(self.get_formes())
+        self.charge = True
+        
+        try:
+            fichiers = sorted(entree.name for entree in os.scandir(self.dossier) if entree.is_file())
+        except OSError:
+            self._message('avertissement', f"⚠️ Dossier d'images introuvable: {self.dossier}")
+            fichiers = []
+        
+        if screen is None and fichiers:
+            screen = turtle.Screen()
+        
+        nombre = 0
+        for nom in fichiers:
+            if not nom.lower().endswith(EXTENSIONS_IMAGES):
+                continue
+            chemin = os.path.join(self.dossier, nom)
+            if not self._est_image_valide(chemin):
+                self._message('avertissement', f"⚠️ Image ignorée (pas un GIF valide): {chemin}")
+                continue
+            
+            try:
+                screen.register_shape(chemin)
+            except Exception as e:
+                self._message('erreur', f"❌ Erreur lors du chargement de l'image {chemin}: {e}")
+                continue
+            
+            # La forme est retrouvée par son nom de fichier ou par son chemin
+            for cle in (nom, chemin, os.path.normpath(chemin), os.path.abspath(chemin)):
+                self.formes[cle] = chemin
+            nombre += 1
+            self._message('info', f"📝 Image enregistrée: {chemin}")
+        
+        return nombre
+    
+    def definir_directions(self, images_dict):
+        """
+        Associe une image à chaque direction (résolue immédiatement)
+        
+        Args:
+            images_dict (dict): {direction: nom ou chemin de l'image}
+        """
+        self.directions = {}
+        for direction, image_path in images_dict.items():
+            forme = self.resoudre(image_path)
+            if forme is not None:
+                self.directions[direction] = forme
+        self._message('info', f"📷 Images de véhicules configurées: {len(self.directions)} directions")
+    
+    # ========== RECHERCHE (CRÉATION DES VOITURES) ==========
+    
+    def resoudre(self, image_path):
+        """
+        Retrouve la forme enregistrée d'une image, sans accès disque
+        
+        Args:
+            image_path (str): Nom de fichier ou chemin de l'image
+        
+        Returns:
+            str: Nom de la forme, ou None si l'image n'a pas été enregistrée
+        """
+        forme = self.formes.get(image_path)
+        if forme is None:
+            forme = self.formes.get(os.path.basename(image_path))
+        if forme is None and image_path not in self.inconnues:
+            self.inconnues.add(image_path)
+            self._message('avertissement', f"⚠️ Image non trouvée: {image_path}")
+        return forme
+    
+    def forme_pour(self, voiture):
+        """
+        Choisit la forme d'une voiture
+        
+        Args:
+            voiture (Vehicle): Voiture à afficher
+        
+        Returns:
+            str: Nom de la forme, ou None (forme par défaut du rendu)
+        """
+        if voiture.image_path is not None:
+            return self.resoudre(voiture.image_path)
+        return self.directions.get(voiture.direction)
+    
+    def get_formes(self):
+        """
+        Retourne les formes enregistrées
+        
+        Returns:
+            list: Noms des formes (chemins des images), triés
+        """
+        return sorted(set(self.formes.values()))
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return f"RegistreImages({self.dossier!r}, {len(self.get_formes())} formes)"
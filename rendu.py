@@ -0,0 +1,73 @@
+"""
+Module de l'interface de rendu
+Le moteur de simulation ne connaît que cette interface: la classe de base
+n'affiche rien (exécution headless, serveurs, CI) et les adaptateurs
+graphiques (Turtle, ...) la redéfinissent
+"""
+
+
+class Rendu:
+    """Rendu de base: ignore tous les appels (mode headless)"""
+    
+    def ajouter_voiture(self, voiture):
+        """
+        Appelé quand une voiture entre dans la simulation
+        
+        Args:
+            voiture (Vehicle): Voiture créée
+        """
+        pass
+    
+    def retirer_voiture(self, voiture):
+        """
+        Appelé quand une voiture quitte la simulation
+        
+        Args:
+            voiture (Vehicle): Voiture supprimée
+        """
+        pass
+    
+    def actualiser_voitures(self, voitures):
+        """
+        Appelé une fois par tick avec les voitures actives
+        
+        Args:
+            voitures (list): Voitures à afficher à leur position courante
+        """
+        pass
+    
+    def actualiser_feu(self, etat_ns, etat_eo):
+        """
+        Appelé quand l'état des feux change
+        
+        Args:
+            etat_ns (str): État des feux Nord et Sud
+            etat_eo (str): État des feux Est et Ouest
+        """
+        pass
+    
+    def clignoter_orange(self, visible):
+        """
+        Appelé à chaque alternance du clignotant (mode nuit)
+        
+        Args:
+            visible (bool): True si les feux orange sont allumés
+        """
+        pass
+    
+    def afficher_nombre_voitures(self, nombre):
+        """
+        Appelé quand le nombre de voitures actives change
+        
+        Args:
+            nombre (int): Nombre de voitures actives
+        """
+        pass
+    
+    def rafraichir(self):
+        """Affiche l'image courante"""
+        pass
+    
+    def fermer(self):
+        """Libère les ressources du rendu"""
+        pass
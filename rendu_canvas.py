@@ -0,0 +1,161 @@
+"""
+Module du rendu Canvas des véhicules
+Les voitures sont des éléments bruts (image ou rectangle) du Canvas Tk de la
+TurtleScene, déplacés directement avec move(): aucune tortue par voiture.
+Turtle ne sert plus qu'au dessin du carrefour et des feux
+"""
+
+import time
+import tkinter as tk
+
+from rendu_scene import RenduScene
+from vehicles import HORIZONTALES
+
+
+# Étiquette commune à tous les éléments de voitures du Canvas
+ETIQUETTE_VOITURES = "voiture"
+
+# Dimensions du rectangle par défaut (longueur, largeur), comme la forme Turtle
+LONGUEUR_VOITURE = 30
+LARGEUR_VOITURE = 16
+
+# Rayon du point d'une voiture en affichage simplifié (trafic dense)
+RAYON_POINT = 4
+
+
+class RenduCanvas(RenduScene):
+    """Rendu des voitures sur le Canvas Tk (feux et interface de RenduScene)"""
+    
+    def __init__(self, scene, gui=None, logger=None, registre=None, niveau_detail=None):
+        """
+        Initialise le rendu
+        
+        Args:
+            scene (TurtleScene): Scène Turtle dont le Canvas reçoit les voitures
+            gui (SimulationGUI, optional): Interface à tenir à jour
+            logger (Logger, optional): Logger pour les messages de chargement
+            registre (RegistreImages, optional): Images de véhicules
+            niveau_detail (NiveauDetail, optional): Bascule vers des points en trafic dense
+        """
+        super().__init__(scene, gui, logger, registre, niveau_detail)
+        self.canvas = scene.get_canvas()
+        
+        # Images Tk chargées une fois, par forme du registre
+        self.images = {}
+        for forme in self.registre.get_formes():
+            try:
+                self.images[forme] = tk.PhotoImage(file=forme, master=self.canvas)
+            except tk.TclError as e:
+                self._message('erreur', f"❌ Erreur lors du chargement de l'image {forme}: {e}")
+        
+        # Élément Canvas par id de voiture
+        self.elements = {}
+        # Apparence détaillée par id de voiture: (image, couleur, demi-longueurs)
+        self.apparences = {}
+    
+    # ========== VOITURES ==========
+    
+    def ajouter_voiture(self, voiture):
+        """
+        Crée l'élément Canvas d'une voiture
+        
+        Args:
+            voiture (Vehicle): Voiture créée
+        """
+        image = self.images.get(self.registre.forme_pour(voiture))
+        if image is not None:
+            self.apparences[voiture.id] = (image, "black", RAYON_POINT, RAYON_POINT)
+        else:
+            # Rectangle orienté dans le sens de circulation
+            if HORIZONTALES[voiture.code_direction]:
+                demi_x, demi_y = LONGUEUR_VOITURE / 2, LARGEUR_VOITURE / 2
+            else:
+                demi_x, demi_y = LARGEUR_VOITURE / 2, LONGUEUR_VOITURE / 2
+            self.apparences[voiture.id] = (None, self._couleur_aleatoire(), demi_x, demi_y)
+        
+        self.elements[voiture.id] = self._creer_element(voiture.id, voiture.x, voiture.y)
+        self.positions[voiture.id] = (voiture.x, voiture.y)
+    
+    def _creer_element(self, id_voiture, x, y):
+        """
+        Crée l'élément Canvas d'une voiture au niveau de détail courant
+        
+        Args:
+            id_voiture (int): Id de la voiture
+            x (float): Abscisse Turtle
+            y (float): Ordonnée Turtle
+        
+        Returns:
+            int: Identifiant de l'élément Canvas
+        """
+        image, couleur, demi_x, demi_y = self.apparences[id_voiture]
+        y = -y
+        
+        if self.simplifie:
+            return self.canvas.create_oval(
+                x - RAYON_POINT, y - RAYON_POINT, x + RAYON_POINT, y + RAYON_POINT,
+                fill=couleur, outline="", tags=ETIQUETTE_VOITURES
+            )
+        if image is not None:
+            return self.canvas.create_image(x, y, image=image, tags=ETIQUETTE_VOITURES)
+        return self.canvas.create_rectangle(
+            x - demi_x, y - demi_y, x + demi_x, y + demi_y,
+            fill=couleur, outline="black", tags=ETIQUETTE_VOITURES
+        )
+    
+    def retirer_voiture(self, voiture):
+        """
+        Supprime l'élément Canvas d'une voiture
+        
+        Args:
+            voiture (Vehicle): Voiture supprimée
+        """
+        element = self.elements.pop(voiture.id, None)
+        self.positions.pop(voiture.id, None)
+        self.apparences.pop(voiture.id, None)
+        if element is not None:
+            self.canvas.delete(element)
+    
+    def actualiser_voitures(self, voitures):
+        """
+        Déplace les éléments des voitures qui ont bougé (un move() par voiture,
+        redessinés ensemble par Tk à la fin de l'image)
+        
+        Args:
+            voitures (list): Voitures actives
+        """
+        positions = self.positions
+        elements = self.elements
+        deplacer = self.canvas.move
+        for voiture in voitures:
+            ancienne = positions.get(voiture.id)
+            if ancienne is None:
+                continue
+            x, y = voiture.x, voiture.y
+            if ancienne[0] != x or ancienne[1] != y:
+                deplacer(elements[voiture.id], x - ancienne[0], ancienne[1] - y)
+                positions[voiture.id] = (x, y)
+    
+    def _appliquer_niveau_detail(self):
+        """Recrée les éléments de toutes les voitures au nouveau niveau de détail"""
+        self.canvas.delete(ETIQUETTE_VOITURES)
+        for id_voiture, (x, y) in self.positions.items():
+            self.elements[id_voiture] = self._creer_element(id_voiture, x, y)
+    
+    # ========== FEUX ET INTERFACE ==========
+    
+    def rafraichir(self):
+        """Rafraîchit les tortues de la scène (feux) si besoin; Tk redessine les voitures"""
+        debut = time.perf_counter()
+        # Dessin des voitures déplacées inclus dans la durée mesurée
+        self.canvas.update_idletasks()
+        if self.scene is not None:
+            self.scene.update()
+        self._ajuster_niveau_detail(time.perf_counter() - debut)
+    
+    def fermer(self):
+        """Supprime tous les éléments de voitures"""
+        self.canvas.delete(ETIQUETTE_VOITURES)
+        self.elements.clear()
+        self.positions.clear()
+        self.apparences.clear()
@@ -0,0 +1,115 @@
+"""
+Module de la base commune des rendus graphiques
+Feux, indicateurs de l'interface Tkinter et niveau de détail, partagés par le
+rendu Turtle (une tortue par voiture) et le rendu Canvas (éléments Tk bruts)
+"""
+
+import random
+
+from rendu import Rendu
+from registre_images import RegistreImages
+from niveau_detail import NiveauDetail
+
+
+class RenduScene(Rendu):
+    """Rendu graphique d'une TurtleScene: feux, interface et niveau de détail"""
+    
+    def __init__(self, scene=None, gui=None, logger=None, registre=None, niveau_detail=None):
+        """
+        Initialise les attributs communs aux rendus graphiques
+        
+        Args:
+            scene (TurtleScene, optional): Scène Turtle (carrefour et feux)
+            gui (SimulationGUI, optional): Interface à tenir à jour
+            logger (Logger, optional): Logger pour les messages de chargement
+            registre (RegistreImages, optional): Images de véhicules (dossier
+                'images' chargé ici si absent)
+            niveau_detail (NiveauDetail, optional): Bascule vers un affichage simplifié
+                en trafic dense (seuils par défaut si absent)
+        """
+        self.scene = scene
+        self.gui = gui
+        self.logger = logger
+        
+        # Images enregistrées une seule fois, avant la première voiture
+        self.registre = registre if registre is not None else RegistreImages(logger=logger)
+        self.registre.charger(scene.screen if scene is not None else None)
+        
+        # Dernière position affichée par id de voiture
+        self.positions = {}
+        
+        # Niveau de détail: images, ou formes simples quand la charge est trop forte
+        self.niveau_detail = niveau_detail if niveau_detail is not None else NiveauDetail()
+        self.simplifie = False
+    
+    def _message(self, niveau, texte):
+        """Transmet un message au logger s'il y en a un"""
+        if self.logger is not None:
+            getattr(self.logger, niveau)(texte)
+    
+    def _couleur_aleatoire(self):
+        """
+        Génère une couleur aléatoire pour la voiture
+        
+        Returns:
+            str: Nom de la couleur
+        """
+        couleurs = [
+            'blue', 'purple', 'brown', 'pink',
+            'cyan', 'magenta', 'navy', 'teal',
+            'maroon', 'olive', 'coral', 'tomato'
+        ]
+        return random.choice(couleurs)
+    
+    # ========== NIVEAU DE DÉTAIL ==========
+    
+    def _appliquer_niveau_detail(self):
+        """Redessine toutes les voitures affichées au nouveau niveau de détail"""
+        pass
+    
+    def _ajuster_niveau_detail(self, duree_image):
+        """
+        Change de niveau de détail si la charge l'exige
+        
+        Args:
+            duree_image (float): Durée du dernier rafraîchissement en secondes
+        """
+        simplifie = self.niveau_detail.evaluer(len(self.positions), duree_image)
+        if simplifie != self.simplifie:
+            self.simplifie = simplifie
+            self._appliquer_niveau_detail()
+            if simplifie:
+                self._message('info', f"🔻 Affichage simplifié ({len(self.positions)} voitures)")
+            else:
+                self._message('info', f"🔺 Affichage détaillé rétabli ({len(self.positions)} voitures)")
+    
+    # ========== FEUX ET INTERFACE ==========
+    
+    def actualiser_feu(self, etat_ns, etat_eo):
+        """
+        Met à jour les feux de la scène et l'indicateur de l'interface
+        
+        Args:
+            etat_ns (str): État des feux Nord et Sud
+            etat_eo (str): État des feux Est et Ouest
+        """
+        if self.scene is not None:
+            self.scene.actualiser_feu(etat_ns, etat_eo)
+        if self.gui is not None:
+            try:
+                self.gui.update_feu(f"NS:{etat_ns} | EO:{etat_eo}")
+            except:
+                pass
+    
+    def clignoter_orange(self, visible):
+        """Fait clignoter les feux orange de la scène (mode nuit)"""
+        if self.scene is not None:
+            self.scene.clignoter_orange(visible)
+    
+    def afficher_nombre_voitures(self, nombre):
+        """Met à jour le compteur de voitures de l'interface"""
+        if self.gui is not None:
+            try:
+                self.gui.update_voitures(nombre)
+            except:
+                pass  # Ignorer les erreurs si l'interface est fermée
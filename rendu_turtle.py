@@ -0,0 +1,193 @@
+"""
+Module de l'adaptateur de rendu Turtle
+Affiche les voitures et les feux du moteur de simulation dans une TurtleScene
+et tient à jour les indicateurs de l'interface Tkinter
+"""
+
+import time
+import turtle
+
+from rendu_scene import RenduScene
+from pool_tortues import PoolTortues, TAILLE_MAX_DEFAUT
+
+
+# Forme utilisée quand l'image d'une voiture est introuvable
+FORME_DEFAUT = "square"
+
+# Forme des voitures en affichage simplifié (trafic dense)
+FORME_SIMPLIFIEE = "circle"
+TAILLE_SIMPLIFIEE = 0.4
+
+
+class RenduTurtle(RenduScene):
+    """Rendu graphique avec Turtle (une tortue réutilisable par voiture affichée)"""
+    
+    # Orientation de la tortue selon la direction
+    CAPS = {'est': 0, 'nord': 90, 'ouest': 180, 'sud': 270}
+    
+    def __init__(self, scene=None, gui=None, logger=None, taille_pool=TAILLE_MAX_DEFAUT,
+                 registre=None, niveau_detail=None):
+        """
+        Initialise le rendu
+        
+        Args:
+            scene (TurtleScene, optional): Scène Turtle (carrefour et feux)
+            gui (SimulationGUI, optional): Interface à tenir à jour
+            logger (Logger, optional): Logger pour les messages de chargement
+            taille_pool (int): Nombre maximal de tortues de voitures
+            registre (RegistreImages, optional): Images de véhicules (dossier
+                'images' chargé ici si absent)
+            niveau_detail (NiveauDetail, optional): Bascule vers des formes simples
+                en trafic dense (seuils par défaut si absent)
+        """
+        super().__init__(scene, gui, logger, registre, niveau_detail)
+        
+        # Tortues réutilisées d'une voiture à l'autre
+        self.pool = PoolTortues(taille_pool)
+        
+        # Tortues par id de voiture, avec leur forme
+        self.tortues = {}
+        self.formes = {}
+        
+        # Voitures sans tortue (pool plein), affichées dès qu'une tortue se libère
+        self.en_attente = {}
+        
+        # True si une voiture a été affichée, déplacée ou cachée depuis le dernier rafraîchissement
+        self.voitures_modifiees = False
+    
+    # ========== VOITURES ==========
+    
+    def ajouter_voiture(self, voiture):
+        """
+        Affiche une voiture avec une tortue prise dans le pool
+        
+        Args:
+            voiture (Vehicle): Voiture créée
+        """
+        # Forme déjà enregistrée (image de la voiture ou de sa direction)
+        forme = self.registre.forme_pour(voiture)
+        if forme is None:
+            forme = FORME_DEFAUT
+        
+        tortue = self.pool.prendre(forme)
+        if tortue is None:
+            if not self.en_attente:
+                self._message('avertissement',
+                              f"⚠️ Pool de tortues plein: voiture #{voiture.id} affichée plus tard")
+            self.en_attente[voiture.id] = voiture
+            return
+        
+        if forme == FORME_DEFAUT:
+            tortue.color(self._couleur_aleatoire())
+        self._habiller(tortue, forme)
+        
+        # Positionner la tortue encore cachée, puis l'afficher
+        tortue.goto(voiture.x, voiture.y)
+        tortue.setheading(self.CAPS[voiture.direction])
+        tortue.showturtle()
+        self.voitures_modifiees = True
+        
+        self.tortues[voiture.id] = tortue
+        self.formes[voiture.id] = forme
+        self.positions[voiture.id] = (voiture.x, voiture.y)
+    
+    def retirer_voiture(self, voiture):
+        """
+        Rend au pool la tortue d'une voiture supprimée
+        
+        Args:
+            voiture (Vehicle): Voiture supprimée
+        """
+        self.en_attente.pop(voiture.id, None)
+        tortue = self.tortues.pop(voiture.id, None)
+        forme = self.formes.pop(voiture.id, None)
+        self.positions.pop(voiture.id, None)
+        if tortue is not None:
+            self._rendre_tortue(tortue, forme)
+            self.voitures_modifiees = True
+    
+    def actualiser_voitures(self, voitures):
+        """
+        Déplace les tortues des voitures qui ont bougé
+        
+        Args:
+            voitures (list): Voitures actives
+        """
+        for voiture in voitures:
+            position = (voiture.x, voiture.y)
+            if self.positions.get(voiture.id) != position:
+                tortue = self.tortues.get(voiture.id)
+                if tortue is not None:
+                    tortue.goto(position)
+                    self.voitures_modifiees = True
+                    self.positions[voiture.id] = position
+    
+    def _afficher_en_attente(self):
+        """Donne une tortue aux voitures en attente, tant que le pool en fournit"""
+        while self.en_attente and self.pool.peut_fournir():
+            id_voiture = next(iter(self.en_attente))
+            self.ajouter_voiture(self.en_attente.pop(id_voiture))
+    
+    # ========== NIVEAU DE DÉTAIL ==========
+    
+    def _habiller(self, tortue, forme):
+        """
+        Donne à une tortue l'apparence du niveau de détail courant
+        
+        Args:
+            tortue (turtle.Turtle): Tortue d'une voiture
+            forme (str): Forme détaillée de la voiture
+        """
+        if self.simplifie:
+            tortue.shape(FORME_SIMPLIFIEE)
+            tortue.shapesize(TAILLE_SIMPLIFIEE)
+        else:
+            tortue.shape(forme)
+            if forme == FORME_DEFAUT:
+                # Forme rectangulaire par défaut
+                tortue.shapesize(0.8, 1.5)
+    
+    def _rendre_tortue(self, tortue, forme):
+        """
+        Rend une tortue au pool sous sa forme détaillée (le pool range par forme)
+        
+        Args:
+            tortue (turtle.Turtle): Tortue d'une voiture retirée
+            forme (str): Forme détaillée de la voiture
+        """
+        if self.simplifie:
+            tortue.shape(forme)
+        self.pool.rendre(tortue, forme)
+    
+    def _appliquer_niveau_detail(self):
+        """Redessine toutes les voitures affichées au nouveau niveau de détail"""
+        for id_voiture, tortue in self.tortues.items():
+            self._habiller(tortue, self.formes[id_voiture])
+        self.voitures_modifiees = True
+    
+    # ========== FEUX ET INTERFACE ==========
+    
+    def rafraichir(self):
+        """Rafraîchit l'écran Turtle, sauf si rien n'a changé (voitures arrêtées, pause)"""
+        if self.en_attente:
+            self._afficher_en_attente()
+        
+        debut = time.perf_counter()
+        if self.scene is not None:
+            if self.voitures_modifiees:
+                self.scene.marquer_modifiee()
+            self.scene.update()
+        elif self.voitures_modifiees:
+            turtle.Screen().update()
+        self.voitures_modifiees = False
+        self._ajuster_niveau_detail(time.perf_counter() - debut)
+    
+    def fermer(self):
+        """Cache toutes les tortues de voitures et les rend au pool"""
+        for id_voiture, tortue in self.tortues.items():
+            self._rendre_tortue(tortue, self.formes[id_voiture])
+            self.voitures_modifiees = True
+        self.tortues.clear()
+        self.formes.clear()
+        self.positions.clear()
+        self.en_attente.clear()
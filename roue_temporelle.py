@@ -0,0 +1,86 @@
+"""
+Module de la roue temporelle
+Planificateur à cases indexées par numéro de tick: planifier et vérifier
+les échéances du tick courant coûte O(1), quel que soit le nombre d'échéances
+"""
+
+
+class RoueTemporelle:
+    """Roue temporelle (timer wheel) à une case par tick"""
+    
+    def __init__(self, taille=256):
+        """
+        Initialise la roue
+        
+        Args:
+            taille (int): Nombre de cases; une échéance plus lointaine attend
+                simplement que la roue ait fait le nombre de tours nécessaire
+        """
+        if taille <= 0:
+            raise ValueError("La roue doit avoir au moins une case")
+        self.taille = taille
+        self.cases = [[] for _ in range(taille)]
+        self.nombre = 0
+    
+    def __len__(self):
+        return self.nombre
+    
+    def planifier(self, tick, action, *args):
+        """
+        Programme une action
+        
+        Args:
+            tick (int): Tick auquel exécuter l'action
+            action (callable): Fonction à appeler
+            *args: Arguments de l'action
+        
+        Returns:
+            list: Entrée planifiée (à passer à annuler())
+        """
+        entree = [tick, action, args, True]
+        self.cases[tick % self.taille].append(entree)
+        self.nombre += 1
+        return entree
+    
+    def annuler(self, entree):
+        """
+        Annule une action planifiée (retirée au passage de sa case)
+        
+        Args:
+            entree (list): Entrée retournée par planifier()
+        """
+        entree[3] = False
+    
+    def avancer(self, tick):
+        """
+        Exécute les actions arrivées à échéance au tick donné
+        
+        Args:
+            tick (int): Tick courant
+        
+        Returns:
+            int: Nombre d'actions exécutées
+        """
+        case = self.cases[tick % self.taille]
+        if not case:
+            return 0
+        
+        echues = [entree for entree in case if entree[0] <= tick]
+        if not echues:
+            return 0
+        
+        case[:] = [entree for entree in case if entree[0] > tick]
+        self.nombre -= len(echues)
+        
+        executees = 0
+        for _, action, args, active in echues:
+            if active:
+                action(*args)
+                executees += 1
+        return executees
+    
+    def vider(self):
+        """Supprime toutes les actions planifiées"""
+        for case in self.cases:
+            case.clear()
+        self.nombre = 0
@@ -5,6 +5,8 @@ Définit les 4 scénarios selon le cahier des charges
 
 from abc import ABC, abstractmethod
 
+from plan_feux import compiler_plan_feux
+
 
 class Scenario(ABC):
     """Classe abstraite pour les scénarios de circulation"""
@@ -17,6 +19,7 @@ class Scenario(ABC):
             nom (str): Nom du scénario
         """
         self.nom = nom
+        self._plan_feux = None
     
     @abstractmethod
     def get_durees_feu(self):
@@ -38,6 +41,26 @@ class Scenario(ABC):
         """
         pass
     
+    def get_config_journalisation(self):
+        """
+        Retourne la politique de journalisation du scénario
+        
+        Returns:
+            dict: Configuration de PolitiqueJournalisation ({} = détail complet)
+        """
+        return {}
+    
+    def get_plan_feux(self):
+        """
+        Retourne le plan de feux du cycle automatique, compilé une seule fois
+        
+        Returns:
+            PlanFeux: Plan immuable (états et durées de chaque phase)
+        """
+        if self._plan_feux is None:
+            self._plan_feux = compiler_plan_feux(self.get_durees_feu())
+        return self._plan_feux
+    
     def __str__(self):
         """Représentation textuelle du scénario"""
         return f"Scénario: {self.nom}"
@@ -111,6 +134,18 @@ class HeureDePointe(Scenario):
             'acceleration': 0.2,       # Démarrage lent
             'deceleration': 0.7        # Freinage normal
         }
+    
+    def get_config_journalisation(self):
+        """
+        Journalisation allégée pour trafic dense
+        
+        Returns:
+            dict: Résumés par direction au lieu des événements par voiture
+        """
+        return {
+            'resume_voitures': True,   # Comptages par direction, pas de ligne par voiture
+            'intervalle_resume': 10.0  # Un résumé toutes les 10 secondes
+        }
 
 
 class ModeNuit(Scenario):
@@ -181,6 +216,15 @@ class ModeManuel(Scenario):
             'acceleration': 0.5,       # Accélération normale
             'deceleration': 0.8        # Freinage normal
         }
+    
+    def get_config_journalisation(self):
+        """
+        Journalisation complète pour le mode manuel
+        
+        Returns:
+            dict: Aucun filtrage (chaque arrêt/démarrage est journalisé)
+        """
+        return {}
 
 
 # Fonction utilitaire pour obtenir tous les scénarios
@@ -0,0 +1,724 @@
+"""
+Module du moteur de simulation headless
+Logique du carrefour (cycle des feux, création et conduite des voitures)
+sans aucune dépendance graphique: l'affichage passe par un Rendu optionnel
+"""
+
+import time
+import math
+import random
+
+from logger import Logger
+from sinks import NIVEAU_DEBUG
+from horloge import HorlogeSimulation
+from roue_temporelle import RoueTemporelle
+from traffic_light import TrafficLight
+from scenarios import CirculationNormale, ModeNuit, ModeManuel, get_scenario_par_nom
+from vehicle_manager import VehicleManager, progression
+from moteur_vectoriel import MoteurVectoriel, NUMPY_DISPONIBLE
+from vehicles import DIRECTIONS, HORIZONTALES, SENS
+from rendu import Rendu
+
+
+DISTANCE_SECURITE = 45  # Distance de sécurité entre les voiture
+
+# Géométrie le long du sens de circulation (identique pour les 4 directions)
+LIGNE_ARRET = 100   # Ligne d'arrêt avant le passage piéton
+ZONE_ARRET = 40     # Profondeur de la zone où le feu est respecté
+LIMITE_ECRAN = 400  # Au-delà, la voiture est supprimée
+
+# Mode événements discrets: nombre maximal de ticks normaux entre deux
+# recherches de saut infructueuses
+RECUL_MAX = 16
+
+# Vecteur de déplacement par code de direction
+DEPLACEMENTS = tuple((sens, 0) if horizontale else (0, sens)
+                     for horizontale, sens in zip(HORIZONTALES, SENS))
+
+# Positions de spawn selon la direction
+POSITIONS_SPAWN = {
+    'est': (-350, 25),      # Vient de l'ouest
+    'ouest': (350, -25),     # Vient de l'est
+    'nord': (25, -350),      # Vient du sud
+    'sud': (-25, 350),       # Vient du nord
+}
+
+
+class MoteurSimulation:
+    """Simulation du carrefour, indépendante de l'affichage"""
+    
+    def __init__(self, logger, rendu=None, scenario=None, vectoriel=False,
+                 horloge=None, graine=None):
+        """
+        Initialise le moteur
+        
+        Args:
+            logger (Logger): Instance du logger
+            rendu (Rendu, optional): Affichage (None = headless)
+            scenario (Scenario, optional): Scénario initial (Circulation Normale par défaut)
+            vectoriel (bool): Utiliser le moteur NumPy si NumPy est installé
+            horloge (HorlogeSimulation, optional): Horloge simulée (pas de 50 ms par défaut)
+            graine (int, optional): Graine du hasard, pour des exécutions reproductibles
+        """
+        self.logger = logger
+        self.horloge = horloge if horloge is not None else HorlogeSimulation()
+        self.aleatoire = random.Random(graine)
+        self.rendu = rendu if rendu is not None else Rendu()
+        # Débits et résumés du journal mesurés en temps simulé
+        self.logger.definir_horloge(self.horloge.maintenant)
+        self._definir_scenario(scenario if scenario is not None else CirculationNormale())
+        
+        self.traffic_light = TrafficLight(self.logger)
+        # État du feu vu par chaque direction (indexé par code), tenu à jour par notification
+        self.etats_feu = [self.traffic_light.get_etat_pour_direction(direction)
+                          for direction in DIRECTIONS]
+        self.traffic_light.abonner(self._feu_change)
+        
+        self.moteur = None
+        if vectoriel and NUMPY_DISPONIBLE:
+            self.moteur = MoteurVectoriel(distance_securite=DISTANCE_SECURITE)
+        self.vehicle_manager = VehicleManager(self.logger, moteur=self.moteur, rendu=self.rendu,
+                                              facteur_pas=self.horloge.facteur)
+        
+        # Variables de simulation
+        self.running = False
+        self.paused = False
+        self.temps_dernier_spawn = self.horloge.maintenant()
+        self.etat_clignotant = False
+        self.index_etat_feu = 0
+        
+        # Changements de feu planifiés (phase suivante, clignotement)
+        self.roue = RoueTemporelle()
+        self.echeance_feu = None
+        self.entree_feu = None  # Entrée de la roue, annulée si le plan change
+        
+        # Ticks franchis d'un coup en mode événements discrets
+        self.ticks_sautes = 0
+    
+    @property
+    def tick(self):
+        """Numéro du tick de simulation (journalisé avec les événements)"""
+        return self.horloge.tick
+    
+    # ========== VOITURES ==========
+    
+    def creer_voitures_initiales(self):
+        """Crée quelques voitures au démarrage pour montrer le carrefour"""
+        self.logger.info("\n🚗 Création des voitures initiales...")
+        config = self.config_voitures
+        
+        # Créer 8 voitures au départ (2 par direction)
+        positions = [
+            # Direction EST (vient de l'ouest, va vers l'est)
+            (-350, 25, 'est'),
+            (-250, 25, 'est'),
+            
+            # Direction OUEST (vient de l'est, va vers l'ouest)
+            (350, -25, 'ouest'),
+            (250, -25, 'ouest'),
+            
+            # Direction NORD (vient du sud, va vers le nord)
+            (25, -350, 'nord'),
+            (25, -250, 'nord'),
+            
+            # Direction SUD (vient du nord, va vers le sud)
+            (-25, 350, 'sud'),
+            (-25, 250, 'sud'),
+        ]
+        
+        for x, y, direction in positions:
+            voiture = self.vehicle_manager.ajouter_voiture(x, y, direction, config)
+            # IMPORTANT: Voitures IMMOBILES au départ
+            voiture.vitesse = 0  # ✅ Changé de 2.0 à 0 - immobile jusqu'au Play
+            
+            self.logger.debug(f"   🚗 Voiture #{voiture.id} créée à ({x}, {y}) - {direction} - IMMOBILE")
+        
+        self.rendu.afficher_nombre_voitures(self.vehicle_manager.get_nombre_voitures())
+        
+        self.logger.info(f"✅ {self.vehicle_manager.get_nombre_voitures()} voitures créées et prêtes à rouler")
+    
+    def creer_voiture(self, vitesse=None):
+        """
+        Crée une nouvelle voiture sur une entrée choisie au hasard
+        
+        Args:
+            vitesse (float, optional): Vitesse initiale en unités par pas de 50 ms,
+                convertie au pas de l'horloge comme le profil (celle du scénario par défaut)
+        
+        Returns:
+            Vehicle: La voiture créée
+        """
+        config = self.config_voitures
+        
+        # Choisir aléatoirement une direction
+        direction = self.aleatoire.choice(['est', 'ouest', 'nord', 'sud'])
+        x, y = POSITIONS_SPAWN[direction]
+        
+        voiture = self.vehicle_manager.ajouter_voiture(x, y, direction, config)
+        if vitesse is not None:
+            voiture.vitesse = vitesse * self.horloge.facteur
+        
+        self.rendu.afficher_nombre_voitures(self.vehicle_manager.get_nombre_voitures())
+        
+        if self.logger.est_actif(NIVEAU_DEBUG):
+            self.logger.debug(f"🚗 Voiture #{voiture.id} créée à ({voiture.x}, {voiture.y}) - Direction: {direction}")
+        return voiture
+    
+    def voiture_devant(self, voiture):
+        """Retourne la voiture qui précède dans la même voie (voir VehicleManager)"""
+        return self.vehicle_manager.get_voiture_devant(voiture)
+    
+    def _supprimer_voiture(self, voiture):
+        """Supprime une voiture sortie de l'écran et met à jour le compteur"""
+        self.vehicle_manager.supprimer_voiture(voiture)
+        self.rendu.afficher_nombre_voitures(self.vehicle_manager.get_nombre_voitures())
+    
+    def gerer_voitures(self):
+        """
+        Gère le comportement des voitures avec détection automatique des dangers
+        Les voitures s'arrêtent AVANT les passages piétons
+        """
+        if self.moteur is not None:
+            self.gerer_voitures_vectoriel()
+            return
+        
+        # Voies triées une fois par tick: voisines accessibles en O(1)
+        self.vehicle_manager.mettre_a_jour_voies()
+        
+        for voiture in self.vehicle_manager.voitures[:]:
+            if not voiture.actif:
+                continue
+            
+            # Récupérer l'état du feu SPÉCIFIQUE à cette direction
+            code = voiture.code_direction
+            etat_feu_voiture = self.etats_feu[code]
+            
+            # Vérifier si la voiture est avant le feu (la ligne d'arrêt, AVANT le
+            # passage piéton, est à la même progression dans les 4 directions)
+            est_avant_feu = LIGNE_ARRET - ZONE_ARRET < progression(voiture) < LIGNE_ARRET
+            
+            if voiture.detection_active:
+                # Détecter les dangers (collisions + feux rouges)
+                dangers = self.vehicle_manager.detecter_danger(voiture, [self.traffic_light])
+                
+                # Comportement selon l'état du feu ET les dangers détectés
+                if est_avant_feu:
+                    if etat_feu_voiture == TrafficLight.ROUGE or dangers['collision_imminente']:
+                        voiture.arreter()
+                    elif etat_feu_voiture == TrafficLight.VERT and not dangers['collision_imminente']:
+                        voiture.demarrer()
+                    elif etat_feu_voiture == TrafficLight.ORANGE:
+                        if voiture.vitesse > 0:
+                            voiture.arreter()
+                else:
+                    # Après le feu, vérifier quand même les collisions
+                    if dangers['collision_imminente']:
+                        voiture.arreter()
+                    else:
+                        voiture.demarrer()
+            else:
+                # Mode simple (sans détection)
+                if est_avant_feu:
+                    if etat_feu_voiture == TrafficLight.ROUGE:
+                        voiture.arreter()
+                    elif etat_feu_voiture == TrafficLight.VERT:
+                        voiture.demarrer()
+                    elif etat_feu_voiture == TrafficLight.ORANGE:
+                        if voiture.vitesse > 0:
+                            voiture.arreter()
+                else:
+                    voiture.demarrer()
+            
+            voiture_devant = self.voiture_devant(voiture)
+            
+            if voiture_devant:
+                if HORIZONTALES[code]:
+                    distance = abs(voiture_devant.x - voiture.x)
+                else:
+                    distance = abs(voiture_devant.y - voiture.y)
+                
+                if distance < DISTANCE_SECURITE:
+                    voiture.arreter()
+                    continue
+            # Faire avancer la voiture
+            voiture.avancer()
+            
+            # Supprimer si hors écran
+            if voiture.est_hors_ecran():
+                self._supprimer_voiture(voiture)
+    
+    def gerer_voitures_vectoriel(self):
+        """Même comportement que gerer_voitures, calculé en un tick NumPy"""
+        for voiture in self.moteur.etape(self.etats_feu):
+            self._supprimer_voiture(voiture)
+    
+    # ========== FEUX ==========
+    
+    def _appliquer_feux(self, etat_ns, etat_eo, forcer=False):
+        """
+        Change l'état des deux axes (le rendu est prévenu par _feu_change)
+        
+        Args:
+            etat_ns (str): État Nord/Sud
+            etat_eo (str): État Est/Ouest
+            forcer (bool): Ignorer la table des transitions (début de cycle)
+        """
+        self.traffic_light.definir_etats(etat_ns, etat_eo, forcer=forcer)
+    
+    def _feu_change(self, etat_ns, etat_eo, ancien_ns, ancien_eo):
+        """
+        Abonné du feu: appelé uniquement quand un état change réellement
+        
+        Args:
+            etat_ns (str): Nouvel état Nord/Sud
+            etat_eo (str): Nouvel état Est/Ouest
+            ancien_ns (str): Ancien état Nord/Sud
+            ancien_eo (str): Ancien état Est/Ouest
+        """
+        for code, direction in enumerate(DIRECTIONS):
+            self.etats_feu[code] = self.traffic_light.get_etat_pour_direction(direction)
+        self.rendu.actualiser_feu(etat_ns, etat_eo)
+    
+    def _commencer_cycle(self):
+        """Place le feu dans la première phase du plan (VERT pour Nord/Sud)"""
+        self.index_etat_feu = 0
+        self._appliquer_feux(self.plan_feux.etats_nord_sud[0],
+                             self.plan_feux.etats_est_ouest[0], forcer=True)
+    
+    def changer_feu_manuel(self, etat):
+        """
+        Change manuellement l'état du feu (Mode Manuel)
+        
+        Args:
+            etat (str): État du feu (ROUGE, ORANGE, VERT)
+        
+        Returns:
+            bool: True si le changement a été appliqué
+        """
+        if not (isinstance(self.scenario, ModeManuel) and self.running):
+            return False
+        
+        # En mode manuel, changer les deux axes ensemble
+        self._appliquer_feux(etat, etat)
+        
+        self.logger.log_personnalise(
+            "FEU_MANUEL",
+            f"Changement manuel → {etat}",
+            etat_feu=etat
+        )
+        
+        self.logger.info(f"🚦 Changement manuel: {etat}")
+        return True
+    
+    # ========== CYCLE DE VIE ==========
+    
+    def changer_scenario(self, nom_scenario):
+        """
+        Change le scénario de circulation
+        
+        Args:
+            nom_scenario (str): Nom du scénario
+        """
+        ancien_scenario = self.scenario.nom
+        
+        scenario = get_scenario_par_nom(nom_scenario)
+        if scenario is None:
+            raise ValueError(f"Scénario inconnu: {nom_scenario}")
+        self._definir_scenario(scenario)
+        
+        if isinstance(self.scenario, ModeManuel):
+            self.traffic_light.desactiver_mode_automatique()
+        else:
+            self.traffic_light.activer_mode_automatique()
+        
+        # Activer le clignotant pour le mode nuit
+        if isinstance(self.scenario, ModeNuit):
+            self.traffic_light.activer_clignotant()
+        
+        self.logger.log_changement_scenario(ancien_scenario, nom_scenario)
+        
+        self.logger.info(f"📊 Scénario changé: {ancien_scenario} → {nom_scenario}")
+        
+        if self.running:
+            self.index_etat_feu = 0
+            if not isinstance(self.scenario, (ModeNuit, ModeManuel)):
+                self._commencer_cycle()
+            self._programmer_feux()
+    
+    def _definir_scenario(self, scenario):
+        """
+        Installe un scénario et met en cache ses paramètres (lus à chaque tick)
+        
+        Args:
+            scenario (Scenario): Nouveau scénario
+        """
+        self.scenario = scenario
+        self.plan_feux = scenario.get_plan_feux()
+        self.config_voitures = scenario.get_config_voitures()
+        self.logger.definir_politique(scenario.get_config_journalisation())
+    
+    def demarrer(self):
+        """
+        Démarre la simulation
+        
+        Returns:
+            bool: False si la simulation tournait déjà
+        """
+        if self.running:
+            return False
+        
+        self.running = True
+        self.paused = False
+        
+        # Les voitures pourront détecter automatiquement les feux rouges
+        self.vehicle_manager.enregistrer_feux([self.traffic_light])
+        
+        self.logger.log_demarrage(scenario=self.scenario.nom)
+        
+        self.logger.info("\n▶ Simulation démarrée")
+        
+        # Initialiser les variables de simulation
+        self.temps_dernier_spawn = self.horloge.maintenant()
+        self.index_etat_feu = 0
+        
+        # Initialiser le feu selon le scénario
+        if isinstance(self.scenario, ModeNuit):
+            self.traffic_light.activer_clignotant()
+            self.etat_clignotant = False
+        elif not isinstance(self.scenario, ModeManuel):
+            self._commencer_cycle()
+        self._programmer_feux()
+        return True
+    
+    def basculer_pause(self):
+        """
+        Met en pause ou reprend la simulation
+        
+        Returns:
+            bool: True si la simulation est maintenant en pause
+        """
+        self.paused = not self.paused
+        
+        if self.paused:
+            self.logger.log_pause()
+            self.logger.info("⏸ Simulation en pause")
+        else:
+            self.logger.log_reprise()
+            self.logger.info("▶ Simulation reprise")
+        return self.paused
+    
+    def arreter(self):
+        """Arrête la simulation"""
+        self.running = False
+        self.paused = False
+        
+        self.logger.log_arret()
+        # Ne pas perdre la fin du run: écrire les événements en attente
+        self.logger.flush()
+        self.logger.info("⏹ Simulation arrêtée")
+    
+    def reinitialiser(self):
+        """Supprime les voitures, remet les feux au rouge et recrée les voitures initiales"""
+        if self.running:
+            self.arreter()
+        
+        self.vehicle_manager.detruire_toutes()
+        
+        self.horloge.reinitialiser()
+        self.logger.definir_horloge(self.horloge.maintenant)
+        self.roue.vider()
+        self.echeance_feu = None
+        self.entree_feu = None
+        self.logger.tick = None
+        
+        # Réinitialiser les feux à ROUGE partout
+        self._appliquer_feux(TrafficLight.ROUGE, TrafficLight.ROUGE, forcer=True)
+        self.rendu.afficher_nombre_voitures(0)
+        
+        self.logger.log_reinitialisation()
+        self.logger.flush()
+        
+        self.logger.info("🔄 Simulation réinitialisée")
+        
+        # Recréer les voitures initiales
+        self.creer_voitures_initiales()
+    
+    # ========== TICK ==========
+    
+    def etape(self, afficher=True):
+        """
+        Exécute un tick si la simulation tourne, puis transmet les voitures au rendu
+        
+        Args:
+            afficher (bool): False pour un sous-pas sans affichage (voir afficher())
+        """
+        if self.running and not self.paused:
+            self.gerer_simulation()
+        if afficher:
+            self.afficher()
+    
+    def afficher(self):
+        """Transmet la position des voitures au rendu"""
+        self.rendu.actualiser_voitures(self.vehicle_manager.voitures)
+    
+    def executer(self, nombre_ticks=None, duree=None, evenementiel=False):
+        """
+        Démarre la simulation et exécute des ticks sans affichage ni attente:
+        le temps simulé ne dépend pas de l'heure réelle
+        
+        Args:
+            nombre_ticks (int, optional): Nombre de ticks à exécuter
+            duree (float, optional): Durée à simuler en secondes (si nombre_ticks est absent)
+            evenementiel (bool): Sauter directement d'un événement au suivant
+                quand aucune voiture n'interagit (scénarios peu denses)
+        """
+        if nombre_ticks is None:
+            nombre_ticks = self.horloge.ticks_pour(duree)
+        fin = self.tick + nombre_ticks
+        
+        # Trafic dense: quand aucun saut n'est possible, la recherche est
+        # espacée (1, 2, 4 ... RECUL_MAX ticks normaux) pour ne pas coûter plus
+        # qu'elle ne rapporte
+        recul = 0
+        attente = 0
+        
+        self.demarrer()
+        while self.tick < fin:
+            if evenementiel:
+                if attente > 0:
+                    attente -= 1
+                else:
+                    saut = min(self.ticks_sans_evenement(), fin - self.tick)
+                    if saut > 0:
+                        self._sauter_ticks(saut)
+                        recul = 0
+                        continue
+                    recul = min(RECUL_MAX, recul * 2 or 1)
+                    attente = recul - 1
+            self.etape()
+    
+    # ========== ÉVÉNEMENTS DISCRETS ==========
+    
+    def _tick_echeance(self, temps_depart, duree):
+        """
+        Nombre de ticks pouvant s'écouler avant qu'une minuterie n'expire
+        
+        Args:
+            temps_depart (float): Début de la minuterie (secondes simulées)
+            duree (float): Durée de la minuterie
+            
+        Returns:
+            int: Ticks sans expiration (un tick de marge pour les arrondis)
+        """
+        tick_expiration = math.ceil((temps_depart + duree) / self.horloge.pas)
+        return max(0, tick_expiration - self.tick - 2)
+    
+    def _ticks_libres(self, voiture):
+        """
+        Nombre de ticks pendant lesquels une voiture garde un comportement trivial:
+        rouler à vitesse maximale sans voisine proche, ou attendre à l'arrêt
+        
+        Args:
+            voiture (Vehicle): Voiture à examiner
+            
+        Returns:
+            int: 0 si la voiture interagit (freine, accélère, suit une voiture),
+                None si elle peut attendre indéfiniment (jusqu'à un changement de feu)
+        """
+        p = progression(voiture)
+        profil = voiture.profil
+        etat_feu = self.etats_feu[voiture.code_direction]
+        avant_feu = LIGNE_ARRET - ZONE_ARRET < p < LIGNE_ARRET
+        
+        devant = self.voiture_devant(voiture)
+        ecart = math.inf
+        if devant is not None:
+            ecart = progression(devant) - p
+        collision = voiture.detection_active and ecart < profil.distance_securite
+        
+        if voiture.vitesse == 0:
+            # À l'arrêt: ne bouge pas tant que le feu et la voiture de devant ne changent pas
+            if avant_feu:
+                redemarre = etat_feu == TrafficLight.VERT and not collision
+            else:
+                redemarre = not collision
+            if redemarre or (devant is not None and devant.vitesse > 0):
+                return 0
+            return None
+        
+        if voiture.vitesse != profil.vitesse_max:
+            return 0
+        
+        # En croisière: ni feu à respecter ni voiture trop proche
+        if avant_feu and etat_feu != TrafficLight.VERT:
+            return 0
+        seuil = DISTANCE_SECURITE
+        if voiture.detection_active:
+            seuil = max(seuil, profil.distance_securite)
+        if ecart < seuil:
+            return 0
+        
+        v = voiture.vitesse
+        if p <= LIGNE_ARRET - ZONE_ARRET:
+            ticks = math.floor((LIGNE_ARRET - ZONE_ARRET - p) / v)
+        elif p < LIGNE_ARRET:
+            ticks = math.ceil((LIGNE_ARRET - p) / v) - 1
+        else:
+            ticks = math.floor((LIMITE_ECRAN - p) / v)
+        
+        if devant is not None and devant.vitesse < v:
+            ticks = min(ticks, math.floor((ecart - seuil) / (v - devant.vitesse)))
+        
+        # Un tick de marge pour les arrondis
+        return max(0, ticks - 1)
+    
+    def ticks_sans_evenement(self):
+        """
+        Calcule combien de ticks peuvent être franchis d'un coup
+        
+        Le saut va jusqu'à la plus proche des échéances: changement de phase ou
+        clignotement, création de voiture, arrivée d'une voiture à une ligne
+        d'arrêt ou au bord de l'écran.
+        
+        Returns:
+            int: Nombre de ticks sans événement (0 = exécuter un tick normal)
+        """
+        if not self.running or self.paused:
+            return 0
+        
+        config = self.config_voitures
+        saut = math.inf
+        
+        # Le tick d'un changement de feu doit être exécuté normalement
+        if self.echeance_feu is not None:
+            saut = self.echeance_feu - 1 - self.tick
+        
+        if self.vehicle_manager.get_nombre_voitures() < config['nombre_max']:
+            saut = min(saut, self._tick_echeance(self.temps_dernier_spawn,
+                                                 config['intervalle_spawn']))
+        if saut <= 0:
+            return 0
+        
+        self.vehicle_manager.mettre_a_jour_voies()
+        for voiture in self.vehicle_manager.voitures:
+            ticks = self._ticks_libres(voiture)
+            if ticks == 0:
+                return 0
+            if ticks is not None and ticks < saut:
+                saut = ticks
+        
+        return 0 if saut == math.inf else saut
+    
+    def _sauter_ticks(self, nombre):
+        """
+        Avance l'horloge de plusieurs ticks et déplace les voitures en croisière
+        
+        Args:
+            nombre (int): Nombre de ticks sans événement (voir ticks_sans_evenement)
+        """
+        self.horloge.avancer_de(nombre)
+        self.logger.tick = self.tick
+        self.ticks_sautes += nombre
+        
+        for voiture in self.vehicle_manager.voitures:
+            if voiture.vitesse > 0:
+                dx, dy = DEPLACEMENTS[voiture.code_direction]
+                voiture.x += dx * voiture.vitesse * nombre
+                voiture.y += dy * voiture.vitesse * nombre
+                if self.moteur is not None:
+                    self.moteur.synchroniser_position(voiture)
+    
+    def _creer_voiture_si_besoin(self, temps_actuel, config):
+        """Crée une voiture si l'intervalle de spawn est écoulé et la limite non atteinte"""
+        if (temps_actuel - self.temps_dernier_spawn >= config['intervalle_spawn']
+            and self.vehicle_manager.get_nombre_voitures() < config['nombre_max']):
+            self.creer_voiture()
+            self.temps_dernier_spawn = temps_actuel
+    
+    # ========== CHANGEMENTS DE FEU PLANIFIÉS ==========
+    
+    def _programmer_feux(self):
+        """Planifie le prochain changement de feu selon le scénario"""
+        # Le changement encore en attente (ancien scénario, ancienne phase) est annulé
+        if self.entree_feu is not None:
+            self.roue.annuler(self.entree_feu)
+            self.entree_feu = None
+        self.echeance_feu = None
+        
+        if isinstance(self.scenario, ModeNuit):
+            self._planifier_feu(1.0, self._clignoter)
+        elif not isinstance(self.scenario, ModeManuel):
+            self._planifier_feu(self.plan_feux.durees[self.index_etat_feu], self._phase_suivante)
+    
+    def _planifier_feu(self, duree, action):
+        """
+        Programme un changement de feu dans la roue temporelle
+        
+        Args:
+            duree (float): Délai en secondes simulées
+            action (callable): Changement à exécuter
+        """
+        self.echeance_feu = self.tick + max(1, self.horloge.ticks_pour(duree))
+        self.entree_feu = self.roue.planifier(self.echeance_feu, action)
+    
+    def _phase_suivante(self):
+        """Passe à la phase suivante du plan de feux et planifie la suivante"""
+        plan = self.plan_feux
+        self.index_etat_feu = plan.suivante(self.index_etat_feu)
+        
+        self._appliquer_feux(plan.etats_nord_sud[self.index_etat_feu],
+                             plan.etats_est_ouest[self.index_etat_feu])
+        self.logger.info(plan.messages[self.index_etat_feu])
+        
+        self._planifier_feu(plan.durees[self.index_etat_feu], self._phase_suivante)
+    
+    def _clignoter(self):
+        """Alterne les feux orange (mode nuit) et planifie l'alternance suivante"""
+        self.etat_clignotant = not self.etat_clignotant
+        self.rendu.clignoter_orange(self.etat_clignotant)
+        self._planifier_feu(1.0, self._clignoter)
+    
+    def temps_avant_changement(self):
+        """
+        Temps simulé restant avant le prochain changement de feu
+        
+        Returns:
+            float: Secondes, ou None si aucun changement n'est planifié
+        """
+        if self.echeance_feu is None:
+            return None
+        return (self.echeance_feu - self.tick) * self.horloge.pas
+    
+    def gerer_simulation(self):
+        """Gère la simulation complète (feu + voitures) pendant un tick"""
+        self.horloge.avancer()
+        self.logger.tick = self.tick
+        
+        # Changements de feu arrivés à échéance (aucun test sur les autres ticks)
+        self.roue.avancer(self.tick)
+        
+        # Création de nouvelles voitures
+        self._creer_voiture_si_besoin(self.horloge.maintenant(), self.config_voitures)
+        
+        # Gérer les voitures existantes
+        self.gerer_voitures()
+
+
+# Exécution headless (serveur, CI): une heure d'heure de pointe
+if __name__ == "__main__":
+    from database import Database
+    from scenarios import HeureDePointe
+    
+    database = Database("test_simulation.db")
+    logger = Logger(database, console=False)
+    
+    simulation = MoteurSimulation(logger, scenario=HeureDePointe(), graine=42)
+    simulation.creer_voitures_initiales()
+    
+    debut = time.perf_counter()
+    simulation.executer(duree=3600)
+    duree = time.perf_counter() - debut
+    
+    print(f"✅ {simulation.horloge.maintenant():.0f}s simulées ({simulation.tick} ticks) "
+          f"en {duree:.2f}s - {simulation.vehicle_manager.get_nombre_voitures()} voitures actives")
+    logger.close()
@@ -0,0 +1,631 @@
+"""
+Module des destinations de journalisation (sinks)
+Chaque sink reçoit les événements du Logger avec son propre filtre et son tampon
+"""
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import datetime
+
+from database import Database
+
+
+# Niveaux des événements et messages
+NIVEAU_DEBUG = 10
+NIVEAU_INFO = 20
+NIVEAU_AVERTISSEMENT = 30
+NIVEAU_ERREUR = 40
+
+NOMS_NIVEAUX = {
+    NIVEAU_DEBUG: "DEBUG",
+    NIVEAU_INFO: "INFO",
+    NIVEAU_AVERTISSEMENT: "AVERTISSEMENT",
+    NIVEAU_ERREUR: "ERREUR"
+}
+
+# Marqueur de fin pour le thread d'écriture
+_FIN = object()
+
+# Attente maximale d'une place dans la file avant de revérifier le thread d'écriture (secondes)
+ATTENTE_FILE = 0.1
+
+# Sinks console ouverts, vidés à la sortie du programme (références faibles:
+# un sink abandonné sans close() reste libérable)
+_SINKS_CONSOLE = weakref.WeakSet()
+
+
+def _vider_sinks_console():
+    """Écrit les lignes encore en tampon des sinks console ouverts"""
+    for sink in list(_SINKS_CONSOLE):
+        sink.flush()
+
+
+atexit.register(_vider_sinks_console)
+
+
+class Evenement:
+    """Événement transmis aux sinks"""
+    
+    __slots__ = ('niveau', 'type_action', 'action', 'champs', 'message', 'ts', 'persistant')
+    
+    def __init__(self, niveau, type_action=None, action=None, champs=None,
+                 message=None, persistant=False):
+        """
+        Initialise un événement
+        
+        Args:
+            niveau (int): Niveau (NIVEAU_DEBUG ... NIVEAU_ERREUR)
+            type_action (str, optional): Type d'action (SYSTEME, VOITURE, ...)
+            action (str, optional): Description de l'action
+            champs (dict, optional): Colonnes additionnelles (etat_feu, id_voiture, ...)
+            message (str, optional): Texte destiné à la console
+            persistant (bool): True si l'événement appartient au journal (base)
+        """
+        self.niveau = niveau
+        self.type_action = type_action
+        self.action = action
+        self.champs = champs if champs is not None else {}
+        self.message = message
+        self.ts = time.time_ns() // 1000
+        self.persistant = persistant
+    
+    def vers_dict(self):
+        """
+        Retourne l'événement sous forme de dictionnaire sérialisable
+        
+        Returns:
+            dict: Champs non vides de l'événement
+        """
+        donnees = {
+            'ts': self.ts,
+            'niveau': NOMS_NIVEAUX.get(self.niveau, self.niveau),
+        }
+        if self.type_action is not None:
+            donnees['type_action'] = self.type_action
+        if self.action is not None:
+            donnees['action'] = self.action
+        if self.message is not None:
+            donnees['message'] = self.message
+        donnees.update((cle, valeur) for cle, valeur in self.champs.items() if valeur is not None)
+        return donnees
+    
+    def get_timestamp(self):
+        """
+        Retourne l'horodatage au format texte de la base
+        
+        Returns:
+            str: Timestamp "%Y-%m-%d %H:%M:%S"
+        """
+        return datetime.fromtimestamp(self.ts / 1_000_000).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TamponCirculaire:
+    """Tampon circulaire de taille fixe avec index par type et par voiture"""
+    
+    def __init__(self, capacite=1000):
+        """
+        Initialise le tampon
+        
+        Args:
+            capacite (int): Nombre maximal d'éléments conservés
+        """
+        if capacite <= 0:
+            raise ValueError("La capacité doit être positive")
+        self.capacite = capacite
+        
+        # Emplacements pré-alloués: (numéro de séquence, élément)
+        self.cases = [None] * capacite
+        self.sequence = 0  # Numéro du prochain élément
+        
+        # Index: clé -> numéros de séquence (du plus ancien au plus récent)
+        self.index_type = {}
+        self.index_voiture = {}
+    
+    def __len__(self):
+        return min(self.sequence, self.capacite)
+    
+    def ajouter(self, element, type_action=None, id_voiture=None):
+        """
+        Ajoute un élément en écrasant le plus ancien si le tampon est plein (O(1))
+        
+        Args:
+            element: Élément à conserver
+            type_action (str, optional): Clé de l'index par type
+            id_voiture (int, optional): Clé de l'index par voiture
+        """
+        case = self.sequence % self.capacite
+        ancien = self.cases[case]
+        if ancien is not None:
+            # L'élément écrasé est le plus ancien de ses index
+            self._retirer_index(self.index_type, ancien[2], ancien[0])
+            self._retirer_index(self.index_voiture, ancien[3], ancien[0])
+        
+        self.cases[case] = (self.sequence, element, type_action, id_voiture)
+        if type_action is not None:
+            self.index_type.setdefault(type_action, deque()).append(self.sequence)
+        if id_voiture is not None:
+            self.index_voiture.setdefault(id_voiture, deque()).append(self.sequence)
+        self.sequence += 1
+    
+    def _retirer_index(self, index, cle, sequence):
+        """Retire un numéro de séquence évincé d'un index"""
+        if cle is None:
+            return
+        numeros = index.get(cle)
+        if numeros and numeros[0] == sequence:
+            numeros.popleft()
+            if not numeros:
+                del index[cle]
+    
+    def instantane(self):
+        """
+        Itère sur une copie du contenu, du plus ancien au plus récent
+        
+        Returns:
+            iterator: Éléments conservés
+        """
+        debut = max(0, self.sequence - self.capacite)
+        cases = list(self.cases)  # Copie: les ajouts suivants n'affectent pas l'itération
+        return (cases[numero % self.capacite][1] for numero in range(debut, self.sequence))
+    
+    def derniers(self, nombre=10, type_action=None, id_voiture=None):
+        """
+        Retourne les éléments les plus récents, éventuellement filtrés
+        
+        Args:
+            nombre (int): Nombre maximal d'éléments
+            type_action (str, optional): Ne garder que ce type
+            id_voiture (int, optional): Ne garder que cette voiture
+            
+        Returns:
+            list: Éléments du plus récent au plus ancien
+        """
+        if type_action is not None and id_voiture is not None:
+            numeros = [n for n in self.index_voiture.get(id_voiture, ())
+                       if self.cases[n % self.capacite][2] == type_action]
+        elif type_action is not None:
+            numeros = self.index_type.get(type_action, ())
+        elif id_voiture is not None:
+            numeros = self.index_voiture.get(id_voiture, ())
+        else:
+            debut = max(0, self.sequence - self.capacite, self.sequence - nombre)
+            numeros = range(debut, self.sequence)
+        
+        numeros = list(numeros)[-nombre:] if nombre > 0 else []
+        return [self.cases[n % self.capacite][1] for n in reversed(numeros)]
+    
+    def vider(self):
+        """Supprime tous les éléments"""
+        self.cases = [None] * self.capacite
+        self.sequence = 0
+        self.index_type.clear()
+        self.index_voiture.clear()
+
+
+class Sink:
+    """Destination de journalisation (classe de base, filtre par niveau et par type)"""
+    
+    def __init__(self, niveau_min=NIVEAU_DEBUG, types=None):
+        """
+        Initialise le sink
+        
+        Args:
+            niveau_min (int): Niveau minimal accepté
+            types (iterable, optional): Types d'action acceptés (None = tous).
+                Les messages sans type ne passent que si types est None.
+        """
+        self.niveau_min = niveau_min
+        self.types = set(types) if types is not None else None
+    
+    def accepte(self, evenement):
+        """
+        Indique si le sink doit recevoir l'événement
+        
+        Args:
+            evenement (Evenement): Événement à filtrer
+        
+        Returns:
+            bool: True si l'événement passe le filtre
+        """
+        if evenement.niveau < self.niveau_min:
+            return False
+        if self.types is not None and evenement.type_action not in self.types:
+            return False
+        return True
+    
+    def emettre(self, evenement):
+        """
+        Reçoit un événement accepté
+        
+        Args:
+            evenement (Evenement): Événement à traiter
+        """
+        pass
+    
+    def flush(self):
+        """Écrit le contenu du tampon"""
+        pass
+    
+    def entretien(self):
+        """Travail périodique hors émission (tampon dont le délai est écoulé)"""
+        pass
+    
+    def close(self):
+        """Écrit le tampon et libère les ressources"""
+        self.flush()
+
+
+class SinkNul(Sink):
+    """Sink qui ignore tout (exécutions headless et benchmarks)"""
+    
+    def accepte(self, evenement):
+        return False
+
+
+class SinkMemoire(Sink):
+    """Derniers événements du journal en mémoire (vues en direct, sans accès disque)"""
+    
+    def __init__(self, capacite=1000, niveau_min=NIVEAU_DEBUG, types=None):
+        """
+        Initialise le sink mémoire
+        
+        Args:
+            capacite (int): Nombre d'événements conservés
+            niveau_min (int): Niveau minimal conservé
+            types (iterable, optional): Types d'action conservés (None = tous)
+        """
+        super().__init__(niveau_min, types)
+        self.tampon = TamponCirculaire(capacite)
+    
+    def accepte(self, evenement):
+        # Seuls les événements du journal sont conservés (pas les messages)
+        return evenement.persistant and super().accepte(evenement)
+    
+    def emettre(self, evenement):
+        self.tampon.ajouter(evenement, evenement.type_action,
+                            evenement.champs.get('id_voiture'))
+
+
+class SinkConsole(Sink):
+    """Sortie console tamponnée: une seule écriture stdout par lot de lignes"""
+    
+    def __init__(self, niveau_min=NIVEAU_DEBUG, types=None, taille_tampon=50,
+                 intervalle_flush=0.5, flux=None):
+        """
+        Initialise le sink console
+        
+        Args:
+            niveau_min (int): Niveau minimal affiché
+            types (iterable, optional): Types d'action affichés (None = tous)
+            taille_tampon (int): Nombre de lignes déclenchant l'écriture
+            intervalle_flush (float): Délai maximal (secondes) avant l'écriture
+            flux (file, optional): Flux de sortie (sys.stdout par défaut)
+        """
+        super().__init__(niveau_min, types)
+        self.taille_tampon = taille_tampon
+        self.intervalle_flush = intervalle_flush
+        self.flux = flux
+        self.tampon = []
+        self.dernier_flush = time.monotonic()
+        # Lignes encore en tampon à la sortie du programme
+        _SINKS_CONSOLE.add(self)
+    
+    def accepte(self, evenement):
+        # Seuls les événements avec un texte console sont affichés
+        return evenement.message is not None and super().accepte(evenement)
+    
+    def emettre(self, evenement):
+        self.tampon.append(evenement.message)
+        if (len(self.tampon) >= self.taille_tampon
+                or time.monotonic() - self.dernier_flush >= self.intervalle_flush):
+            self.flush()
+    
+    def flush(self):
+        self.dernier_flush = time.monotonic()
+        if not self.tampon:
+            return
+        lignes, self.tampon = self.tampon, []
+        flux = self.flux or sys.stdout
+        flux.write("\n".join(lignes) + "\n")
+        flux.flush()
+    
+    def entretien(self):
+        # Simulation inactive: aucune émission ne déclencherait l'écriture
+        if self.tampon and time.monotonic() - self.dernier_flush >= self.intervalle_flush:
+            self.flush()
+    
+    def close(self):
+        self.flush()
+        _SINKS_CONSOLE.discard(self)
+
+
+class SinkJSONL(Sink):
+    """Fichier JSON Lines (un objet JSON par événement)"""
+    
+    def __init__(self, chemin, niveau_min=NIVEAU_DEBUG, types=None, taille_tampon=500):
+        """
+        Initialise le sink JSONL
+        
+        Args:
+            chemin (str): Chemin du fichier (ouvert en ajout)
+            niveau_min (int): Niveau minimal écrit
+            types (iterable, optional): Types d'action écrits (None = tous)
+            taille_tampon (int): Nombre de lignes déclenchant l'écriture
+        """
+        super().__init__(niveau_min, types)
+        self.chemin = chemin
+        self.taille_tampon = taille_tampon
+        self.tampon = []
+        self.fichier = open(chemin, "a", encoding="utf-8")
+    
+    def emettre(self, evenement):
+        self.tampon.append(json.dumps(evenement.vers_dict(), ensure_ascii=False))
+        if len(self.tampon) >= self.taille_tampon:
+            self.flush()
+    
+    def flush(self):
+        if not self.tampon or self.fichier is None:
+            return
+        lignes, self.tampon = self.tampon, []
+        self.fichier.write("\n".join(lignes) + "\n")
+        self.fichier.flush()
+    
+    def close(self):
+        if self.fichier is None:
+            return
+        self.flush()
+        self.fichier.close()
+        self.fichier = None
+
+
+class SinkSQLite(Sink):
+    """Journal des événements dans SQLite (synchrone ou via un thread d'écriture)"""
+    
+    # Politiques de débordement de la file (mode asynchrone)
+    POLITIQUE_BLOQUER = "bloquer"
+    POLITIQUE_SUPPRIMER_ANCIEN = "supprimer_ancien"
+    POLITIQUE_SUPPRIMER_VOITURE = "supprimer_voiture"
+    
+    def __init__(self, database, asynchrone=False, taille_file=10000,
+                 politique_debordement=POLITIQUE_BLOQUER, niveau_min=NIVEAU_DEBUG, types=None):
+        """
+        Initialise le sink SQLite
+        
+        Args:
+            database (Database): Base de données cible
+            asynchrone (bool): True pour écrire les événements depuis un thread dédié
+            taille_file (int): Capacité de la file d'attente (mode asynchrone)
+            politique_debordement (str): Comportement quand la file est pleine:
+                - "bloquer": attendre qu'une place se libère
+                - "supprimer_ancien": jeter l'événement le plus ancien
+                - "supprimer_voiture": jeter les événements VOITURE uniquement
+                  (les autres types attendent une place)
+            niveau_min (int): Niveau minimal écrit
+            types (iterable, optional): Types d'action écrits (None = tous)
+        """
+        if politique_debordement not in (self.POLITIQUE_BLOQUER,
+                                         self.POLITIQUE_SUPPRIMER_ANCIEN,
+                                         self.POLITIQUE_SUPPRIMER_VOITURE):
+            raise ValueError(f"Politique de débordement inconnue: {politique_debordement}")
+        
+        super().__init__(niveau_min, types)
+        self.database = database
+        self.asynchrone = asynchrone
+        self.politique_debordement = politique_debordement
+        
+        # Compteurs d'événements (mode asynchrone)
+        self.compteurs = {
+            'en_file': 0,
+            'ecrits': 0,
+            'supprimes': 0
+        }
+        
+        self.file = None
+        self.thread_ecriture = None
+        # Exception qui a arrêté le thread d'écriture (relancée par flush et close)
+        self.erreur_ecriture = None
+        if asynchrone:
+            self.file = queue.Queue(maxsize=taille_file)
+            self.thread_ecriture = threading.Thread(
+                target=self._boucle_ecriture,
+                name="logger-ecriture",
+                daemon=True
+            )
+            self.thread_ecriture.start()
+    
+    def accepte(self, evenement):
+        # Les simples messages console ne font pas partie du journal
+        return evenement.persistant and super().accepte(evenement)
+    
+    def emettre(self, evenement):
+        champs = dict(evenement.champs)
+        # Horodatage pris à l'émission, pas au moment de l'écriture
+        champs['ts'] = evenement.ts
+        
+        if not self.asynchrone:
+            self.database.log_event(evenement.type_action, evenement.action, **champs)
+            return
+        
+        self._mettre_en_file((evenement.type_action, evenement.action, champs))
+    
+    def _mettre_en_file(self, element):
+        """
+        Ajoute un élément à la file en appliquant la politique de débordement
+        
+        Args:
+            element (tuple): (type_action, action, champs)
+        """
+        try:
+            self.file.put_nowait(element)
+            self.compteurs['en_file'] += 1
+            return
+        except queue.Full:
+            pass
+        
+        if self.politique_debordement == self.POLITIQUE_SUPPRIMER_ANCIEN:
+            # Libérer la place de l'événement le plus ancien
+            if self._retirer_plus_ancien():
+                self.compteurs['supprimes'] += 1
+        elif (self.politique_debordement == self.POLITIQUE_SUPPRIMER_VOITURE
+                and element[0] == "VOITURE"):
+            self.compteurs['supprimes'] += 1
+            return
+        
+        if self._deposer(element):
+            self.compteurs['en_file'] += 1
+        else:
+            # Thread d'écriture arrêté: l'événement ne sera jamais écrit
+            self.compteurs['supprimes'] += 1
+    
+    def _retirer_plus_ancien(self):
+        """
+        Retire de la file l'événement le plus ancien, en laissant en place
+        les marqueurs de flush et de fin
+        
+        Returns:
+            bool: True si un événement a été retiré
+        """
+        with self.file.mutex:
+            for index, ancien in enumerate(self.file.queue):
+                if isinstance(ancien, tuple):
+                    del self.file.queue[index]
+                    self.file.unfinished_tasks -= 1
+                    self.file.not_full.notify()
+                    return True
+        return False
+    
+    def _deposer(self, element, timeout=None):
+        """
+        Ajoute un élément à la file en attendant une place, tant que le thread
+        d'écriture tourne
+        
+        Args:
+            element: Événement ou marqueur
+            timeout (float, optional): Attente maximale (None = tant que le thread vit)
+        
+        Returns:
+            bool: True si l'élément est dans la file
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                self.file.put(element, timeout=ATTENTE_FILE)
+                return True
+            except queue.Full:
+                if self.thread_ecriture is None or not self.thread_ecriture.is_alive():
+                    return False
+                if limite is not None and time.monotonic() >= limite:
+                    return False
+    
+    def _boucle_ecriture(self):
+        """Boucle du thread d'écriture: vide la file vers sa propre connexion SQLite"""
+        database = None
+        try:
+            # Le thread possède sa connexion (sqlite3 interdit le partage entre threads);
+            # la base est déjà initialisée par le thread principal
+            database = Database(self.database.db_name,
+                                taille_lot=self.database.taille_lot,
+                                intervalle_flush=self.database.intervalle_flush,
+                                compact=self.database.compact,
+                                initialiser=False)
+            
+            transmis = 0  # Événements passés à la base (écrits ou dans son tampon)
+            while True:
+                try:
+                    element = self.file.get(timeout=database.intervalle_flush)
+                except queue.Empty:
+                    database.flush()
+                    self.compteurs['ecrits'] = transmis
+                    continue
+                
+                if element is _FIN:
+                    database.close()
+                    self.compteurs['ecrits'] = transmis
+                    self.file.task_done()
+                    break
+                
+                if isinstance(element, threading.Event):
+                    # Demande de flush explicite
+                    database.flush()
+                    element.set()
+                else:
+                    type_action, action, champs = element
+                    database.log_event(type_action, action, **champs)
+                    transmis += 1
+                
+                self.compteurs['ecrits'] = transmis - len(database.tampon)
+                self.file.task_done()
+        except Exception as e:
+            # Conservée pour flush() et close(): sans elle, les événements
+            # restés dans la file disparaîtraient sans trace
+            self.erreur_ecriture = e
+            # Les flush déjà en file n'attendent pas leur délai pour le découvrir
+            with self.file.mutex:
+                for element in self.file.queue:
+                    if isinstance(element, threading.Event):
+                        element.set()
+            if database is not None:
+                try:
+                    database.close()
+                except Exception:
+                    pass
+    
+    def flush(self, timeout=5.0):
+        """
+        Force l'écriture de tous les événements en attente
+        
+        Args:
+            timeout (float): Attente maximale du thread d'écriture (secondes)
+        
+        Raises:
+            RuntimeError: Si une exception a arrêté le thread d'écriture
+        """
+        if not self.asynchrone:
+            self.database.flush()
+            return
+        
+        if self.thread_ecriture is None or not self.thread_ecriture.is_alive():
+            self._signaler_erreur_ecriture()
+            return
+        
+        debut = time.monotonic()
+        termine = threading.Event()
+        if self._deposer(termine, timeout):
+            termine.wait(max(0.0, timeout - (time.monotonic() - debut)))
+        self._signaler_erreur_ecriture()
+    
+    def _signaler_erreur_ecriture(self):
+        """
+        Relance l'exception qui a arrêté le thread d'écriture, s'il y en a une
+        
+        Raises:
+            RuntimeError: Événements non écrits (cause: l'exception du thread)
+        """
+        if self.erreur_ecriture is not None:
+            raise RuntimeError("Thread d'écriture SQLite arrêté, événements non écrits"
+                               ) from self.erreur_ecriture
+    
+    def close(self, timeout=5.0):
+        """
+        Écrit les événements restants et ferme la base
+        
+        Args:
+            timeout (float): Attente maximale du thread d'écriture (secondes)
+        
+        Raises:
+            RuntimeError: Si une exception a arrêté le thread d'écriture
+        """
+        if self.asynchrone and self.thread_ecriture is not None:
+            if self.thread_ecriture.is_alive():
+                debut = time.monotonic()
+                if self._deposer(_FIN, timeout):
+                    self.thread_ecriture.join(max(0.0, timeout - (time.monotonic() - debut)))
+            self.thread_ecriture = None
+        self.database.close()
+        self._signaler_erreur_ecriture()
@@ -20,7 +20,7 @@ except Exception as e:
 print("\n2️⃣ Test logger.py...")
 try:
     from logger import Logger
-    logger = Logger(db)
+    logger = Logger(db, tampon_console=False)
     logger.log_demarrage("Test")
     print("   ✅ logger.py fonctionne")
 except Exception as e:
@@ -57,8 +57,9 @@ try:
         'acceleration': 0.5,
         'deceleration': 0.8
     }
-    print("   ⚠️  vehicles.py nécessite Turtle (fenêtre graphique)")
-    print("   ✅ Import réussi")
+    voiture = Vehicle(0, 0, 'est', logger, config)
+    voiture.avancer()
+    print(f"   ✅ vehicles.py fonctionne sans affichage - {voiture}")
 except Exception as e:
     print(f"   ❌ Erreur vehicles.py: {e}")
 
@@ -88,6 +89,383 @@ try:
 except Exception as e:
     print(f"   ❌ Erreur main.py: {e}")
 
+# Test 9: Simulation headless
+print("\n9️⃣ Test simulation.py (sans affichage)...")
+try:
+    from simulation import MoteurSimulation
+    simulation = MoteurSimulation(logger)
+    simulation.creer_voitures_initiales()
+    simulation.executer(100)
+    print(f"   ✅ simulation.py fonctionne - {simulation.tick} ticks")
+except Exception as e:
+    print(f"   ❌ Erreur simulation.py: {e}")
+
+# Test 10: Cycle complet du feu par l'API publique
+print("\n🔟 Test cycle du feu (changer_etat)...")
+try:
+    from traffic_light import TrafficLight, TransitionInvalide
+    feu = TrafficLight(logger)
+    vus = []
+    feu.abonner(lambda ns, eo, ancien_ns, ancien_eo: vus.append((ns, eo)))
+    for etat in ("VERT", "ORANGE", "ROUGE", "VERT", "ORANGE", "ROUGE"):
+        feu.changer_etat(etat)
+        assert feu.etat_nord_sud == etat, (etat, feu)
+    # Chaque étape notifiée respecte la table et n'ouvre jamais les deux axes
+    precedent = ("ROUGE", "ROUGE")
+    for ns, eo in vus:
+        assert ns in TrafficLight.TRANSITIONS[precedent[0]], (precedent, ns, eo)
+        assert eo in TrafficLight.TRANSITIONS[precedent[1]], (precedent, ns, eo)
+        assert "ROUGE" in (ns, eo), (ns, eo)
+        precedent = (ns, eo)
+    feu.alterner_priorite()
+    assert (feu.etat_nord_sud, feu.etat_est_ouest) == ("VERT", "ROUGE"), feu
+    assert feu.get_etat_pour_direction('nord') == feu.get_etat_pour_direction('sud') == "VERT"
+    assert feu.get_etat_pour_direction('est') == feu.get_etat_pour_direction('ouest') == "ROUGE"
+    feu.alterner_priorite()
+    assert (feu.etat_nord_sud, feu.etat_est_ouest) == ("ROUGE", "VERT"), feu
+    try:
+        feu.definir_etats("VERT", "ROUGE")
+        raise AssertionError("VERT → ROUGE accepté sans orange")
+    except TransitionInvalide:
+        pass
+    print(f"   ✅ Cycle complet valide - {len(vus)} changements notifiés")
+except Exception as e:
+    print(f"   ❌ Erreur cycle du feu: {e!r}")
+
+# Test 11: Journal asynchrone saturé
+print("\n1️⃣1️⃣ Test sink SQLite asynchrone (file pleine)...")
+try:
+    import os
+    import tempfile
+    import threading
+    import time
+    from sinks import SinkSQLite, Evenement, NIVEAU_INFO
+    dossier_tests = tempfile.mkdtemp()
+    db_file = Database(os.path.join(dossier_tests, "file.db"))
+    sink = SinkSQLite(db_file, asynchrone=True, taille_file=4,
+                      politique_debordement=SinkSQLite.POLITIQUE_SUPPRIMER_ANCIEN)
+    # Un marqueur de flush en file ne doit jamais être jeté par le débordement
+    marqueur = threading.Event()
+    sink._deposer(marqueur, timeout=1.0)
+    for i in range(2000):
+        sink.emettre(Evenement(NIVEAU_INFO, "VOITURE", f"Événement {i}", persistant=True))
+    assert marqueur.wait(2.0), "marqueur de flush jeté"
+    debut = time.monotonic()
+    sink.flush()
+    sink.close()
+    assert time.monotonic() - debut < 1.0, "flush/close ont attendu le timeout"
+    lignes = Database(os.path.join(dossier_tests, "file.db")).count_by_type().get("VOITURE", 0)
+    assert lignes == 2000 - sink.compteurs['supprimes'], (lignes, sink.compteurs)
+    print(f"   ✅ flush/close immédiats - {lignes} écrits, {sink.compteurs['supprimes']} supprimés")
+except Exception as e:
+    print(f"   ❌ Erreur sink asynchrone: {e!r}")
+
+# Test 12: Cadence de la boucle d'affichage (horloge injectée)
+print("\n1️⃣2️⃣ Test cadence.py...")
+try:
+    from cadence import CadenceBoucle
+    temps_reel = [0.0]
+    cadence = CadenceBoucle(0.025, fps=20, horloge_reelle=lambda: temps_reel[0])
+    assert cadence.sous_pas() == 0  # Premier appel: référence du temps
+    ticks = 0
+    for image in range(20):
+        temps_reel[0] += 0.05
+        ticks += cadence.sous_pas()
+        if cadence.doit_afficher():
+            cadence.image_affichee(0.01)
+    assert ticks == 40, ticks  # 1 s réelle = 40 ticks de 25 ms, 2 par image
+    assert cadence.get_statistiques()['images_affichees'] == 20
+    # Pause de 10 s: aucun rattrapage après reinitialiser()
+    temps_reel[0] += 10.0
+    cadence.reinitialiser()
+    assert cadence.sous_pas() == 0
+    temps_reel[0] += 0.05
+    assert cadence.sous_pas() == 2
+    # Rendu de 120 ms (budget 50 ms): les 2 images suivantes sont sautées
+    assert cadence.doit_afficher()
+    cadence.image_affichee(0.12)
+    sautees = 0
+    for image in range(3):
+        temps_reel[0] += 0.05
+        cadence.sous_pas()
+        sautees += not cadence.doit_afficher()
+    assert sautees == 2, sautees
+    # Retard de 5 s: au plus max_sous_pas ticks, le reste est abandonné
+    temps_reel[0] += 5.0
+    assert cadence.sous_pas() == cadence.max_sous_pas
+    print(f"   ✅ cadence.py fonctionne - {cadence}")
+except Exception as e:
+    print(f"   ❌ Erreur cadence.py: {e!r}")
+
+# Test 13: Changement de scénario en cours de phase
+print("\n1️⃣3️⃣ Test annulation des changements de feu planifiés...")
+try:
+    from sinks import SinkNul
+    logger_muet = Logger(db, sinks=[SinkNul()], capacite_recents=0)
+    simulation = MoteurSimulation(logger_muet, scenario=CirculationNormale(), graine=1)
+    simulation.executer(duree=3.0)
+    entree = simulation.entree_feu
+    simulation.changer_scenario("Mode Manuel")
+    assert entree[3] is False, "changement de phase de l'ancien scénario non annulé"
+    etats = (simulation.traffic_light.etat_nord_sud, simulation.traffic_light.etat_est_ouest)
+    simulation.executer(duree=120.0)
+    assert (simulation.traffic_light.etat_nord_sud,
+            simulation.traffic_light.etat_est_ouest) == etats, "feu changé en mode manuel"
+    print(f"   ✅ Plan de feux annulé au changement de scénario - feu {etats}")
+except Exception as e:
+    print(f"   ❌ Erreur annulation des feux: {e!r}")
+
+# Test 14: Stockage compact et changement de mode sur une même base
+print("\n1️⃣4️⃣ Test database.py en mode compact...")
+try:
+    import os
+    import tempfile
+    chemin = os.path.join(tempfile.mkdtemp(), "compact.db")
+    db_texte = Database(chemin)
+    db_texte.log_event("VOITURE", "Arrêt", "ROUGE", "Heure de Pointe", 7, 1.5, -2.0, 0.0,
+                       ts=1_700_000_000_000_000, tick=3)
+    db_texte.log_event("FEU_AUTO", "Changement", "VERT", ts=1_700_000_001_000_000, tick=4)
+    attendus = db_texte.get_events_between()
+    db_texte.close()
+    # L'ouverture en mode compact ne touche pas aux lignes texte
+    db_compact = Database(chemin, compact=True)
+    assert db_compact.get_events_between() == []
+    assert db_compact.conn.execute('SELECT COUNT(*) FROM evenements').fetchone()[0] == 2
+    # Conversion explicite texte -> compact: mêmes tuples (ids compris), relus via la vue
+    assert db_compact.convert_format() == 2
+    assert db_compact.get_events_between() == attendus, db_compact.get_events_between()
+    db_compact.log_event("VOITURE", "Départ", "VERT", "Heure de Pointe", 7,
+                         ts=1_700_000_002_000_000, tick=5)
+    assert db_compact.count_by_type() == {"VOITURE": 2, "FEU_AUTO": 1}
+    attendus = db_compact.get_events_between()
+    assert [e[0] for e in attendus] == [1, 2, 3], attendus
+    db_compact.close()
+    # Compact -> texte: rien ne disparaît, les nouveaux ids suivent les anciens
+    db_texte = Database(chemin)
+    assert db_texte.convert_format() == 3
+    assert db_texte.get_events_between() == attendus, db_texte.get_events_between()
+    db_texte.log_event("FEU_AUTO", "Changement", "ROUGE", ts=1_700_000_003_000_000, tick=6)
+    assert db_texte.get_events_between()[-1][0] == 4
+    # Ids en conflit entre les deux tables: aucune renumérotation, refus
+    db_texte.conn.execute(
+        'INSERT INTO evenements_compacts (id, ts, type_id, action_id) VALUES (4, 0, 1, 1)'
+    )
+    db_texte.conn.commit()
+    try:
+        db_texte.convert_format()
+        raise AssertionError("conflit d'ids non détecté")
+    except ValueError:
+        pass
+    assert len(db_texte.get_events_between()) == 4
+    db_texte.clear_database()
+    assert Database(chemin, compact=True).get_events_between() == []
+    print(f"   ✅ Conversion explicite texte/compact - {len(attendus)} événements conservés")
+except Exception as e:
+    print(f"   ❌ Erreur mode compact: {e!r}")
+
+# Test 15: Migration d'une base v1 existante (horodatage texte) vers le dernier schéma
+print("\n1️⃣5️⃣ Test migrations de schéma v1 → v5...")
+try:
+    import os
+    import sqlite3
+    import tempfile
+    from database import _texte_vers_ts
+    chemin = os.path.join(tempfile.mkdtemp(), "v1.db")
+    conn = sqlite3.connect(chemin)
+    conn.execute('''
+        CREATE TABLE evenements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+            type_action TEXT NOT NULL, action TEXT NOT NULL, etat_feu TEXT, scenario TEXT,
+            id_voiture INTEGER, position_x REAL, position_y REAL, vitesse REAL
+        )
+    ''')
+    conn.execute('CREATE INDEX idx_evenements_type ON evenements (type_action)')
+    conn.executemany(
+        'INSERT INTO evenements (timestamp, type_action, action) VALUES (?, ?, ?)',
+        [(f"2024-05-01 12:00:{i % 60:02d}", "FEU_AUTO" if i % 3 else "VOITURE", f"Action {i}")
+         for i in range(120)]
+    )
+    conn.commit()
+    conn.close()
+    db_v1 = Database(chemin)
+    version = db_v1.conn.execute('PRAGMA user_version').fetchone()[0]
+    assert version == 5, version
+    index = {ligne[1] for ligne in db_v1.conn.execute('PRAGMA index_list(evenements)')}
+    assert 'idx_evenements_type_ts' in index and 'idx_evenements_type' not in index, index
+    evenements = db_v1.get_events_between()
+    assert len(evenements) == 120
+    assert all(e[10] == _texte_vers_ts(e[1]) for e in evenements), "ts mal converti"
+    assert db_v1.count_by_type() == {"FEU_AUTO": 80, "VOITURE": 40}
+    db_v1.close()
+    print(f"   ✅ Base v1 migrée en v{version} - {len(evenements)} événements horodatés")
+except Exception as e:
+    print(f"   ❌ Erreur migrations: {e!r}")
+
+# Test 16: Tampon circulaire des événements récents
+print("\n1️⃣6️⃣ Test tampon des événements récents (SinkMemoire)...")
+try:
+    from sinks import SinkMemoire, Evenement, NIVEAU_INFO
+    recents = SinkMemoire(capacite=4)
+    for i in range(6):
+        recents.emettre(Evenement(NIVEAU_INFO, "VOITURE" if i % 2 else "FEU_AUTO",
+                                  f"Événement {i}", {'id_voiture': i % 3}, persistant=True))
+    tampon = recents.tampon
+    assert len(tampon) == 4
+    assert [e.action for e in tampon.instantane()] == [f"Événement {i}" for i in range(2, 6)]
+    assert [e.action for e in tampon.derniers(2)] == ["Événement 5", "Événement 4"]
+    assert [e.action for e in tampon.derniers(10, type_action="FEU_AUTO")] == \
+        ["Événement 4", "Événement 2"]
+    # Les événements écrasés (0 et 1) ont quitté les index
+    assert [e.action for e in tampon.derniers(10, id_voiture=1)] == ["Événement 4"]
+    assert tampon.derniers(10, type_action="FEU_AUTO", id_voiture=0) == []
+    assert [e.action for e in tampon.derniers(10, type_action="VOITURE", id_voiture=2)] == \
+        ["Événement 5"]
+    print(f"   ✅ Tampon circulaire - {len(tampon)} événements, index à jour")
+except Exception as e:
+    print(f"   ❌ Erreur tampon circulaire: {e!r}")
+
+# Test 17: Même trajectoire en mode tick, événements discrets et vectoriel
+print("\n1️⃣7️⃣ Test équivalence des moteurs (graine fixe)...")
+try:
+    from sinks import SinkNul
+    from moteur_vectoriel import NUMPY_DISPONIBLE
+
+    def etat_final(scenario, evenementiel=False, vectoriel=False):
+        """Voitures (direction, x, y, vitesse, arrêtée) après 300 s simulées"""
+        journal = Logger(db, sinks=[SinkNul()], capacite_recents=0)
+        simulation = MoteurSimulation(journal, scenario=scenario, graine=3, vectoriel=vectoriel)
+        simulation.creer_voitures_initiales()
+        simulation.executer(duree=300.0, evenementiel=evenementiel)
+        return sorted((v.direction, v.x, v.y, v.vitesse, v.arretee)
+                      for v in simulation.vehicle_manager.voitures), simulation.ticks_sautes
+
+    def identiques(a, b):
+        return len(a) == len(b) and all(
+            da == db_ and arr_a == arr_b and all(abs(u - w) < 1e-6 for u, w in zip(va, vb))
+            for (da, *va, arr_a), (db_, *vb, arr_b) in zip(a, b))
+
+    for scenario in (ModeNuit(), CirculationNormale(), HeureDePointe()):
+        reference, _ = etat_final(scenario)
+        evenements, sautes = etat_final(scenario, evenementiel=True)
+        assert identiques(reference, evenements), f"{scenario.nom}: tick ≠ événements"
+        assert sautes > 0, f"{scenario.nom}: aucun tick sauté"
+        if NUMPY_DISPONIBLE:
+            vectoriel, _ = etat_final(scenario, vectoriel=True)
+            assert identiques(reference, vectoriel), f"{scenario.nom}: tick ≠ vectoriel"
+        print(f"   ✅ {scenario.nom}: {len(reference)} voitures identiques, {sautes} ticks sautés")
+    if not NUMPY_DISPONIBLE:
+        print("   ⚠️  NumPy non installé: moteur vectoriel non comparé")
+except Exception as e:
+    print(f"   ❌ Erreur équivalence des moteurs: {e!r}")
+
+# Test 18: Retour au détail après des images lentes à nombre de voitures constant
+print("\n1️⃣8️⃣ Test niveau de détail (durée des images)...")
+try:
+    from niveau_detail import NiveauDetail
+    niveau = NiveauDetail(seuil_voitures=100, budget_image=0.05, images_lentes_max=3,
+                          images_rapides_min=10)
+    assert not any(niveau.evaluer(30, 0.08) for _ in range(2))
+    assert niveau.evaluer(30, 0.08), "pas de bascule après 3 images lentes"
+    assert all(niveau.evaluer(30, 0.01) for _ in range(9))
+    # Une image ni lente ni assez rapide remet le compte à zéro
+    assert niveau.evaluer(30, 0.04)
+    assert all(niveau.evaluer(30, 0.01) for _ in range(9))
+    assert not niveau.evaluer(30, 0.01), "le détail ne revient pas à nombre constant"
+    # Bascule sur le nombre: la durée seule ne suffit pas à revenir
+    assert niveau.evaluer(150, 0.01)
+    assert all(niveau.evaluer(150, 0.01) for _ in range(20))
+    assert not niveau.evaluer(80, 0.01)
+    print(f"   ✅ {niveau.nombre_bascules} bascules, retour au détail par la durée et le nombre")
+except Exception as e:
+    print(f"   ❌ Erreur niveau de détail: {e!r}")
+
+# Test 19: Timestamp v1 illisible en fin de bloc de pagination
+print("\n1️⃣9️⃣ Test pagination avec un timestamp v1 illisible...")
+try:
+    import os
+    import sqlite3
+    import tempfile
+    chemin = os.path.join(tempfile.mkdtemp(), "v1_illisible.db")
+    conn = sqlite3.connect(chemin)
+    conn.execute('''
+        CREATE TABLE evenements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+            type_action TEXT NOT NULL, action TEXT NOT NULL, etat_feu TEXT, scenario TEXT,
+            id_voiture INTEGER, position_x REAL, position_y REAL, vitesse REAL
+        )
+    ''')
+    horodatages = ["2024-05-01 12:00:00", "pas une date", "2024-05-01 12:00:02",
+                   "2024-05-01 12:00:03", "", "2024-05-01 12:00:05"]
+    conn.executemany(
+        'INSERT INTO evenements (timestamp, type_action, action) VALUES (?, ?, ?)',
+        [(horodatage, "VOITURE", f"Action {i}") for i, horodatage in enumerate(horodatages)]
+    )
+    conn.commit()
+    conn.close()
+    db_illisible = Database(chemin)
+    nuls = db_illisible.conn.execute(
+        'SELECT COUNT(*) FROM evenements WHERE ts IS NULL').fetchone()[0]
+    assert nuls == 0, f"{nuls} ts NULL"
+    # Blocs de 2: les lignes illisibles (ids 2 et 5) terminent chacune un bloc
+    ids = [e[0] for e in db_illisible.iter_events(taille_bloc=2)]
+    assert ids == [1, 2, 3, 4, 5, 6], ids
+    ids = [e[0] for e in db_illisible.iter_events(taille_bloc=2, type_action="VOITURE")]
+    assert ids == [1, 2, 3, 4, 5, 6], ids
+    db_illisible.close()
+    print(f"   ✅ {len(ids)} événements lus par blocs de 2, aucun ts NULL")
+except Exception as e:
+    print(f"   ❌ Erreur pagination ts illisible: {e!r}")
+
+# Test 20: Sinks console vidés à la sortie sans être retenus
+print("\n2️⃣0️⃣ Test vidage des sinks console à la sortie...")
+try:
+    import gc
+    import io
+    import weakref
+    import sinks
+    from sinks import SinkConsole, Evenement, NIVEAU_INFO
+    flux = io.StringIO()
+    console = SinkConsole(flux=flux, taille_tampon=10, intervalle_flush=60)
+    console.emettre(Evenement(NIVEAU_INFO, message="ligne en tampon"))
+    sinks._vider_sinks_console()
+    assert flux.getvalue() == "ligne en tampon\n", flux.getvalue()
+    console.close()
+    assert console not in sinks._SINKS_CONSOLE, "sink fermé encore vidé à la sortie"
+    abandonne = weakref.ref(SinkConsole(flux=io.StringIO()))
+    gc.collect()
+    assert abandonne() is None, "sink abandonné retenu par le hook de sortie"
+    print("   ✅ Tampon vidé à la sortie, sinks fermés ou abandonnés libérés")
+except Exception as e:
+    print(f"   ❌ Erreur sinks console: {e!r}")
+
+# Test 21: Exception du thread d'écriture SQLite remontée par flush et close
+print("\n2️⃣1️⃣ Test erreur du thread d'écriture SQLite...")
+try:
+    import os
+    import tempfile
+    import time
+    from sinks import SinkSQLite, Evenement, NIVEAU_INFO
+    base = Database(os.path.join(tempfile.mkdtemp(), "ecriture.db"))
+    ecriture = SinkSQLite(base, asynchrone=True)
+    # Champ inconnu de log_event: TypeError dans le thread d'écriture
+    ecriture.emettre(Evenement(NIVEAU_INFO, "VOITURE", "Départ", {'inconnu': 1},
+                               persistant=True))
+    debut = time.monotonic()
+    try:
+        ecriture.flush()
+        raise AssertionError("erreur du thread d'écriture non remontée par flush")
+    except RuntimeError as erreur:
+        assert isinstance(erreur.__cause__, TypeError), repr(erreur.__cause__)
+    assert time.monotonic() - debut < 2.0, "flush a attendu tout son délai"
+    try:
+        ecriture.close()
+        raise AssertionError("erreur du thread d'écriture non remontée par close")
+    except RuntimeError:
+        pass
+    print("   ✅ TypeError du thread remontée par flush() et close()")
+except Exception as e:
+    print(f"   ❌ Erreur thread d'écriture: {e!r}")
+
 # Résumé
 print("\n" + "="*60)
 print("📊 RÉSUMÉ DES TESTS")
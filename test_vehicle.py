@@ -5,6 +5,7 @@ Test simple des véhicules avec images
 from vehicles import Vehicle
 from vehicle_manager import VehicleManager
 from logger import Logger
+from rendu_turtle import RenduTurtle
 import turtle
 import time
 
@@ -32,7 +33,8 @@ if __name__ == "__main__":
     screen.tracer(0)
     
     # Créer le gestionnaire
-    manager = VehicleManager(logger)
+    rendu = RenduTurtle(logger=logger)
+    manager = VehicleManager(logger, rendu=rendu)
     
     # DÉFINIR LES IMAGES PAR DIRECTION
     # Les voitures choisiront automatiquement une image aléatoire
@@ -72,6 +74,7 @@ if __name__ == "__main__":
         if i % 50 == 0 and i > 0:
             manager.afficher_statistiques()
         
+        rendu.actualiser_voitures(manager.voitures)
         screen.update()
         time.sleep(0.05)
     
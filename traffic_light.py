@@ -6,6 +6,11 @@ Gère les états et les cycles automatiques du feu avec coordination Nord/Sud et
 from logger import Logger
 
 
+class TransitionInvalide(ValueError):
+    """Changement d'état refusé par la table des transitions"""
+    pass
+
+
 class TrafficLight:
     """Gestion du feu tricolore avec alternance Nord/Sud et Est/Ouest"""
     
@@ -14,6 +19,30 @@ class TrafficLight:
     ORANGE = "ORANGE"
     VERT = "VERT"
     
+    # Cycle d'un axe: état suivant de chaque état
+    SUIVANT = {
+        ROUGE: VERT,
+        VERT: ORANGE,
+        ORANGE: ROUGE,
+    }
+    
+    # Table des transitions autorisées pour un axe en mode automatique
+    TRANSITIONS = {etat: frozenset((etat, suivant)) for etat, suivant in SUIVANT.items()}
+    
+    # État visé pour l'autre axe par changer_etat() en mode automatique
+    # (atteint en suivant le cycle, jamais par un saut)
+    ETAT_OPPOSE = {
+        VERT: ROUGE,
+        ORANGE: ROUGE,
+        ROUGE: VERT,
+    }
+    
+    # Axe correspondant à chaque direction (lookup O(1))
+    AXES = {
+        'nord': "NS", 'sud': "NS", 'vertical': "NS", "NS": "NS",
+        'est': "EO", 'ouest': "EO", 'horizontal': "EO", "EO": "EO",
+    }
+    
     def __init__(self, logger):
         """
         Initialise le feu tricolore
@@ -22,8 +51,10 @@ class TrafficLight:
             logger (Logger): Instance du logger pour journalisation
         """
         # États actuels pour chaque axe
-        self.etat_nord_sud = self.ROUGE
-        self.etat_est_ouest = self.ROUGE
+        self.etats = {"NS": self.ROUGE, "EO": self.ROUGE}
+        
+        # Fonctions appelées à chaque changement réel d'état
+        self.abonnes = []
         
         self.logger = logger
         self.auto_mode = True
@@ -40,6 +71,119 @@ class TrafficLight:
             etat_feu=self.etat_nord_sud
         )
     
+    @property
+    def etat_nord_sud(self):
+        """État des feux Nord/Sud (modifiable via definir_etats)"""
+        return self.etats["NS"]
+    
+    @property
+    def etat_est_ouest(self):
+        """État des feux Est/Ouest (modifiable via definir_etats)"""
+        return self.etats["EO"]
+    
+    # ========== MACHINE À ÉTATS ==========
+    
+    def abonner(self, fonction):
+        """
+        Abonne une fonction aux changements d'état
+        
+        Args:
+            fonction (callable): Appelée avec (etat_nord_sud, etat_est_ouest,
+                ancien_nord_sud, ancien_est_ouest), seulement si un état change
+        """
+        self.abonnes.append(fonction)
+    
+    def desabonner(self, fonction):
+        """
+        Retire un abonné
+        
+        Args:
+            fonction (callable): Fonction passée à abonner()
+        """
+        if fonction in self.abonnes:
+            self.abonnes.remove(fonction)
+    
+    def _valider(self, ancien_ns, ancien_eo, etat_ns, etat_eo):
+        """
+        Vérifie un changement d'état avec la table des transitions
+        
+        Raises:
+            TransitionInvalide: Transition interdite ou axes en conflit
+        """
+        for axe, ancien, nouveau in (("NS", ancien_ns, etat_ns), ("EO", ancien_eo, etat_eo)):
+            if nouveau not in self.TRANSITIONS[ancien]:
+                raise TransitionInvalide(f"Transition interdite ({axe}): {ancien} → {nouveau}")
+        
+        if etat_ns != self.ROUGE and etat_eo != self.ROUGE:
+            raise TransitionInvalide(f"Axes en conflit: Nord/Sud={etat_ns}, Est/Ouest={etat_eo}")
+    
+    def definir_etats(self, etat_ns=None, etat_eo=None, forcer=False):
+        """
+        Change l'état des axes et prévient les abonnés
+        
+        En mode automatique, chaque axe doit suivre la table TRANSITIONS
+        (ROUGE → VERT → ORANGE → ROUGE) et les deux axes ne peuvent pas
+        être ouverts en même temps. Le mode manuel, le clignotant et
+        forcer=True (initialisation d'un cycle) contournent la table.
+        
+        Args:
+            etat_ns (str, optional): Nouvel état Nord/Sud (None = inchangé)
+            etat_eo (str, optional): Nouvel état Est/Ouest (None = inchangé)
+            forcer (bool): Ne pas appliquer la table des transitions
+            
+        Returns:
+            bool: True si un état a changé
+            
+        Raises:
+            ValueError: État inconnu
+            TransitionInvalide: Transition refusée en mode automatique
+        """
+        ancien_ns = self.etats["NS"]
+        ancien_eo = self.etats["EO"]
+        if etat_ns is None:
+            etat_ns = ancien_ns
+        if etat_eo is None:
+            etat_eo = ancien_eo
+        
+        for etat in (etat_ns, etat_eo):
+            if etat not in self.TRANSITIONS:
+                raise ValueError(f"État de feu inconnu: {etat}")
+        
+        if etat_ns == ancien_ns and etat_eo == ancien_eo:
+            return False
+        
+        if self.auto_mode and not self.clignotant and not forcer:
+            self._valider(ancien_ns, ancien_eo, etat_ns, etat_eo)
+        
+        self.etats["NS"] = etat_ns
+        self.etats["EO"] = etat_eo
+        
+        for fonction in list(self.abonnes):
+            fonction(etat_ns, etat_eo, ancien_ns, ancien_eo)
+        return True
+    
+    def _avancer(self, axe, cible):
+        """
+        Fait suivre le cycle à un axe jusqu'à l'état cible, une transition à la fois
+        (VERT → ROUGE passe par ORANGE; chaque étape est validée et notifiée)
+        
+        Args:
+            axe (str): "NS" ou "EO"
+            cible (str): État à atteindre
+        
+        Raises:
+            ValueError: État inconnu
+            TransitionInvalide: Une étape ouvrirait les deux axes à la fois
+        """
+        if cible not in self.SUIVANT:
+            raise ValueError(f"État de feu inconnu: {cible}")
+        while self.etats[axe] != cible:
+            suivant = self.SUIVANT[self.etats[axe]]
+            if axe == "NS":
+                self.definir_etats(etat_ns=suivant)
+            else:
+                self.definir_etats(etat_eo=suivant)
+    
     def changer_etat(self, nouvel_etat, manuel=False, axe=None):
         """
         Change l'état du feu tricolore
@@ -52,28 +196,33 @@ class TrafficLight:
         Returns:
             tuple: (etat_nord_sud, etat_est_ouest)
         """
-        if axe == "NS" or axe is None:
-            ancien_ns = self.etat_nord_sud
-            self.etat_nord_sud = nouvel_etat
-            
-            # Gérer l'alternance automatique
-            if not manuel and self.auto_mode:
-                if nouvel_etat == self.VERT:
-                    self.etat_est_ouest = self.ROUGE
-                    self.axe_prioritaire = "NS"
-                elif nouvel_etat == self.ROUGE:
-                    # Préparer le passage à Est/Ouest
-                    pass
+        ancien_ns = self.etat_nord_sud
         
-        if axe == "EO" or (axe is None and self.auto_mode):
-            # En mode auto, inverser l'état
-            if self.auto_mode and axe is None:
-                if nouvel_etat == self.VERT:
-                    self.etat_est_ouest = self.ROUGE
-                elif nouvel_etat == self.ROUGE:
-                    self.etat_est_ouest = self.VERT
+        if manuel or not self.auto_mode:
+            # Hors cycle automatique: état appliqué directement
+            cible_ns = nouvel_etat if axe in ("NS", None) else None
+            cible_eo = nouvel_etat if axe == "EO" else None
+            self.definir_etats(cible_ns, cible_eo, forcer=manuel)
+        elif axe is not None:
+            self._avancer(axe, nouvel_etat)
+        else:
+            # En mode auto, l'autre axe prend l'état opposé en suivant son cycle:
+            # l'axe qui se ferme passe d'abord (par l'orange), puis l'autre s'ouvre
+            if nouvel_etat not in self.ETAT_OPPOSE:
+                raise ValueError(f"État de feu inconnu: {nouvel_etat}")
+            etat_eo = self.ETAT_OPPOSE[nouvel_etat]
+            if nouvel_etat == self.ROUGE:
+                self._avancer("NS", nouvel_etat)
+                self._avancer("EO", etat_eo)
             else:
-                self.etat_est_ouest = nouvel_etat
+                self._avancer("EO", etat_eo)
+                self._avancer("NS", nouvel_etat)
+        
+        if not manuel and self.auto_mode:
+            if self.etat_nord_sud == self.VERT:
+                self.axe_prioritaire = "NS"
+            elif self.etat_est_ouest == self.VERT:
+                self.axe_prioritaire = "EO"
         
         # Journalisation
         if manuel:
@@ -88,19 +237,19 @@ class TrafficLight:
         return (self.etat_nord_sud, self.etat_est_ouest)
     
     def alterner_priorite(self):
-        """Alterne la priorité entre Nord/Sud et Est/Ouest"""
+        """Alterne la priorité entre Nord/Sud et Est/Ouest (l'axe prioritaire passe par l'orange)"""
         if self.axe_prioritaire == "NS":
             # Passer la priorité à Est/Ouest
-            self.etat_nord_sud = self.ROUGE
-            self.etat_est_ouest = self.VERT
+            self._avancer("NS", self.ROUGE)
+            self._avancer("EO", self.VERT)
             self.axe_prioritaire = "EO"
-            print("🔄 Priorité → Est/Ouest (VERT) | Nord/Sud (ROUGE)")
+            self.logger.info("🔄 Priorité → Est/Ouest (VERT) | Nord/Sud (ROUGE)")
         else:
             # Passer la priorité à Nord/Sud
-            self.etat_nord_sud = self.VERT
-            self.etat_est_ouest = self.ROUGE
+            self._avancer("EO", self.ROUGE)
+            self._avancer("NS", self.VERT)
             self.axe_prioritaire = "NS"
-            print("🔄 Priorité → Nord/Sud (VERT) | Est/Ouest (ROUGE)")
+            self.logger.info("🔄 Priorité → Nord/Sud (VERT) | Est/Ouest (ROUGE)")
         
         return (self.etat_nord_sud, self.etat_est_ouest)
     
@@ -109,15 +258,12 @@ class TrafficLight:
         Retourne l'état du feu pour une direction donnée
         
         Args:
-            direction (str): 'horizontal' ou 'vertical'
+            direction (str): 'nord', 'sud', 'est', 'ouest', 'vertical' ou 'horizontal'
             
         Returns:
             str: État du feu (ROUGE, ORANGE, VERT)
         """
-        if direction == 'vertical':
-            return self.etat_nord_sud
-        else:  # horizontal
-            return self.etat_est_ouest
+        return self.etats[self.AXES[direction]]
     
     def activer_mode_automatique(self):
         """Active le mode automatique du feu"""
@@ -128,7 +274,7 @@ class TrafficLight:
             "Activation du mode automatique",
             etat_feu=self.etat_nord_sud
         )
-        print("✅ Mode automatique activé")
+        self.logger.info("✅ Mode automatique activé")
     
     def desactiver_mode_automatique(self):
         """Désactive le mode automatique (mode manuel)"""
@@ -139,16 +285,15 @@ class TrafficLight:
             "Activation du mode manuel",
             etat_feu=self.etat_nord_sud
         )
-        print("✅ Mode manuel activé")
+        self.logger.info("✅ Mode manuel activé")
     
     def activer_clignotant(self):
         """Active le mode clignotant (mode nuit)"""
         self.clignotant = True
         self.auto_mode = False
-        self.etat_nord_sud = self.ORANGE
-        self.etat_est_ouest = self.ORANGE
+        self.definir_etats(self.ORANGE, self.ORANGE)
         self.logger.log_activation_clignotant()
-        print("🌙 Mode clignotant activé (mode nuit)")
+        self.logger.info("🌙 Mode clignotant activé (mode nuit)")
     
     def get_couleur_rgb(self):
         """
@@ -167,24 +312,15 @@ class TrafficLight:
     
     def est_rouge(self, direction='vertical'):
         """Vérifie si le feu est rouge pour une direction"""
-        if direction == 'vertical':
-            return self.etat_nord_sud == self.ROUGE
-        else:
-            return self.etat_est_ouest == self.ROUGE
+        return self.get_etat_pour_direction(direction) == self.ROUGE
     
     def est_orange(self, direction='vertical'):
         """Vérifie si le feu est orange pour une direction"""
-        if direction == 'vertical':
-            return self.etat_nord_sud == self.ORANGE
-        else:
-            return self.etat_est_ouest == self.ORANGE
+        return self.get_etat_pour_direction(direction) == self.ORANGE
     
     def est_vert(self, direction='vertical'):
         """Vérifie si le feu est vert pour une direction"""
-        if direction == 'vertical':
-            return self.etat_nord_sud == self.VERT
-        else:
-            return self.etat_est_ouest == self.VERT
+        return self.get_etat_pour_direction(direction) == self.VERT
     
     def get_etat(self, direction='vertical'):
         """
@@ -196,10 +332,7 @@ class TrafficLight:
         Returns:
             str: État actuel (ROUGE, ORANGE, VERT)
         """
-        if direction == 'vertical':
-            return self.etat_nord_sud
-        else:
-            return self.etat_est_ouest
+        return self.get_etat_pour_direction(direction)
     
     def __str__(self):
         """Représentation textuelle du feu"""
@@ -216,7 +349,7 @@ if __name__ == "__main__":
     from logger import Logger
     
     # Créer un logger de test
-    logger = Logger()
+    logger = Logger(tampon_console=False)
     
     # Créer un feu tricolore
     feu = TrafficLight(logger)
@@ -239,8 +372,18 @@ if __name__ == "__main__":
     print("\n3️⃣ Test mode clignotant:")
     feu.activer_clignotant()
     
-    # Test 4: Vérifications d'état
-    print("\n4️⃣ Test vérifications:")
+    # Test 4: Transition refusée par la table
+    print("\n4️⃣ Test transition invalide (VERT → ROUGE sans orange):")
+    feu_auto = TrafficLight(logger)
+    feu_auto.abonner(lambda ns, eo, ancien_ns, ancien_eo: print(f"   🔔 {ancien_ns}/{ancien_eo} → {ns}/{eo}"))
+    feu_auto.definir_etats(TrafficLight.VERT, TrafficLight.ROUGE)
+    try:
+        feu_auto.definir_etats(TrafficLight.ROUGE, TrafficLight.VERT)
+    except TransitionInvalide as e:
+        print(f"   ✅ Refusée: {e}")
+    
+    # Test 5: Vérifications d'état
+    print("\n5️⃣ Test vérifications:")
     print(f"Est rouge? {feu.est_rouge()}")
     print(f"Est orange? {feu.est_orange()}")
     print(f"Est vert? {feu.est_vert()}")
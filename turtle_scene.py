@@ -4,9 +4,100 @@ Dessin du carrefour, routes et feu tricolore avec Turtle
 STYLE: Routes larges bleues comme sur l'image de référence
 """
 
+import os
+import hashlib
+import tkinter as tk
 import turtle
 
 
+# Couleur de fond de la fenêtre
+COULEUR_FOND = "#E8E8E8"
+
+# Dossier du cache des images de fond (une image par taille de scène), à côté
+# du module et non du répertoire courant
+DOSSIER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+# Positions des 4 feux - AUX COINS comme l'image
+POSITIONS_FEUX = {
+    # NORD : Feu VERTICAL en bas à gauche du carrefour
+    'nord': {'x': -140, 'y': 130, 'vertical': True},
+    
+    # SUD : Feu VERTICAL en haut à droite du carrefour  
+    'sud': {'x': 140, 'y': -130, 'vertical': True},
+    
+    # EST : Feu HORIZONTAL en haut à gauche du carrefour
+    'est': {'x': 130, 'y': 140, 'vertical': False},
+    
+    # OUEST : Feu HORIZONTAL en bas à droite du carrefour
+    'ouest': {'x': -130, 'y': -140, 'vertical': False}
+}
+
+
+def _tirets(debut, fin, longueur=40):
+    """
+    Découpe une ligne discontinue en segments (un trait, un vide, ...)
+    
+    Returns:
+        list: [(début, fin)] des traits
+    """
+    return [(a, min(a + longueur, fin)) for a in range(debut, fin, 2 * longueur)]
+
+
+def rectangles_fond():
+    """
+    Décrit la partie fixe de la scène (routes, marquages, boîtiers des feux)
+    
+    Returns:
+        list: [(couleur, x1, y1, x2, y2)] en coordonnées Turtle, dans l'ordre de dessin
+    """
+    rectangles = []
+    bleu = "#A8C5DD"  # Bleu clair comme l'image
+    
+    # ========== ROUTES (BLEUES, 240px) ==========
+    rectangles.append((bleu, -400, -120, 400, 120))
+    rectangles.append((bleu, -120, -400, 120, 400))
+    
+    # ========== LIGNES MÉDIANES (jaunes discontinues, 3px) ==========
+    # S'arrêtent avant les passages piétons (au centre du carrefour)
+    for debut, fin in (_tirets(-400, -120) + _tirets(120, 400)):
+        rectangles.append(("yellow", debut, -1.5, fin, 1.5))
+        rectangles.append(("yellow", -1.5, debut, 1.5, fin))
+    
+    # ========== BORDURES BLANCHES DES ROUTES (3px) ==========
+    for position in (120, -120):
+        rectangles.append(("white", -400, position - 1.5, 400, position + 1.5))
+        rectangles.append(("white", position - 1.5, -400, position + 1.5, 400))
+    
+    # ========== PASSAGES PIÉTONS (bandes blanches de 8px) ==========
+    for i in range(16):
+        c = -115 + i * 15
+        rectangles.append(("white", c - 4, 125, c + 4, 155))     # Nord
+        rectangles.append(("white", c - 4, -155, c + 4, -125))   # Sud
+        rectangles.append(("white", 125, c - 4, 155, c + 4))     # Est
+        rectangles.append(("white", -155, c - 4, -125, c + 4))   # Ouest
+    
+    # ========== BOÎTIERS DES FEUX ==========
+    for pos in POSITIONS_FEUX.values():
+        x, y = pos['x'], pos['y']
+        if pos['vertical']:
+            rectangles.append(("black", x - 10, y - 45, x + 10, y + 45))
+        else:
+            rectangles.append(("black", x - 45, y - 10, x + 45, y + 10))
+    
+    return rectangles
+
+
+# Couleur d'une lampe éteinte et de chaque lampe allumée
+COULEUR_ETEINTE = "gray"
+COULEURS_LAMPES = {'rouge': "red", 'orange': "orange", 'vert': "lime"}
+
+# Lampe allumée pour chaque état du feu
+LAMPE_PAR_ETAT = {"ROUGE": 'rouge', "ORANGE": 'orange', "VERT": 'vert'}
+
+DIRECTIONS_NS = ('nord', 'sud')
+DIRECTIONS_EO = ('est', 'ouest')
+
+
 class TurtleScene:
     """Gestion de la scène graphique avec Turtle"""
     
@@ -21,8 +112,13 @@ class TurtleScene:
         self.screen = turtle.Screen()
         self.screen.setup(width=largeur, height=hauteur)
         self.screen.title("Simulation Feu Tricolore - Ville de Thiès")
-        self.screen.bgcolor("#E8E8E8")  # Gris clair comme l'image
+        self.screen.bgcolor(COULEUR_FOND)  # Gris clair comme l'image
         self.screen.tracer(0)
+        self.largeur = largeur
+        self.hauteur = hauteur
+        
+        # Image du fond (carrefour), calculée une seule fois
+        self.image_fond = None
         
         # 4 feux (un pour chaque direction)
         self.feu_turtles = {
@@ -32,6 +128,12 @@ class TurtleScene:
             'ouest': {}
         }
         
+        # Couleur affichée de chaque lampe {(direction, lampe): couleur}
+        self.couleurs_lampes = {}
+        
+        # True si quelque chose a changé depuis le dernier screen.update()
+        self.modifiee = True
+        
         # Dessiner la scène
         self.dessiner_carrefour()
         self.dessiner_feux_tricolores()
@@ -40,206 +142,69 @@ class TurtleScene:
     
     def dessiner_carrefour(self):
         """Dessine le carrefour avec routes larges bleues et marquages"""
-        drawer = turtle.Turtle()
-        drawer.hideturtle()
-        drawer.speed(0)
-        drawer.penup()
-        
-        # ========== ROUTE HORIZONTALE (BLEUE) ==========
-        drawer.goto(-400, -120)
-        drawer.pendown()
-        drawer.color("#A8C5DD")  # Bleu clair comme l'image
-        drawer.begin_fill()
-        for _ in range(2):
-            drawer.forward(800)
-            drawer.left(90)
-            drawer.forward(240)  # ✅ Route très large
-            drawer.left(90)
-        drawer.end_fill()
-        
-        # ========== ROUTE VERTICALE (BLEUE) ==========
-        drawer.penup()
-        drawer.goto(-120, -400)
-        drawer.pendown()
-        drawer.begin_fill()
-        for _ in range(2):
-            drawer.forward(240)  # ✅ Route très large
-            drawer.left(90)
-            drawer.forward(800)
-            drawer.left(90)
-        drawer.end_fill()
-        
-        # ========== LIGNE MÉDIANE HORIZONTALE (jaune discontinue) ==========
-        # S'arrête avant les passages piétons (au centre du carrefour)
-        drawer.penup()
-        drawer.goto(-400, 0)
-        drawer.setheading(0)
-        drawer.pendown()
-        drawer.color("yellow")
-        drawer.width(3)
-        
-        # Ligne de gauche jusqu'au carrefour
-        for i in range(7):  # S'arrête à -120 (bord route verticale)
-            if i % 2 == 0:
-                drawer.forward(40)
-            else:
-                drawer.penup()
-                drawer.forward(40)
-                drawer.pendown()
-        
-        # Saut du carrefour (zone des passages piétons)
-        drawer.penup()
-        drawer.goto(120, 0)  # Reprend après le carrefour
-        drawer.pendown()
-        
-        # Ligne de droite après le carrefour
-        for i in range(7):
-            if i % 2 == 0:
-                drawer.forward(40)
-            else:
-                drawer.penup()
-                drawer.forward(40)
-                drawer.pendown()
-        
-        # ========== LIGNE MÉDIANE VERTICALE (jaune discontinue) ==========
-        # S'arrête avant les passages piétons (au centre du carrefour)
-        drawer.penup()
-        drawer.goto(0, -400)
-        drawer.setheading(90)
-        drawer.pendown()
-        
-        # Ligne du bas jusqu'au carrefour
-        for i in range(7):  # S'arrête à -120 (bord route horizontale)
-            if i % 2 == 0:
-                drawer.forward(40)
-            else:
-                drawer.penup()
-                drawer.forward(40)
-                drawer.pendown()
-        
-        # Saut du carrefour
-        drawer.penup()
-        drawer.goto(0, 120)  # Reprend après le carrefour
-        drawer.pendown()
-        
-        # Ligne du haut après le carrefour
-        for i in range(7):
-            if i % 2 == 0:
-                drawer.forward(40)
-            else:
-                drawer.penup()
-                drawer.forward(40)
-                drawer.pendown()
-        
-        # ========== BORDURES BLANCHES DES ROUTES ==========
-        drawer.penup()
-        drawer.color("white")
-        drawer.width(3)
-        
-        # Bordure haute route horizontale
-        drawer.goto(-400, 120)
-        drawer.pendown()
-        drawer.goto(400, 120)
-        
-        # Bordure basse route horizontale
-        drawer.penup()
-        drawer.goto(-400, -120)
-        drawer.pendown()
-        drawer.goto(400, -120)
-        
-        # Bordure gauche route verticale
-        drawer.penup()
-        drawer.goto(-120, -400)
-        drawer.pendown()
-        drawer.goto(-120, 400)
-        
-        # Bordure droite route verticale
-        drawer.penup()
-        drawer.goto(120, -400)
-        drawer.pendown()
-        drawer.goto(120, 400)
-        
-        # ========== PASSAGES PIÉTONS (blancs épais) - DANS LE CARRÉ ==========
-        drawer.penup()
-        drawer.color("white")
-        drawer.width(8)
-        
-        # Passage piéton Nord (à l'intérieur du carrefour, juste après la bordure)
-        for i in range(16):
-            drawer.goto(-115 + i*15, 125)  # Changé de 220 à 125 (dans le carré)
-            drawer.setheading(90)
-            drawer.pendown()
-            drawer.forward(30)  # Plus court
-            drawer.penup()
-        
-        # Passage piéton Sud (à l'intérieur du carrefour)
-        for i in range(16):
-            drawer.goto(-115 + i*15, -155)  # Changé de -240 à -155 (dans le carré)
-            drawer.setheading(90)
-            drawer.pendown()
-            drawer.forward(30)  # Plus court
-            drawer.penup()
-        
-        # Passage piéton Est (à l'intérieur du carrefour)
-        for i in range(16):
-            drawer.goto(125, -115 + i*15)  # Changé de 220 à 125 (dans le carré)
-            drawer.setheading(0)
-            drawer.pendown()
-            drawer.forward(30)  # Plus court
-            drawer.penup()
-        
-        # Passage piéton Ouest (à l'intérieur du carrefour)
-        for i in range(16):
-            drawer.goto(-155, -115 + i*15)  # Changé de -240 à -155 (dans le carré)
-            drawer.setheading(0)
-            drawer.pendown()
-            drawer.forward(30)  # Plus court
-            drawer.penup()
-        
+        self._placer_fond()
         print("✅ Carrefour dessiné (style image - routes bleues 240px)")
     
-    def dessiner_feux_tricolores(self):
-        """Dessine 4 feux tricolores (aux coins du carrefour, pas au milieu)"""
-        
-        # Positions des 4 feux - AUX COINS comme l'image
-        positions_feux = {
-            # NORD : Feu VERTICAL en bas à gauche du carrefour
-            'nord': {'x': -140, 'y': 130, 'vertical': True},
-            
-            # SUD : Feu VERTICAL en haut à droite du carrefour  
-            'sud': {'x': 140, 'y': -130, 'vertical': True},
-            
-            # EST : Feu HORIZONTAL en haut à gauche du carrefour
-            'est': {'x': 130, 'y': 140, 'vertical': False},
-            
-            # OUEST : Feu HORIZONTAL en bas à droite du carrefour
-            'ouest': {'x': -130, 'y': -140, 'vertical': False}
-        }
+    def _placer_fond(self):
+        """Place le fond du carrefour (routes, marquages, boîtiers des feux) en une seule image"""
+        if self.image_fond is None:
+            self.image_fond = self._charger_fond()
+        
+        canvas = self.get_canvas()
+        canvas.delete("fond")
+        canvas.create_image(0, 0, image=self.image_fond, tags="fond")
+        canvas.tag_lower("fond")
+        self.modifiee = True
+    
+    def _chemin_cache_fond(self, rectangles):
+        """Chemin de l'image de fond en cache, propre à la taille et au contenu de la scène"""
+        signature = hashlib.md5(repr(rectangles).encode()).hexdigest()[:8]
+        return os.path.join(DOSSIER_CACHE, f"fond_{self.largeur}x{self.hauteur}_{signature}.png")
+    
+    def _charger_fond(self):
+        """
+        Retourne l'image de fond: lue depuis le cache, sinon dessinée puis mise en cache
         
-        for direction, pos in positions_feux.items():
+        Returns:
+            tk.PhotoImage: Image de la taille de la scène
+        """
+        canvas = self.get_canvas()
+        rectangles = rectangles_fond()
+        chemin = self._chemin_cache_fond(rectangles)
+        
+        if os.path.exists(chemin):
+            try:
+                return tk.PhotoImage(file=chemin, master=canvas)
+            except tk.TclError:
+                pass  # Cache illisible: redessiner
+        
+        image = tk.PhotoImage(width=self.largeur, height=self.hauteur, master=canvas)
+        image.put(COULEUR_FOND, to=(0, 0, self.largeur, self.hauteur))
+        for couleur, x1, y1, x2, y2 in rectangles:
+            # Repère Turtle (centre, Y vers le haut) → pixels de l'image (coin, Y vers le bas)
+            gauche = max(0, round(x1 + self.largeur / 2))
+            droite = min(self.largeur, round(x2 + self.largeur / 2))
+            haut = max(0, round(self.hauteur / 2 - y2))
+            bas = min(self.hauteur, round(self.hauteur / 2 - y1))
+            if gauche < droite and haut < bas:
+                image.put(couleur, to=(gauche, haut, droite, bas))
+        
+        try:
+            os.makedirs(DOSSIER_CACHE, exist_ok=True)
+            image.write(chemin, format='png')
+        except (OSError, tk.TclError):
+            pass  # Pas de cache possible: l'image reste en mémoire
+        return image
+    
+    def dessiner_feux_tricolores(self):
+        """Crée les lumières des 4 feux (les boîtiers font partie du fond)"""
+        for direction, pos in POSITIONS_FEUX.items():
             x_base = pos['x']
             y_base = pos['y']
             is_vertical = pos['vertical']
             
-            # ========== BOÎTIER DU FEU ==========
-            boitier = turtle.Turtle()
-            boitier.hideturtle()
-            boitier.speed(0)
-            boitier.penup()
-            
             if is_vertical:
                 # ===== FEU VERTICAL (Nord/Sud) =====
-                boitier.goto(x_base - 10, y_base - 45)
-                boitier.pendown()
-                boitier.color("black")
-                boitier.begin_fill()
-                for _ in range(2):
-                    boitier.forward(20)
-                    boitier.left(90)
-                    boitier.forward(90)
-                    boitier.left(90)
-                boitier.end_fill()
-                
                 # Lumières verticales (Rouge en haut, Vert en bas)
                 lumiere_positions = {
                     'rouge': y_base + 30,
@@ -256,20 +221,10 @@ class TurtleScene:
                     lumiere.penup()
                     lumiere.goto(x_base, y_lumiere)
                     self.feu_turtles[direction][couleur] = lumiere
+                    self.couleurs_lampes[(direction, couleur)] = COULEUR_ETEINTE
             
             else:
                 # ===== FEU HORIZONTAL (Est/Ouest) =====
-                boitier.goto(x_base - 45, y_base - 10)
-                boitier.pendown()
-                boitier.color("black")
-                boitier.begin_fill()
-                for _ in range(2):
-                    boitier.forward(90)
-                    boitier.left(90)
-                    boitier.forward(20)
-                    boitier.left(90)
-                boitier.end_fill()
-                
                 # Lumières horizontales (Rouge à gauche, Vert à droite)
                 lumiere_positions = {
                     'rouge': x_base - 30,
@@ -286,10 +241,10 @@ class TurtleScene:
                     lumiere.penup()
                     lumiere.goto(x_lumiere, y_base)
                     self.feu_turtles[direction][couleur] = lumiere
+                    self.couleurs_lampes[(direction, couleur)] = COULEUR_ETEINTE
             
             # Allumer rouge par défaut
-            self.feu_turtles[direction]['rouge'].color("red")
-            self.feu_turtles[direction]['rouge'].fillcolor("red")
+            self._colorer_lampe(direction, 'rouge', COULEURS_LAMPES['rouge'])
         
         print("✅ 4 feux tricolores créés aux COINS du carrefour:")
         print("   - NORD: Vertical en bas-gauche")
@@ -313,100 +268,87 @@ class TurtleScene:
             else:
                 etat_eo = "ROUGE"
         
-        # Éteindre toutes les lumières
-        for direction in ['nord', 'sud', 'est', 'ouest']:
-            for lumiere in self.feu_turtles[direction].values():
-                lumiere.color("gray")
-                lumiere.fillcolor("gray")
-        
-        # Allumer Nord et Sud
-        for direction in ['nord', 'sud']:
-            if etat_ns == "ROUGE":
-                self.feu_turtles[direction]['rouge'].color("red")
-                self.feu_turtles[direction]['rouge'].fillcolor("red")
-            elif etat_ns == "ORANGE":
-                self.feu_turtles[direction]['orange'].color("orange")
-                self.feu_turtles[direction]['orange'].fillcolor("orange")
-            elif etat_ns == "VERT":
-                self.feu_turtles[direction]['vert'].color("lime")
-                self.feu_turtles[direction]['vert'].fillcolor("lime")
-        
-        # Allumer Est et Ouest
-        for direction in ['est', 'ouest']:
-            if etat_eo == "ROUGE":
-                self.feu_turtles[direction]['rouge'].color("red")
-                self.feu_turtles[direction]['rouge'].fillcolor("red")
-            elif etat_eo == "ORANGE":
-                self.feu_turtles[direction]['orange'].color("orange")
-                self.feu_turtles[direction]['orange'].fillcolor("orange")
-            elif etat_eo == "VERT":
-                self.feu_turtles[direction]['vert'].color("lime")
-                self.feu_turtles[direction]['vert'].fillcolor("lime")
+        # Seules les lampes dont la couleur change sont modifiées
+        for directions, etat in ((DIRECTIONS_NS, etat_ns), (DIRECTIONS_EO, etat_eo)):
+            allumee = LAMPE_PAR_ETAT.get(etat)
+            for direction in directions:
+                for lampe, couleur in COULEURS_LAMPES.items():
+                    self._colorer_lampe(direction, lampe,
+                                        couleur if lampe == allumee else COULEUR_ETEINTE)
     
     def clignoter_orange(self, visible):
         """Fait clignoter les feux orange (mode nuit)"""
-        if visible:
-            for direction in ['nord', 'sud', 'est', 'ouest']:
-                self.feu_turtles[direction]['orange'].color("orange")
-                self.feu_turtles[direction]['orange'].fillcolor("orange")
-        else:
-            for direction in ['nord', 'sud', 'est', 'ouest']:
-                self.feu_turtles[direction]['orange'].color("gray")
-                self.feu_turtles[direction]['orange'].fillcolor("gray")
+        couleur = COULEURS_LAMPES['orange'] if visible else COULEUR_ETEINTE
+        for direction in DIRECTIONS_NS + DIRECTIONS_EO:
+            self._colorer_lampe(direction, 'orange', couleur)
     
-    def update(self):
-        """Rafraîchit l'écran"""
-        self.screen.update()
+    def _colorer_lampe(self, direction, lampe, couleur):
+        """
+        Change la couleur d'une lampe si elle est différente de l'actuelle
+        
+        Args:
+            direction (str): Feu concerné ('nord', 'sud', 'est', 'ouest')
+            lampe (str): 'rouge', 'orange' ou 'vert'
+            couleur (str): Couleur à afficher
+        """
+        cle = (direction, lampe)
+        if self.couleurs_lampes.get(cle) == couleur:
+            return
+        lumiere = self.feu_turtles[direction][lampe]
+        lumiere.color(couleur)
+        lumiere.fillcolor(couleur)
+        self.couleurs_lampes[cle] = couleur
+        self.modifiee = True
     
-    def clear_screen(self):
-        """Efface tout l'écran"""
-        self.screen.clear()
-        self.screen.bgcolor("#E8E8E8")
+    def marquer_modifiee(self):
+        """Signale un changement à afficher (voitures déplacées, dessin, ...)"""
+        self.modifiee = True
+    
+    def update(self, forcer=False):
+        """
+        Rafraîchit l'écran, seulement si quelque chose a changé
+        
+        Args:
+            forcer (bool): Rafraîchir même sans changement signalé
+        
+        Returns:
+            bool: True si l'écran a été redessiné
+        """
+        if not (self.modifiee or forcer):
+            return False
+        self.screen.update()
+        self.modifiee = False
+        return True
     
     def get_screen(self):
         """Retourne l'objet Screen de Turtle"""
         return self.screen
     
+    def get_canvas(self):
+        """
+        Retourne le Canvas Tk sous-jacent
+        
+        Le repère Turtle y est centré avec l'axe Y inversé:
+        le point Turtle (x, y) est le point Canvas (x, -y)
+        """
+        return self.screen.getcanvas()
+    
     def fermer(self):
         """Ferme la fenêtre Turtle"""
         self.screen.bye()
     
     def ajouter_texte(self, x, y, texte, taille=12, couleur="black"):
-        """Ajoute du texte sur la scène"""
-        writer = turtle.Turtle()
-        writer.hideturtle()
-        writer.penup()
-        writer.goto(x, y)
-        writer.color(couleur)
-        writer.write(texte, align="center", font=("Arial", taille, "bold"))
+        """Ajoute du texte sur la scène (élément Canvas placé comme turtle.write)"""
+        self.get_canvas().create_text(x - 1, -y, text=texte, anchor="s", fill=couleur,
+                                      font=("Arial", taille, "bold"), tags="texte")
+        self.modifiee = True
     
     def dessiner_legende(self):
         """Dessine une légende pour l'utilisateur"""
-        legend_box = turtle.Turtle()
-        legend_box.hideturtle()
-        legend_box.speed(0)
-        legend_box.penup()
-        legend_box.goto(-380, 320)
-        legend_box.pendown()
-        legend_box.color("white")
-        legend_box.begin_fill()
-        for _ in range(2):
-            legend_box.forward(200)
-            legend_box.right(90)
-            legend_box.forward(80)
-            legend_box.right(90)
-        legend_box.end_fill()
-        
-        legend_box.penup()
-        legend_box.goto(-380, 320)
-        legend_box.pendown()
-        legend_box.color("black")
-        legend_box.width(2)
-        for _ in range(2):
-            legend_box.forward(200)
-            legend_box.right(90)
-            legend_box.forward(80)
-            legend_box.right(90)
+        # Cadre blanc bordé de noir de (-380, 320) à (-180, 240) dans le repère Turtle
+        self.get_canvas().create_rectangle(-380, -320, -180, -240, fill="white",
+                                           outline="black", width=2, tags="legende")
+        self.modifiee = True
         
         self.ajouter_texte(-280, 300, "Feu Tricolore - Thiès", 10, "black")
         self.ajouter_texte(-280, 280, "🔴 Rouge = Arrêt", 8, "darkred")
@@ -3,22 +3,63 @@ Module de gestion de flotte de véhicules intelligents
 Gestionnaire pour créer et gérer plusieurs voitures avec détection de dangers
 """
 
-from vehicles import Vehicle
+from vehicles import Vehicle, ProfilVehicule, HORIZONTALES, SENS
+from rendu import Rendu
+
+
+def _cle_voie(voiture):
+    """
+    Retourne la voie d'une voiture: sa direction et sa coordonnée latérale
+    
+    Args:
+        voiture (Vehicle): Voiture
+        
+    Returns:
+        tuple: (code de direction, position latérale arrondie)
+    """
+    code = voiture.code_direction
+    return (code, round(voiture.y if HORIZONTALES[code] else voiture.x))
+
+
+def progression(voiture):
+    """
+    Position de la voiture le long de son sens de circulation
+    
+    Args:
+        voiture (Vehicle): Voiture
+        
+    Returns:
+        float: Plus grande pour les voitures les plus avancées
+    """
+    code = voiture.code_direction
+    return SENS[code] * (voiture.x if HORIZONTALES[code] else voiture.y)
 
 
 class VehicleManager:
     """Gestionnaire de flotte de véhicules intelligents"""
     
-    def __init__(self, logger):
+    def __init__(self, logger, moteur=None, rendu=None, facteur_pas=1.0):
         """
         Initialise le gestionnaire
         
         Args:
             logger (Logger): Instance du logger
+            moteur (MoteurVectoriel, optional): Moteur vectoriel qui calcule
+                les ticks de toutes les voitures (None = mise à jour par objet)
+            rendu (Rendu, optional): Affichage des voitures (None = aucun)
+            facteur_pas (float): Pas de l'horloge / PAS_DEFAUT (voir ProfilVehicule)
         """
         self.logger = logger
+        self.facteur_pas = facteur_pas
+        self.moteur = moteur
+        self.rendu = rendu if rendu is not None else Rendu()
         self.voitures = []
         self.feux_tricolores = []
+        
+        # Voies: {(code de direction, position latérale): [voitures, la plus avancée en tête]}
+        self.voies = {}
+        # Profils cinématiques partagés: {(vmax, acc, dec, sécurité): ProfilVehicule}
+        self.profils = {}
         self.images_vehicules = {}  # Dictionnaire pour stocker les chemins d'images
     
     def definir_images_vehicules(self, images_dict):
@@ -30,7 +71,7 @@ class VehicleManager:
                                Par exemple: {'est': 'car_east.gif', 'ouest': 'car_west.gif'}
         """
         self.images_vehicules = images_dict
-        print(f"📷 Images de véhicules configurées: {len(images_dict)} directions")
+        self.logger.info(f"📷 Images de véhicules configurées: {len(images_dict)} directions")
     
     def ajouter_voiture(self, x, y, direction, scenario_config, image_path=None):
         """
@@ -50,18 +91,134 @@ class VehicleManager:
         if image_path is None and direction in self.images_vehicules:
             image_path = self.images_vehicules[direction]
         
-        voiture = Vehicle(x, y, direction, self.logger, scenario_config, image_path)
+        voiture = Vehicle(x, y, direction, self.logger, scenario_config, image_path,
+                          profil=self._profil(scenario_config))
         self.voitures.append(voiture)
+        self._inserer_dans_voie(voiture)
+        if self.moteur is not None:
+            self.moteur.ajouter(voiture)
+        self.rendu.ajouter_voiture(voiture)
         
         self.logger.log_creation_voiture(
             voiture.id,
             voiture.x,
             voiture.y,
-            voiture.vitesse
+            voiture.vitesse,
+            direction=voiture.direction
         )
         
         return voiture
     
+    def _profil(self, scenario_config):
+        """
+        Retourne le profil partagé par les voitures d'une configuration
+        
+        Args:
+            scenario_config (dict): Configuration du scénario
+            
+        Returns:
+            ProfilVehicule: Profil créé au premier appel puis réutilisé
+        """
+        cle = (scenario_config['vitesse_normale'], scenario_config['acceleration'],
+               scenario_config['deceleration'], scenario_config.get('distance_securite', 50))
+        profil = self.profils.get(cle)
+        if profil is None:
+            profil = self.profils[cle] = ProfilVehicule(self.logger, scenario_config,
+                                                        self.facteur_pas)
+        return profil
+    
+    # ========== VOIES ORDONNÉES ==========
+    
+    def _inserer_dans_voie(self, voiture):
+        """
+        Ajoute une voiture à sa voie en respectant l'ordre de progression
+        
+        Args:
+            voiture (Vehicle): Voiture à insérer
+        """
+        voiture.voie = _cle_voie(voiture)
+        voie = self.voies.setdefault(voiture.voie, [])
+        voie.append(voiture)
+        self._reordonner_voie(voie)
+    
+    def _retirer_de_voie(self, voiture):
+        """
+        Retire une voiture de sa voie
+        
+        Args:
+            voiture (Vehicle): Voiture à retirer
+        """
+        voie = self.voies.get(voiture.voie)
+        if voie is None or voiture not in voie:
+            return
+        voie.remove(voiture)
+        if voie:
+            self._numeroter_voie(voie)
+        else:
+            del self.voies[voiture.voie]
+    
+    def _reordonner_voie(self, voie):
+        """Trie une voie (tête en premier) et met à jour les rangs"""
+        # Les voitures ne se dépassent pas: la liste est déjà presque triée
+        # et le tri (Timsort) reste linéaire
+        voie.sort(key=progression, reverse=True)
+        self._numeroter_voie(voie)
+    
+    def _numeroter_voie(self, voie):
+        """Enregistre dans chaque voiture son rang dans la voie"""
+        for rang, voiture in enumerate(voie):
+            voiture.rang_voie = rang
+    
+    def mettre_a_jour_voies(self):
+        """Réordonne toutes les voies (à appeler une fois par tick, en O(n))"""
+        for voie in self.voies.values():
+            self._reordonner_voie(voie)
+    
+    def get_voiture_devant(self, voiture):
+        """
+        Retourne la voiture qui précède dans la même voie (O(1))
+        
+        Args:
+            voiture (Vehicle): Voiture de référence
+            
+        Returns:
+            Vehicle: Voiture de devant, ou None si la voiture est en tête
+        """
+        voie = self.voies.get(voiture.voie)
+        if voie is None or voiture.rang_voie == 0:
+            return None
+        return voie[voiture.rang_voie - 1]
+    
+    def get_voiture_derriere(self, voiture):
+        """
+        Retourne la voiture qui suit dans la même voie (O(1))
+        
+        Args:
+            voiture (Vehicle): Voiture de référence
+            
+        Returns:
+            Vehicle: Voiture de derrière, ou None si la voiture est la dernière
+        """
+        voie = self.voies.get(voiture.voie)
+        if voie is None or voiture.rang_voie + 1 >= len(voie):
+            return None
+        return voie[voiture.rang_voie + 1]
+    
+    def detecter_danger(self, voiture, feux_tricolores=None):
+        """
+        Détecte les dangers d'une voiture en ne regardant que ses voisines de voie
+        
+        Args:
+            voiture (Vehicle): Voiture concernée
+            feux_tricolores (list, optional): Feux tricolores
+            
+        Returns:
+            dict: Dangers détectés (voir Vehicle.detecter_danger)
+        """
+        voisines = [v for v in (self.get_voiture_devant(voiture),
+                                self.get_voiture_derriere(voiture)) if v is not None]
+        return voiture.detecter_danger(voisines, feux_tricolores)
+    
     def enregistrer_feux(self, feux_tricolores):
         """
         Enregistre les feux tricolores pour la détection
@@ -70,26 +227,7 @@ class VehicleManager:
             feux_tricolores (list): Liste des objets feux tricolores
         """
         self.feux_tricolores = feux_tricolores
-        print(f"🚦 {len(feux_tricolores)} feux tricolores enregistrés")
-    
-    def mettre_a_jour(self, feu):
-        for v in self.vehicules[:]:
-            voiture_devant = self.voiture_devant(v)
-            etat = feu.etat_ns if v.direction in ["N", "S"] else feu.etat_ew
-
-            if voiture_devant:
-                v.arreter()
-            elif etat == "ROUGE" and self._zone_arret(v):
-                v.arreter()
-            elif etat == "ORANGE" and self._zone_arret(v):
-                v.ralentir()
-            else:
-                v.demarrer()
-                v.avancer()
-
-            if v.est_hors_ecran():
-                v.t.hideturtle()
-                self.vehicules.remove(v)
+        self.logger.info(f"🚦 {len(feux_tricolores)} feux tricolores enregistrés")
     
     def supprimer_voiture(self, voiture):
         """
@@ -100,7 +238,11 @@ class VehicleManager:
         """
         if voiture in self.voitures:
             voiture.detruire()
+            self.rendu.retirer_voiture(voiture)
             self.voitures.remove(voiture)
+            self._retirer_de_voie(voiture)
+            if self.moteur is not None:
+                self.moteur.retirer(voiture)
     
     def nettoyer_voitures_inactives(self):
         """Supprime toutes les voitures inactives ou hors écran"""
@@ -115,7 +257,8 @@ class VehicleManager:
         Returns:
             int: Nombre de voitures
         """
-        return len([v for v in self.voitures if v.actif])
+        # Une voiture désactivée est retirée de la liste aussitôt (supprimer_voiture)
+        return len(self.voitures)
     
     def get_voitures_en_danger(self):
         """
@@ -130,20 +273,28 @@ class VehicleManager:
         """Active la détection de dangers pour toutes les voitures"""
         for voiture in self.voitures:
             voiture.activer_detection()
-        print("✅ Détection de dangers activée pour toutes les voitures")
+        if self.moteur is not None:
+            self.moteur.definir_detection(True)
+        self.logger.info("✅ Détection de dangers activée pour toutes les voitures")
     
     def desactiver_detection_tous(self):
         """Désactive la détection de dangers pour toutes les voitures"""
         for voiture in self.voitures:
             voiture.desactiver_detection()
-        print("⚠️ Détection de dangers désactivée pour toutes les voitures")
+        if self.moteur is not None:
+            self.moteur.definir_detection(False)
+        self.logger.info("⚠️ Détection de dangers désactivée pour toutes les voitures")
     
     def detruire_toutes(self):
         """Détruit toutes les voitures"""
         for voiture in self.voitures[:]:
             voiture.detruire()
+            self.rendu.retirer_voiture(voiture)
         self.voitures.clear()
-        print("🗑️  Toutes les voitures ont été supprimées")
+        self.voies.clear()
+        if self.moteur is not None:
+            self.moteur.vider()
+        self.logger.info("🗑️  Toutes les voitures ont été supprimées")
     
     def afficher_statistiques(self):
         """Affiche les statistiques de la flotte"""
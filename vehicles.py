@@ -1,39 +1,83 @@
 """
 Module de gestion d'un véhicule individuel intelligent
-Animation et comportement d'une voiture avec Turtle
-Support des images et détection de dangers
+Comportement d'une voiture (sans affichage: voir rendu.py)
+Détection de dangers
 """
 
-import turtle
-import random
-import os
+from sinks import NIVEAU_DEBUG
+
+
+# ========== DIRECTIONS ==========
+
+# Codes entiers des directions (indices des tables ci-dessous)
+EST = 0
+OUEST = 1
+NORD = 2
+SUD = 3
+
+DIRECTIONS = ('est', 'ouest', 'nord', 'sud')
+CODES_DIRECTION = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+# Déplacement le long de l'axe X (est/ouest) ou de l'axe Y (nord/sud)
+HORIZONTALES = (True, True, False, False)
+
+# Sens de circulation sur l'axe: +1 vers les coordonnées croissantes
+SENS = (1, -1, 1, -1)
+
+
+class ProfilVehicule:
+    """Paramètres cinématiques partagés par toutes les voitures d'un scénario"""
+    
+    __slots__ = ('vitesse_max', 'acceleration', 'deceleration', 'distance_securite', 'logger')
+    
+    def __init__(self, logger, scenario_config, facteur_pas=1.0):
+        """
+        Initialise le profil
+        
+        Args:
+            logger (Logger): Instance du logger
+            scenario_config (dict): Configuration du scénario actuel (valeurs
+                par tick de PAS_DEFAUT)
+            facteur_pas (float): Pas de l'horloge / PAS_DEFAUT; les valeurs sont
+                converties pour un tick de cette durée (même mouvement par seconde)
+        """
+        # Pixels par tick: proportionnels au pas; variations par tick: au carré du pas
+        self.vitesse_max = scenario_config['vitesse_normale'] * facteur_pas
+        self.acceleration = scenario_config['acceleration'] * facteur_pas * facteur_pas
+        self.deceleration = scenario_config['deceleration'] * facteur_pas * facteur_pas
+        self.distance_securite = scenario_config.get('distance_securite', 50)
+        self.logger = logger
+    
+    def __repr__(self):
+        """Représentation pour debug"""
+        return (f"ProfilVehicule(vmax={self.vitesse_max}, acc={self.acceleration}, "
+                f"dec={self.deceleration}, securite={self.distance_securite})")
 
 
 class Vehicle:
-    """Représentation et animation d'un véhicule intelligent"""
+    """Représentation et comportement d'un véhicule intelligent"""
+    
+    # Pas de __dict__: seul l'état propre à chaque voiture est stocké
+    __slots__ = ('id', 'x', 'y', 'code_direction', 'vitesse', 'profil',
+                 'voie', 'rang_voie', 'indice_moteur', 'actif', 'arretee',
+                 'detection_active', 'en_danger', 'image_path')
     
     # Compteur de classe pour générer des IDs uniques
     compteur_id = 0
     
-    # Dictionnaire des images enregistrées (CORRIGÉ: doit être un dict, pas un set)
-    images_enregistrees = {}
-    
-    # Liste des images disponibles
-    images_disponibles = [
-        "v2.gif"
-    ]
-    
-    def __init__(self, x, y, direction, logger, scenario_config, image_path=None):
+    def __init__(self, x, y, direction, logger, scenario_config, image_path=None, profil=None):
         """
         Initialise un véhicule
         
         Args:
             x (float): Position X initiale
             y (float): Position Y initiale
-            direction (str): 'nord', 'sud', 'est', 'ouest'
+            direction (str): 'nord', 'sud', 'est', 'ouest' (ou code EST, OUEST, ...)
             logger (Logger): Instance du logger
             scenario_config (dict): Configuration du scénario actuel
             image_path (str): Chemin vers l'image du véhicule (optionnel)
+            profil (ProfilVehicule, optional): Paramètres partagés du scénario
+                (créés à partir de logger et scenario_config si absents)
         """
         # ID unique pour chaque voiture
         Vehicle.compteur_id += 1
@@ -42,120 +86,75 @@ class Vehicle:
         # Position et direction
         self.x = x
         self.y = y
-        self.direction = direction
+        self.code_direction = direction if isinstance(direction, int) else CODES_DIRECTION[direction]
         
-        # Vitesse et accélération
-        self.vitesse = scenario_config['vitesse_normale']
-        self.vitesse_max = scenario_config['vitesse_normale']
-        self.acceleration = scenario_config['acceleration']
-        self.deceleration = scenario_config['deceleration']
+        # Vitesse, accélération et logger (partagés entre les voitures du scénario)
+        self.profil = profil if profil is not None else ProfilVehicule(logger, scenario_config)
+        self.vitesse = self.profil.vitesse_max
         
-        # Logger pour journalisation
-        self.logger = logger
+        # Voie et rang dans la voie (tenus à jour par VehicleManager)
+        self.voie = None
+        self.rang_voie = 0
+        
+        # Indice dans le moteur vectoriel (None si la voiture n'y est pas chargée)
+        self.indice_moteur = None
         
         # État
         self.actif = True
         self.arretee = False
         
         # Paramètres de sécurité
-        self.distance_securite = scenario_config.get('distance_securite', 50)
         self.detection_active = True
         self.en_danger = False
         
-        # Création du turtle pour la voiture
-        self.turtle = turtle.Turtle()
-        self.turtle.penup()
-        
-        # Charger l'image ou utiliser une forme par défaut
+        # Image demandée pour l'affichage (utilisée par le rendu, optionnelle)
         self.image_path = image_path
         
-        # Si aucun chemin fourni, choisir une image aléatoire
-        if image_path is None:
-            image_path = random.choice(Vehicle.images_disponibles)
-        
-        # Charger l'image
-        if self._charger_image(image_path):
-            print(f"✅ Image utilisée: {image_path}")
-        else:
-            # Forme rectangulaire par défaut si échec
-            self.turtle.shape("square")
-            self.turtle.shapesize(0.8, 1.5)
-            self.turtle.color(self._couleur_aleatoire())
-            print(f"⚠️ Utilisation de la forme par défaut pour voiture #{self.id}")
-        
-        self.turtle.goto(x, y)
-        
-        # Orientation selon la direction (4 directions)
-        if direction == 'est':  # Vient de l'ouest, va vers l'est
-            self.turtle.setheading(0)  # Vers la droite
-        elif direction == 'ouest':  # Vient de l'est, va vers l'ouest
-            self.turtle.setheading(180)  # Vers la gauche
-        elif direction == 'nord':  # Vient du sud, va vers le nord
-            self.turtle.setheading(90)  # Vers le haut
-        elif direction == 'sud':  # Vient du nord, va vers le bas
-            self.turtle.setheading(270)  # Vers le bas
-        
-        print(f"🚗 Voiture #{self.id} créée à ({x}, {y}) - Direction: {direction}")
+        # Une création par spawn: ne formater le message que s'il est affiché
+        if self.profil.logger.est_actif(NIVEAU_DEBUG):
+            self.profil.logger.debug(f"🚗 Voiture #{self.id} créée à ({x}, {y}) - Direction: {self.direction}")
     
-    def _charger_image(self, image_path):
-        """
-        Charge une image pour représenter le véhicule
-        
-        Args:
-            image_path (str): Chemin vers l'image (GIF)
-            
-        Returns:
-            bool: True si l'image a été chargée, False sinon
-        """
-        try:
-            # Si le chemin n'existe pas, essayer dans différents dossiers
-            chemins_possibles = [
-                image_path,                          # Chemin direct
-                os.path.join('images', image_path),  # Dans dossier images/
-                os.path.join('..', 'images', image_path),  # Un niveau au-dessus
-                os.path.join('.', image_path),       # Dossier courant
-            ]
-            
-            # Chercher le fichier
-            chemin_trouve = None
-            for chemin in chemins_possibles:
-                if os.path.exists(chemin):
-                    chemin_trouve = chemin
-                    break
-            
-            if chemin_trouve is None:
-                print(f"⚠️ Image non trouvée: {image_path}")
-                print(f"   Chemins testés: {chemins_possibles}")
-                return False
-            
-            # Enregistrer la forme dans Turtle si pas déjà fait
-            if chemin_trouve not in Vehicle.images_enregistrees:
-                screen = turtle.Screen()
-                screen.register_shape(chemin_trouve)
-                Vehicle.images_enregistrees[chemin_trouve] = True
-                print(f"📝 Image enregistrée: {chemin_trouve}")
-            
-            # Appliquer la forme
-            self.turtle.shape(chemin_trouve)
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erreur lors du chargement de l'image: {e}")
-            return False
+    # ========== ACCÈS AUX PARAMÈTRES ==========
+    
+    @property
+    def direction(self):
+        """Nom de la direction ('est', 'ouest', 'nord', 'sud')"""
+        return DIRECTIONS[self.code_direction]
+    
+    @property
+    def vitesse_max(self):
+        """Vitesse maximale du scénario"""
+        return self.profil.vitesse_max
+    
+    @property
+    def acceleration(self):
+        """Accélération du scénario"""
+        return self.profil.acceleration
+    
+    @property
+    def deceleration(self):
+        """Décélération du scénario"""
+        return self.profil.deceleration
     
-    def _couleur_aleatoire(self):
+    @property
+    def distance_securite(self):
+        """Distance de sécurité du scénario"""
+        return self.profil.distance_securite
+    
+    @property
+    def logger(self):
+        """Logger partagé"""
+        return self.profil.logger
+    
+    def progression(self):
         """
-        Génère une couleur aléatoire pour la voiture
+        Position le long du sens de circulation
         
         Returns:
-            str: Nom de la couleur
+            float: Plus grande pour les voitures les plus avancées
         """
-        couleurs = [
-            'blue', 'purple', 'brown', 'pink', 
-            'cyan', 'magenta', 'navy', 'teal',
-            'maroon', 'olive', 'coral', 'tomato'
-        ]
-        return random.choice(couleurs)
+        code = self.code_direction
+        return SENS[code] * (self.x if HORIZONTALES[code] else self.y)
     
     def detecter_danger(self, autres_voitures, feux_tricolores=None):
         """
@@ -179,7 +178,7 @@ class Vehicle:
         for autre in autres_voitures:
             if autre.id != self.id and autre.actif:
                 # Vérifier si la voiture est dans la même direction
-                if autre.direction == self.direction:
+                if autre.code_direction == self.code_direction:
                     distance = self._calculer_distance(autre)
                     
                     # Mettre à jour la distance minimale
@@ -188,7 +187,7 @@ class Vehicle:
                         dangers['voiture_proche'] = autre
                     
                     # Vérifier si collision imminente
-                    if distance < self.distance_securite:
+                    if distance < self.profil.distance_securite:
                         # Vérifier si l'autre voiture est devant nous
                         if self._est_devant(autre):
                             dangers['collision_imminente'] = True
@@ -226,15 +225,7 @@ class Vehicle:
         Returns:
             bool: True si l'autre voiture est devant
         """
-        if self.direction == 'est':
-            return autre_voiture.x > self.x
-        elif self.direction == 'ouest':
-            return autre_voiture.x < self.x
-        elif self.direction == 'nord':
-            return autre_voiture.y > self.y
-        elif self.direction == 'sud':
-            return autre_voiture.y < self.y
-        return False
+        return autre_voiture.progression() > self.progression()
     
     def _detecter_feu_rouge(self, feu):
         """
@@ -251,16 +242,11 @@ class Vehicle:
             if hasattr(feu, 'etat') and feu.etat == 'rouge':
                 # Vérifier si on approche du feu
                 if hasattr(feu, 'x') and hasattr(feu, 'y'):
-                    distance_x = abs(self.x - feu.x)
-                    distance_y = abs(self.y - feu.y)
+                    code = self.code_direction
+                    position_feu = feu.x if HORIZONTALES[code] else feu.y
+                    distance = SENS[code] * position_feu - self.progression()
                     
-                    if self.direction == 'est' and self.x < feu.x and distance_x < self.distance_securite:
-                        return True
-                    elif self.direction == 'ouest' and self.x > feu.x and distance_x < self.distance_securite:
-                        return True
-                    elif self.direction == 'nord' and self.y < feu.y and distance_y < self.distance_securite:
-                        return True
-                    elif self.direction == 'sud' and self.y > feu.y and distance_y < self.distance_securite:
+                    if 0 < distance < self.profil.distance_securite:
                         return True
         except:
             pass
@@ -279,61 +265,57 @@ class Vehicle:
             if not self.en_danger:
                 self.en_danger = True
                 if dangers['collision_imminente']:
-                    print(f"⚠️ Voiture #{self.id} détecte un danger - Distance: {dangers['distance_min']:.1f}px")
+                    self.logger.debug(f"⚠️ Voiture #{self.id} détecte un danger - Distance: {dangers['distance_min']:.1f}px")
                 if dangers['feu_rouge']:
-                    print(f"🚦 Voiture #{self.id} s'arrête au feu rouge")
+                    self.logger.debug(f"🚦 Voiture #{self.id} s'arrête au feu rouge")
             self.arreter()
         else:
             # Aucun danger, peut rouler
             if self.en_danger:
                 self.en_danger = False
-                print(f"✅ Voiture #{self.id} reprend sa route")
+                self.logger.debug(f"✅ Voiture #{self.id} reprend sa route")
             self.demarrer()
     
     def avancer(self):
         """Fait avancer la voiture selon sa vitesse et direction"""
         if self.vitesse > 0:
-            if self.direction == 'est':
-                self.x += self.vitesse
-                self.turtle.goto(self.x, self.y)
-            elif self.direction == 'ouest':
-                self.x -= self.vitesse
-                self.turtle.goto(self.x, self.y)
-            elif self.direction == 'nord':
-                self.y += self.vitesse
-                self.turtle.goto(self.x, self.y)
-            elif self.direction == 'sud':
-                self.y -= self.vitesse
-                self.turtle.goto(self.x, self.y)
+            code = self.code_direction
+            if HORIZONTALES[code]:
+                self.x += SENS[code] * self.vitesse
+            else:
+                self.y += SENS[code] * self.vitesse
     
     def arreter(self):
         """Arrête progressivement la voiture (freinage)"""
         if self.vitesse > 0:
-            self.vitesse = max(0, self.vitesse - self.deceleration)
+            self.vitesse = max(0, self.vitesse - self.profil.deceleration)
             
             # Journaliser seulement quand la voiture s'arrête complètement
             if self.vitesse == 0 and not self.arretee:
                 self.arretee = True
-                self.logger.log_arret_voiture(
+                self.profil.logger.log_arret_voiture(
                     self.id,
                     self.x,
-                    self.y
+                    self.y,
+                    direction=self.direction
                 )
     
     def demarrer(self):
         """Redémarre progressivement la voiture (accélération)"""
-        if self.vitesse < self.vitesse_max:
+        profil = self.profil
+        if self.vitesse < profil.vitesse_max:
             # Journaliser au premier démarrage
             if self.vitesse == 0:
-                self.logger.log_demarrage_voiture(
+                profil.logger.log_demarrage_voiture(
                     self.id,
                     self.x,
                     self.y,
-                    self.vitesse
+                    self.vitesse,
+                    direction=self.direction
                 )
                 self.arretee = False
             
-            self.vitesse = min(self.vitesse_max, self.vitesse + self.acceleration)
+            self.vitesse = min(profil.vitesse_max, self.vitesse + profil.acceleration)
     
     def ralentir(self):
         """Ralentit la voiture (feu orange)"""
@@ -351,14 +333,8 @@ class Vehicle:
         Returns:
             bool: True si la voiture est dans la zone avant le feu
         """
-        if self.direction == 'est':
-            return self.x < position_feu and self.x > position_feu - marge
-        elif self.direction == 'ouest':
-            return self.x > position_feu and self.x < position_feu + marge
-        elif self.direction == 'nord':
-            return self.y < position_feu and self.y > position_feu - marge
-        elif self.direction == 'sud':
-            return self.y > position_feu and self.y < position_feu + marge
+        ligne = SENS[self.code_direction] * position_feu
+        return ligne - marge < self.progression() < ligne
     
     def est_hors_ecran(self, limite=400):
         """
@@ -373,10 +349,10 @@ class Vehicle:
         return abs(self.x) > limite or abs(self.y) > limite
     
     def detruire(self):
-        """Supprime la voiture de l'écran et la désactive"""
-        self.turtle.hideturtle()
+        """Désactive la voiture (le rendu retire son affichage)"""
         self.actif = False
-        print(f"🗑️  Voiture #{self.id} supprimée (hors écran)")
+        if self.logger.est_actif(NIVEAU_DEBUG):
+            self.logger.debug(f"🗑️  Voiture #{self.id} supprimée (hors écran)")
     
     def get_position(self):
         """